@@ -0,0 +1,77 @@
+"""Save/load time and peak memory for 1M-record JSON files under each codec.
+
+Every measurement runs in a fresh process so peak RSS is not inflated by
+earlier runs. "load" parses the whole file and then converts the records;
+"stream" converts them one at a time with json_codec.iter_array, which
+always uses the stdlib decoder.
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared import json_codec
+
+RECORDS = 1_000_000
+
+def make_records(count):
+    return [{"name": f"Person {i}", "phone": f"+1555{i:07d}",
+             "email": f"person{i}@example.com", "address": f"{i} Main Street",
+             "group": ("General", "Family", "Work", "Friends")[i % 4],
+             "created": 1_700_000_000 + i, "modified": 1_700_000_000 + i}
+            for i in range(count)]
+
+def peak_mb():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def measure(codec_name, operation, filename, pretty):
+    codec = json_codec.get_codec(codec_name)
+    if operation == "save":
+        records = make_records(RECORDS)
+        baseline = peak_mb()
+        start = time.perf_counter()
+        with open(filename, "wb") as f:
+            f.write(codec.dumps(records, pretty))
+    else:
+        baseline = peak_mb()
+        start = time.perf_counter()
+        if operation == "load":
+            with open(filename, "rb") as f:
+                records = [tuple(record.values()) for record in codec.loads(f.read())]
+        else:
+            with open(filename, "r", encoding="utf-8") as f:
+                records = [tuple(record.values()) for record in json_codec.iter_array(f)]
+        assert len(records) == RECORDS
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed} {peak_mb() - baseline}")
+
+def run(codec_name, operation, filename, pretty=False):
+    output = subprocess.run(
+        [sys.executable, __file__, codec_name, operation, filename, str(int(pretty))],
+        capture_output=True, text=True, check=True).stdout.split()
+    return float(output[0]), float(output[1])
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{RECORDS:,} records")
+        print(f"{'codec':>8} {'operation':>12} {'time (s)':>9} {'peak (MB)':>10} {'file (MB)':>10}")
+        for codec_name in json_codec.available_codecs():
+            operations = [("save", True), ("save", False), ("load", False)]
+            if codec_name == "json":
+                operations.append(("stream", False))
+            for operation, pretty in operations:
+                filename = os.path.join(directory, f"{codec_name}.json")
+                elapsed, peak = run(codec_name, operation, filename, pretty)
+                label = "save pretty" if pretty else operation
+                size = os.path.getsize(filename) / 1e6
+                print(f"{codec_name:>8} {label:>12} {elapsed:>9.2f} {peak:>10.0f} {size:>10.0f}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4] == "1")
+    else:
+        main()
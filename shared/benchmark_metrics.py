@@ -0,0 +1,50 @@
+"""Per-call cost of metrics.timed() and metrics.measure(), disabled and enabled.
+
+Times a trivial function called directly, through a timed() wrapper and
+inside a measure() block, first with metrics off and then on (without
+cProfile). "overhead" is the extra time per call over the plain call.
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared import metrics
+
+CALLS = 1_000_000
+REPEATS = 5
+
+def work(x):
+    return x + 1
+
+timed_work = metrics.timed("work")(work)
+
+def measured_work(x):
+    with metrics.measure("work"):
+        return work(x)
+
+def nanoseconds_per_call(function):
+    best = min(timeit.repeat(lambda: function(1), number=CALLS, repeat=REPEATS))
+    return best / CALLS * 1e9
+
+def main():
+    print(f"{CALLS:,} calls, best of {REPEATS}")
+    print(f"{'metrics':>8} {'call':>8} {'ns/call':>8} {'overhead (ns)':>14}")
+    for state in ("off", "on"):
+        if state == "on":
+            metrics.enable("benchmark_metrics", profile=False)
+        plain = nanoseconds_per_call(work)
+        for name, function in (("plain", work), ("timed", timed_work),
+                               ("measure", measured_work)):
+            elapsed = nanoseconds_per_call(function)
+            print(f"{state:>8} {name:>8} {elapsed:>8.0f} {elapsed - plain:>14.0f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["PROFILE_DIR"] = directory
+        metrics.finish()
+        with open(os.path.join(directory, "benchmark_metrics.metrics.jsonl")) as f:
+            print("\nSample report line:\n" + f.readline().strip())
+
+if __name__ == "__main__":
+    main()
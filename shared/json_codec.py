@@ -0,0 +1,142 @@
+"""JSON encoding for saved files, using orjson or msgspec when installed.
+
+All codecs read and write UTF-8 bytes and raise ValueError on bad input.
+Output is compact unless pretty-printing is asked for, either per call or
+for every file with the JSON_PRETTY environment variable. JSON_CODEC
+forces a codec by name ("orjson", "msgspec" or "json"); one that isn't
+installed falls back to "json" with a warning.
+"""
+import json
+import os
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+PRETTY = os.environ.get("JSON_PRETTY", "") not in ("", "0")
+# Characters read at a time by iter_array
+CHUNK_SIZE = 1 << 20
+_NOT_SPACE = re.compile(r"[^ \t\r\n]")
+
+class StdlibCodec:
+    name = "json"
+
+    def dumps(self, data, pretty=False):
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode()
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data):
+        return json.loads(data)
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def dumps(self, data, pretty=False):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    def loads(self, data):
+        return orjson.loads(data)  # orjson.JSONDecodeError is a ValueError
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        self.encoder = msgspec.json.Encoder()
+        self.decoder = msgspec.json.Decoder()
+
+    def dumps(self, data, pretty=False):
+        encoded = self.encoder.encode(data)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+
+    def loads(self, data):
+        try:
+            return self.decoder.decode(data)
+        except msgspec.DecodeError as error:
+            raise ValueError(str(error)) from None
+
+def available_codecs():
+    """Names of the codecs that can be used here, fastest first."""
+    names = []
+    if orjson:
+        names.append("orjson")
+    if msgspec:
+        names.append("msgspec")
+    names.append("json")
+    return names
+
+def get_codec(name=None):
+    """The named codec, or the JSON_CODEC one, or the fastest available.
+
+    A JSON_CODEC that isn't installed falls back to the stdlib codec with a
+    warning, so a stale setting doesn't stop the tools from starting.
+    """
+    if not name:
+        name = os.environ.get("JSON_CODEC") or available_codecs()[0]
+        if name not in available_codecs():
+            print(f"Warning: JSON_CODEC '{name}' is not available, using json",
+                  file=sys.stderr)
+            name = "json"
+    if name not in available_codecs():
+        raise ValueError(f"JSON codec '{name}' is not available")
+    return {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": StdlibCodec}[name]()
+
+codec = get_codec()
+
+def dumps(data, pretty=None):
+    return codec.dumps(data, PRETTY if pretty is None else pretty)
+
+def loads(data):
+    return codec.loads(data)
+
+def iter_array(file, chunk_size=CHUNK_SIZE):
+    """Yield the items of a top-level JSON array from a text file one at a time.
+
+    Only the item being decoded and one chunk of text are held in memory, so
+    huge files can be turned into objects without first building a list of
+    every parsed item.
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(chunk_size).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("expected a JSON array")
+    position = 1
+    while True:
+        # Skip whitespace and the comma between items, reading more if needed
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer):
+                break
+            more = file.read(chunk_size)
+            if not more:
+                raise ValueError("unterminated JSON array")
+            buffer, position = more, 0
+        if buffer[position] == "]":
+            return
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                # Only trust the item once the following "," or "]" is in the
+                # buffer; a number like 1.5 may be cut off after the 1
+                follower = _NOT_SPACE.search(buffer, end)
+                if follower and buffer[follower.start()] in ",]":
+                    break
+            except ValueError:
+                pass
+            more = file.read(chunk_size)
+            if not more:
+                item, end = decoder.raw_decode(buffer, position)
+                break
+            buffer = buffer[position:] + more
+            position = 0
+        yield item
+        position = end
@@ -0,0 +1,172 @@
+"""Opt-in timing metrics and profiling for the interactive tools.
+
+Off unless the PROFILE environment variable is set or the tool is started
+with --profile. Once on, functions wrapped with timed() and blocks run
+under measure() keep a latency histogram each, count() keeps counters, and
+the whole session runs under cProfile (PROFILE=metrics skips cProfile and
+its overhead). At exit one JSON line per metric is appended to
+"<app>.metrics.jsonl" and the profile is dumped to "<app>.prof", readable
+with `python -m pstats`; PROFILE_DIR picks the directory (default: the
+current one).
+
+When off, a timed() function costs one extra call and flag check, and
+measure() hands back a shared do-nothing context manager.
+"""
+import atexit
+import contextlib
+import cProfile
+import functools
+import os
+import sys
+import time
+
+from shared import json_codec
+
+ENV_VAR = "PROFILE"
+FLAG = "--profile"
+
+enabled = False
+_app = None
+_started = None
+_profiler = None
+_histograms = {}
+_counters = {}
+_NOT_MEASURED = contextlib.nullcontext()
+
+class Histogram:
+    """Latencies counted in power-of-two microsecond buckets."""
+    __slots__ = ("count", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.buckets = {}  # Bucket b holds latencies under 2**b microseconds
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        bucket = int(seconds * 1_000_000).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        """Upper bound in seconds of the bucket holding that fraction of samples."""
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= fraction * self.count:
+                return min((1 << bucket) / 1_000_000, self.maximum)
+        return self.maximum
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 4),
+            "mean_ms": round(self.total / self.count * 1000, 4),
+            "min_ms": round(self.minimum * 1000, 4),
+            "max_ms": round(self.maximum * 1000, 4),
+            "p50_ms": round(self.percentile(0.5) * 1000, 4),
+            "p95_ms": round(self.percentile(0.95) * 1000, 4),
+            "p99_ms": round(self.percentile(0.99) * 1000, 4),
+            "buckets_us": {str(1 << bucket): count
+                           for bucket, count in sorted(self.buckets.items())},
+        }
+
+def setup(app, argv=None):
+    """Turn metrics on for app if PROFILE is set or --profile is in argv.
+
+    The flag is removed from argv (sys.argv by default) so the tool's own
+    argument handling never sees it.
+    """
+    argv = sys.argv if argv is None else argv
+    flagged = FLAG in argv
+    while FLAG in argv:
+        argv.remove(FLAG)
+    setting = os.environ.get(ENV_VAR, "")
+    if flagged or setting not in ("", "0"):
+        enable(app, profile=setting != "metrics")
+
+def enable(app, profile=True):
+    global enabled, _app, _started, _profiler
+    if enabled:
+        return
+    enabled = True
+    _app = app
+    _started = time.time()
+    if profile:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    atexit.register(write_report)
+
+def record(name, seconds):
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = Histogram()
+    histogram.add(seconds)
+
+def count(name, amount=1):
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + amount
+
+def timed(name):
+    """Decorator recording each call's duration under name while enabled."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self.start)
+
+def measure(name):
+    """Context manager recording the duration of its block under name while enabled."""
+    return _Timer(name) if enabled else _NOT_MEASURED
+
+def finish():
+    """Stop recording and write the report now rather than at exit."""
+    global enabled
+    if enabled:
+        enabled = False
+        atexit.unregister(write_report)
+        write_report()
+
+def write_report():
+    """Append this session's metrics as JSON lines and dump the profile."""
+    directory = os.environ.get("PROFILE_DIR") or "."
+    session = {"app": _app, "pid": os.getpid(), "started": round(_started, 3),
+               "seconds": round(time.time() - _started, 3)}
+    lines = [{**session, "metric": name, "type": "timer", **histogram.to_dict()}
+             for name, histogram in sorted(_histograms.items())]
+    lines += [{**session, "metric": name, "type": "counter", "count": total}
+              for name, total in sorted(_counters.items())]
+    metrics_file = os.path.join(directory, f"{_app}.metrics.jsonl")
+    # One write per session so concurrent sessions append whole lines
+    with open(metrics_file, "ab") as f:
+        f.write(b"".join(json_codec.dumps(line, pretty=False) + b"\n" for line in lines))
+    message = f"Metrics appended to {metrics_file}"
+    if _profiler:
+        _profiler.disable()
+        profile_file = os.path.join(directory, f"{_app}.prof")
+        _profiler.dump_stats(profile_file)
+        message += f", profile written to {profile_file}"
+    print(message, file=sys.stderr)
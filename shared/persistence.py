@@ -0,0 +1,208 @@
+"""Crash-safe JSON files shared by the to-do list, contact book and RPS game.
+
+Every write goes to a temporary file in the same directory, is fsynced and
+then renamed over the target, so a crash leaves either the old or the new
+file, never a truncated one. Writers take an advisory lock on a
+"<file>.lock" sidecar so several processes never interleave their saves.
+"""
+import atexit
+import contextlib
+import os
+import threading
+import time
+
+from shared import json_codec, metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Locks each thread of this process already holds, so nested saves don't deadlock
+_held_locks = {}
+
+def _acquire(lock_file):
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    else:
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:  # LK_LOCK gives up after ~10 seconds; keep waiting
+                pass
+
+def _release(lock_file):
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+@contextlib.contextmanager
+def file_lock(filename):
+    """Hold an exclusive advisory lock for filename across processes."""
+    path = os.path.abspath(filename) + ".lock"
+    key = (path, threading.get_ident())
+    if key in _held_locks:
+        yield
+        return
+    lock_file = open(path, "a+")
+    try:
+        _acquire(lock_file)
+        _held_locks[key] = lock_file
+        try:
+            yield
+        finally:
+            del _held_locks[key]
+            _release(lock_file)
+    finally:
+        lock_file.close()
+
+def atomic_write(filename, write, mode="w"):
+    """Call write(file) on a temporary file, then atomically replace filename."""
+    directory = os.path.dirname(os.path.abspath(filename))
+    # Unique per process and thread so concurrent writers never share a temp file
+    temp_file = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_file, mode) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, filename)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+    if os.name == "posix":
+        # Make the rename itself durable
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+class JSONFile:
+    """A JSON document saved atomically under a lock.
+
+    Documents are encoded with json_codec: compact unless `pretty` is true
+    (or unset and JSON_PRETTY is set).
+
+    schedule() and schedule_update() mark the file dirty instead of writing
+    straight away; the pending save happens on a background timer once
+    `interval` seconds have passed since the last write, on flush() or
+    close(), or when the interpreter exits. The scheduled function may run
+    on the timer thread, so callers hold `lock` while changing the data it
+    reads. Save timings are kept in `saves`, `save_seconds` and
+    `max_save_seconds`; report() sums them up.
+    """
+
+    def __init__(self, filename, interval=0.0, pretty=None):
+        self.filename = filename
+        self.interval = interval
+        self.pretty = pretty
+        self.pending = None  # (function, merge) for the coalesced save
+        self.timer = None  # Fires the pending save if nothing else does first
+        self.lock = threading.RLock()
+        self.last_write = 0.0
+        self.saves = 0
+        self.save_seconds = 0.0
+        self.max_save_seconds = 0.0
+        self.registered = False
+
+    def load(self, default=None):
+        """Read the document; returns default if it is missing or unreadable."""
+        try:
+            with open(self.filename, "rb") as f:
+                return json_codec.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return default
+
+    def encode(self, data):
+        """The document as bytes, or as an iterable of byte chunks."""
+        return json_codec.dumps(data, self.pretty)
+
+    def _write(self, data):
+        start = time.perf_counter()
+        encoded = self.encode(data)
+        if isinstance(encoded, bytes):
+            atomic_write(self.filename, lambda f: f.write(encoded), mode="wb")
+        else:
+            atomic_write(self.filename, lambda f: f.writelines(encoded), mode="wb")
+        elapsed = time.perf_counter() - start
+        self.last_write = time.monotonic()
+        self.saves += 1
+        self.save_seconds += elapsed
+        self.max_save_seconds = max(self.max_save_seconds, elapsed)
+        if metrics.enabled:
+            metrics.record(f"save {os.path.basename(self.filename)}", elapsed)
+
+    def save(self, data):
+        """Replace the document with data now."""
+        with self.lock, file_lock(self.filename):
+            self.pending = None
+            self._write(data)
+
+    def update(self, function, default=None):
+        """Replace the document with function(current document) under one lock.
+
+        Use this when other processes may have saved since this one loaded,
+        so their changes are merged rather than overwritten.
+        """
+        with self.lock, file_lock(self.filename):
+            self.pending = None
+            data = function(self.load(default))
+            self._write(data)
+        return data
+
+    def schedule(self, producer):
+        """Save producer() soon, coalescing rapid successive saves into one."""
+        self._schedule(producer, False)
+
+    def schedule_update(self, function):
+        """Like update(), but coalesced the same way as schedule()."""
+        self._schedule(function, True)
+
+    def _schedule(self, function, merge):
+        with self.lock:
+            self.pending = (function, merge)
+            if not self.registered:
+                atexit.register(self.flush)
+                self.registered = True
+            wait = self.interval - (time.monotonic() - self.last_write)
+            if wait <= 0:
+                self.flush()
+            elif self.timer is None:
+                self.timer = threading.Timer(wait, self._flush_on_timer)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def _flush_on_timer(self):
+        with self.lock:
+            if self.timer is threading.current_thread():
+                self.timer = None
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if self.pending:
+                function, merge = self.pending
+                if merge:
+                    self.update(function)
+                else:
+                    self.save(function())
+
+    def close(self):
+        self.flush()
+
+    def report(self):
+        """One-line summary of save latency."""
+        if not self.saves:
+            return f"{self.filename}: no saves"
+        return (f"{self.filename}: {self.saves} saves, "
+                f"avg {self.save_seconds / self.saves * 1000:.2f} ms, "
+                f"max {self.max_save_seconds * 1000:.2f} ms")
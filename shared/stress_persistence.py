@@ -0,0 +1,96 @@
+"""Hammer one JSON file from several processes, in place vs. through JSONFile.
+
+Each writer process increments a shared counter UPDATES times while a
+reader keeps parsing the file. Writing in place loses increments and lets
+the reader see half-written files; JSONFile should do neither.
+"""
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.persistence import JSONFile
+
+WRITERS = 6
+UPDATES = 200
+# Padding so each write takes long enough to be caught half-done
+PAYLOAD = "x" * 200_000
+SCHEDULED_SAVES = 10_000
+
+def increment(data):
+    data = data or {"count": 0}
+    return {"count": data["count"] + 1, "payload": PAYLOAD}
+
+def in_place_writer(filename):
+    for _ in range(UPDATES):
+        try:
+            with open(filename) as f:
+                data = json.load(f)
+        except ValueError:
+            data = None
+        with open(filename, "w") as f:
+            json.dump(increment(data), f)
+    return ""
+
+def json_file_writer(filename):
+    store = JSONFile(filename)
+    for _ in range(UPDATES):
+        store.update(increment)
+    return store.report()
+
+def reader(filename, stop, torn):
+    while not stop.is_set():
+        try:
+            with open(filename) as f:
+                json.load(f)
+        except ValueError:
+            torn.value += 1
+
+def run(writer, filename):
+    with open(filename, "w") as f:
+        json.dump({"count": 0}, f)
+    stop = multiprocessing.Event()
+    torn = multiprocessing.Value("i", 0)
+    watcher = multiprocessing.Process(target=reader, args=(filename, stop, torn))
+    watcher.start()
+    start = time.perf_counter()
+    with multiprocessing.Pool(WRITERS) as pool:
+        reports = pool.map(writer, [filename] * WRITERS)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    watcher.join()
+    with open(filename) as f:
+        count = json.load(f)["count"]
+    return count, torn.value, elapsed, reports
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "stress.json")
+        expected = WRITERS * UPDATES
+        print(f"{WRITERS} writers x {UPDATES} updates = {expected} increments")
+        print(f"{'method':>10} {'count':>7} {'lost':>6} {'torn reads':>11} {'time (s)':>9}")
+        for name, writer in (("in place", in_place_writer), ("JSONFile", json_file_writer)):
+            count, torn, elapsed, reports = run(writer, filename)
+            print(f"{name:>10} {count:>7} {expected - count:>6} {torn:>11} {elapsed:>9.2f}")
+        for report in reports:
+            print("  " + report.replace(filename, "writer"))
+        assert count == expected and torn == 0, "JSONFile lost updates or exposed a torn file"
+        assert not glob.glob(filename + ".*.tmp"), "temporary files left behind"
+
+        # Rapid successive saves are coalesced into a handful of writes
+        store = JSONFile(filename, interval=0.05)
+        start = time.perf_counter()
+        for i in range(SCHEDULED_SAVES):
+            store.schedule(lambda: {"count": i, "payload": PAYLOAD})
+        store.close()
+        elapsed = time.perf_counter() - start
+        with open(filename) as f:
+            assert json.load(f)["count"] == SCHEDULED_SAVES - 1
+        print(f"{SCHEDULED_SAVES} scheduled saves -> {store.saves} writes in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compare per-operation latency of full rewrites against the journal."""
+import os
+import tempfile
+import time
+
+import task1
+from task_model import TaskList
+
+SIZES = [1_000, 100_000, 1_000_000]
+OPERATIONS = 10
+
+def make_tasks(count):
+    return TaskList({"name": f"Task {i}", "completed": i % 2 == 0, "created": 0} for i in range(count))
+
+def time_full_rewrite(todo_list):
+    start = time.perf_counter()
+    for task_id in range(1, OPERATIONS + 1):
+        todo_list.update(task_id, completed=not todo_list.get(task_id)["completed"])
+        task1.save_tasks(todo_list)
+    return (time.perf_counter() - start) / OPERATIONS
+
+def time_journal(todo_list):
+    start = time.perf_counter()
+    for task_id in range(1, OPERATIONS + 1):
+        task1.log_operation(todo_list, op="set", id=task_id,
+                            completed=not todo_list.get(task_id)["completed"])
+    return (time.perf_counter() - start) / OPERATIONS
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        task1.TASKS_FILE = os.path.join(directory, "tasks.json")
+        task1.JOURNAL_FILE = os.path.join(directory, "tasks.journal")
+        print(f"{'tasks':>10} {'rewrite (ms/op)':>16} {'journal (ms/op)':>16}")
+        for size in SIZES:
+            todo_list = make_tasks(size)
+            task1.save_tasks(todo_list)
+            rewrite = time_full_rewrite(todo_list)
+            journal = time_journal(todo_list)
+            # Replaying the snapshot plus journal must give the same list
+            assert list(task1.load_tasks()) == list(todo_list)
+            print(f"{size:>10} {rewrite * 1000:>16.3f} {journal * 1000:>16.3f}")
+
+if __name__ == "__main__":
+    main()
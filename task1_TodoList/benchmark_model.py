@@ -0,0 +1,65 @@
+"""Compare the indexed TaskList against scanning a plain list of task dicts."""
+import bisect
+import random
+import time
+
+from task_model import TaskList
+
+SIZES = [100_000, 1_000_000]
+DELETES = 1_000
+QUERIES = 20
+TODAY = "2026-01-08"
+TAGS = ["work", "home", "errands", "study", "health"]
+
+def make_tasks(count):
+    rng = random.Random(count)
+    return [{"name": f"Task {i}", "completed": i % 3 == 0, "created": 0,
+             "priority": rng.choice(("high", "medium", "low")),
+             "due": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if i % 4 == 0 else None,
+             "tags": [rng.choice(TAGS)] if i % 10 == 0 else []}
+            for i in range(count)]
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    print(f"{'tasks':>10} {'operation':>14} {'list (ms)':>10} {'TaskList (ms)':>14}")
+    for size in SIZES:
+        tasks = make_tasks(size)
+        plain = [dict(task, id=i + 1) for i, task in enumerate(tasks)]
+        indexed = TaskList(tasks)
+        rng = random.Random(0)
+
+        # Delete tasks from the middle: list.pop shifts everything after them
+        victims = rng.sample(range(1, size // 2), DELETES)
+        start = time.perf_counter()
+        for task_id in victims:
+            plain.pop(bisect.bisect_left(plain, task_id, key=lambda task: task["id"]))
+        list_delete = (time.perf_counter() - start) / DELETES * 1000
+        start = time.perf_counter()
+        for task_id in victims:
+            indexed.delete(task_id)
+        model_delete = (time.perf_counter() - start) / DELETES * 1000
+        print(f"{size:>10} {'delete':>14} {list_delete:>10.4f} {model_delete:>14.4f}")
+
+        position = size // 3
+        row = (timed(lambda: plain[position]["id"], QUERIES),
+               timed(lambda: indexed.id_at(position), QUERIES))
+        print(f"{size:>10} {'id at position':>14} {row[0]:>10.4f} {row[1]:>14.4f}")
+
+        overdue = (timed(lambda: [t for t in plain if t["due"] and t["due"] < TODAY and not t["completed"]], QUERIES),
+                   timed(lambda: indexed.overdue(TODAY), QUERIES))
+        assert [t["id"] for t in indexed.overdue(TODAY)] == [
+            t["id"] for t in sorted(plain, key=lambda t: (t["due"] or "", t["id"]))
+            if t["due"] and t["due"] < TODAY and not t["completed"]]
+        print(f"{size:>10} {'overdue':>14} {overdue[0]:>10.2f} {overdue[1]:>14.2f}")
+
+        by_tag = (timed(lambda: [t for t in plain if "work" in t["tags"]], QUERIES),
+                  timed(lambda: indexed.with_tag("work"), QUERIES))
+        print(f"{size:>10} {'by tag':>14} {by_tag[0]:>10.2f} {by_tag[1]:>14.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,181 @@
-import json
+import datetime
 import os
+import sys
+
+from task_model import DEFAULT_PRIORITY, PRIORITIES, TaskList
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared import json_codec, metrics
+from shared.persistence import atomic_write, file_lock
 
 # File to save tasks
 TASKS_FILE = "tasks.json"
+# Append-only log of operations made since the last snapshot
+JOURNAL_FILE = "tasks.journal"
+# Fold the journal back into the snapshot after this many operations
+COMPACT_THRESHOLD = 1000
+
+_journal_entries = 0
+# Bytes of the journal this process has applied, and the snapshot they follow
+_journal_offset = 0
+_snapshot = None
 
-def load_tasks():
-    """Load tasks from the file if it exists."""
-    if os.path.exists(TASKS_FILE):
-        with open(TASKS_FILE, "r") as file:
-            return json.load(file)
-    return []
+def apply_operation(todo_list, entry):
+    """Apply a single journal entry to the in-memory task list and return the task."""
+    fields = dict(entry)
+    op = fields.pop("op")
+    if "index" in fields:
+        # Journals written before tasks had IDs address them by position
+        fields["id"] = todo_list.id_at(fields.pop("index"))
+    if op == "add":
+        if fields.get("id", todo_list.next_id) < todo_list.next_id:
+            # Another copy already used this ID, even if that task has since
+            # been deleted; IDs are never reused, so take the next free one
+            del fields["id"]
+        return todo_list.add(**fields)
+    elif op == "set":
+        return todo_list.update(fields.pop("id"), **fields)
+    elif op == "delete":
+        return todo_list.delete(fields["id"])
+
+def _snapshot_stamp():
+    """Identifies the current tasks.json, which is replaced on every compaction."""
+    try:
+        stat = os.stat(TASKS_FILE)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+@metrics.timed("load")
+def load_tasks(todo_list=None):
+    """Load the task snapshot and replay the journal on top of it.
+
+    Pass todo_list to reload it in place.
+    """
+    global _journal_entries, _journal_offset, _snapshot
+    if todo_list is None:
+        todo_list = TaskList()
+    # Locked so another process can't compact between the two reads
+    with file_lock(TASKS_FILE):
+        tasks = ()
+        if os.path.exists(TASKS_FILE):
+            with open(TASKS_FILE, "rb") as file:
+                tasks = json_codec.loads(file.read())
+        todo_list.reset(tasks)
+        _snapshot = _snapshot_stamp()
+        _journal_entries = 0
+        _journal_offset = 0
+        _replay_journal(todo_list)
+    return todo_list
+
+def _replay_journal(todo_list):
+    """Apply journal lines this process hasn't seen yet; the caller holds the file lock."""
+    global _journal_entries, _journal_offset
+    try:
+        file = open(JOURNAL_FILE, "r+b")
+    except FileNotFoundError:
+        return
+    with file:
+        file.seek(_journal_offset)
+        data = file.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            # Torn write from a crash: cut it off so the next append starts
+            # on a line of its own instead of being glued to the fragment
+            file.truncate(_journal_offset + complete)
+    _journal_offset += complete
+    for line in data[:complete].splitlines():
+        try:
+            entry = json_codec.loads(line)
+        except ValueError:
+            continue  # A damaged line in the middle; keep the ones after it
+        try:
+            apply_operation(todo_list, entry)
+        except (KeyError, IndexError, ValueError):
+            continue  # Written by an old version for a task that was already gone
+        _journal_entries += 1
 
+def sync_tasks(todo_list):
+    """Catch up with what other running copies saved; the caller holds the file lock."""
+    if _snapshot_stamp() != _snapshot:
+        load_tasks(todo_list)  # Another copy compacted, so start from its snapshot
+    else:
+        _replay_journal(todo_list)
+
+def refresh_tasks(todo_list):
+    """Pick up tasks changed by other running copies (e.g. the GUI)."""
+    with file_lock(TASKS_FILE):
+        sync_tasks(todo_list)
+
+@metrics.timed("save")
 def save_tasks(todo_list):
-    """Save tasks to the file."""
-    with open(TASKS_FILE, "w") as file:
-        json.dump(todo_list, file)
+    """Write a full snapshot atomically and clear the journal.
+
+    Journal lines appended by other running copies are applied first, so
+    removing the journal never drops their changes.
+    """
+    global _journal_entries, _journal_offset, _snapshot
+    with file_lock(TASKS_FILE):
+        sync_tasks(todo_list)
+        encoded = json_codec.dumps(list(todo_list))
+        atomic_write(TASKS_FILE, lambda file: file.write(encoded), mode="wb")
+        if os.path.exists(JOURNAL_FILE):
+            os.remove(JOURNAL_FILE)
+        _snapshot = _snapshot_stamp()
+    _journal_entries = 0
+    _journal_offset = 0
+
+def compact_tasks(todo_list):
+    """Fold any pending journal entries into a fresh snapshot."""
+    if _journal_entries or os.path.exists(JOURNAL_FILE):
+        save_tasks(todo_list)
+
+@metrics.timed("journal")
+def log_operations(todo_list, entries, saved_ids=None):
+    """Apply operations and append them to the journal in a single write.
+
+    Other running copies' journal lines are replayed first, under the same
+    lock, so new tasks get IDs nobody else has used. Returns the task each
+    operation added, changed or deleted, or None where it no longer applies
+    (e.g. the task was deleted by another copy).
+
+    Callers that pick IDs for new tasks themselves (the GUI) pass a
+    saved_ids dict: an add whose ID was taken meanwhile is saved under a
+    new one, recorded there, and later operations on it are redirected.
+    """
+    global _journal_entries, _journal_offset
+    with file_lock(TASKS_FILE):
+        sync_tasks(todo_list)
+        tasks = []
+        lines = []
+        for entry in entries:
+            if saved_ids and entry["op"] != "add" and entry["id"] in saved_ids:
+                entry = dict(entry, id=saved_ids[entry["id"]])
+            try:
+                task = apply_operation(todo_list, entry)
+            except (KeyError, ValueError):
+                tasks.append(None)
+                continue
+            if entry["op"] == "add":
+                if saved_ids is not None and task["id"] != entry.get("id", task["id"]):
+                    saved_ids[entry["id"]] = task["id"]
+                entry = {"op": "add", **task}  # Record the ID it was given
+            tasks.append(task)
+            # Journal lines are always compact: one operation per line
+            lines.append(json_codec.dumps(entry, pretty=False) + b"\n")
+        if lines:
+            data = b"".join(lines)
+            with open(JOURNAL_FILE, "ab") as file:
+                file.write(data)
+            _journal_offset += len(data)
+            _journal_entries += len(lines)
+        if _journal_entries >= COMPACT_THRESHOLD:
+            save_tasks(todo_list)
+    return tasks
+
+def log_operation(todo_list, **entry):
+    """Apply and journal one operation, compacting when the journal grows too long."""
+    return log_operations(todo_list, [entry])[0]
 
 def show_menu():
     print("\n--- To-Do List Menu ---")
@@ -23,67 +184,106 @@ def show_menu():
     print("3. Mark a Task as Completed")
     print("4. Mark a Task as Not Completed")
     print("5. Delete a Task")
-    print("6. Exit")
+    print("6. Show Overdue Tasks")
+    print("7. Show Tasks by Tag")
+    print("8. Exit")
+
+def format_task(task):
+    status = "Done" if task["completed"] else "Not Done"
+    details = [task["priority"]]
+    if task["due"]:
+        details.append(f"due {task['due']}")
+    if task["tags"]:
+        details.append(", ".join(f"#{tag}" for tag in task["tags"]))
+    return f"{task['id']}. {task['name']} [{status}] ({'; '.join(details)})"
 
-def view_tasks(todo_list):
+@metrics.timed("render")
+def view_tasks(todo_list, title="Your To-Do List"):
     if not todo_list:
-        print("\nYour to-do list is empty!")
+        print("\nNo tasks to show!")
     else:
-        print("\n--- Your To-Do List ---")
-        for index, task in enumerate(todo_list, start=1):
-            status = "Done" if task["completed"] else "Not Done"
-            print(f"{index}. {task['name']} [{status}]")
+        print(f"\n--- {title} ---")
+        for task in todo_list:
+            print(format_task(task))
 
 def add_task(todo_list):
     task_name = input("\nEnter the task: ")
-    todo_list.append({"name": task_name, "completed": False})
-    save_tasks(todo_list)  # Save tasks after adding
-    print(f"Task '{task_name}' added!")
+    priority = input(f"Priority ({'/'.join(PRIORITIES)}, default {DEFAULT_PRIORITY}): ").strip().lower()
+    priority = priority or DEFAULT_PRIORITY
+    if priority not in PRIORITIES:
+        print("Invalid priority.")
+        return
+    due = input("Due date (YYYY-MM-DD, optional): ").strip() or None
+    if due:
+        try:
+            due = datetime.date.fromisoformat(due).isoformat()
+        except ValueError:
+            print("Invalid date.")
+            return
+    tags = [tag.strip() for tag in input("Tags (comma separated, optional): ").split(",") if tag.strip()]
+    task = log_operation(todo_list, op="add", name=task_name, priority=priority,
+                         due=due, tags=tags)  # Save tasks after adding
+    print(f"Task '{task_name}' added with ID {task['id']}!")
 
-def mark_completed(todo_list):
+def get_task(todo_list, action):
+    """Ask for a task ID; returns the task or None."""
     view_tasks(todo_list)
     try:
-        task_number = int(input("\nEnter the task number to mark as completed: "))
-        if 1 <= task_number <= len(todo_list):
-            todo_list[task_number - 1]["completed"] = True
-            save_tasks(todo_list)  # Save tasks after marking
-            print(f"Task '{todo_list[task_number - 1]['name']}' marked as completed!")
-        else:
-            print("Invalid task number.")
+        task_id = int(input(f"\nEnter the task ID to {action}: "))
     except ValueError:
         print("Please enter a valid number.")
+        return None
+    task = todo_list.get(task_id)
+    if task is None:
+        print("Invalid task ID.")
+    return task
+
+def mark_completed(todo_list):
+    task = get_task(todo_list, "mark as completed")
+    if task:
+        if log_operation(todo_list, op="set", id=task["id"], completed=True):
+            print(f"Task '{task['name']}' marked as completed!")
+        else:
+            print("That task was deleted in another window.")
 
 def mark_not_completed(todo_list):
-    view_tasks(todo_list)
-    try:
-        task_number = int(input("\nEnter the task number to mark as not completed: "))
-        if 1 <= task_number <= len(todo_list):
-            todo_list[task_number - 1]["completed"] = False
-            save_tasks(todo_list)  # Save tasks after marking
-            print(f"Task '{todo_list[task_number - 1]['name']}' marked as not completed!")
+    task = get_task(todo_list, "mark as not completed")
+    if task:
+        if log_operation(todo_list, op="set", id=task["id"], completed=False):
+            print(f"Task '{task['name']}' marked as not completed!")
         else:
-            print("Invalid task number.")
-    except ValueError:
-        print("Please enter a valid number.")
+            print("That task was deleted in another window.")
 
 def delete_task(todo_list):
-    view_tasks(todo_list)
-    try:
-        task_number = int(input("\nEnter the task number to delete: "))
-        if 1 <= task_number <= len(todo_list):
-            deleted_task = todo_list.pop(task_number - 1)
-            save_tasks(todo_list)  # Save tasks after deleting
-            print(f"Task '{deleted_task['name']}' deleted!")
+    task = get_task(todo_list, "delete")
+    if task:
+        if log_operation(todo_list, op="delete", id=task["id"]):
+            print(f"Task '{task['name']}' deleted!")
         else:
-            print("Invalid task number.")
-    except ValueError:
-        print("Please enter a valid number.")
+            print("That task was already deleted in another window.")
+
+def show_overdue(todo_list):
+    with metrics.measure("search"):
+        tasks = todo_list.overdue()
+    view_tasks(tasks, "Overdue Tasks")
+
+def show_by_tag(todo_list):
+    if not todo_list.by_tag:
+        print("\nNo tags yet.")
+        return
+    print("\nTags: " + ", ".join(sorted(todo_list.by_tag)))
+    tag = input("Enter a tag: ").strip().lstrip("#")
+    with metrics.measure("search"):
+        tasks = todo_list.with_tag(tag)
+    view_tasks(tasks, f"Tasks tagged #{tag}")
 
 def main():
+    metrics.setup("task1")  # PROFILE=1 or --profile to record timings
     todo_list = load_tasks()  # Load tasks from file at startup
     while True:
         show_menu()
-        choice = input("\nEnter your choice (1-6): ")
+        choice = input("\nEnter your choice (1-8): ")
+        refresh_tasks(todo_list)  # Show changes made in the GUI meanwhile
         if choice == "1":
             view_tasks(todo_list)
         elif choice == "2":
@@ -95,6 +295,11 @@ def main():
         elif choice == "5":
             delete_task(todo_list)
         elif choice == "6":
+            show_overdue(todo_list)
+        elif choice == "7":
+            show_by_tag(todo_list)
+        elif choice == "8":
+            compact_tasks(todo_list)  # Compact the journal on exit
             print("\nExiting the application. Goodbye!")
             break
         else:
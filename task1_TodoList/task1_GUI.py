@@ -1,37 +1,336 @@
+import bisect
+import queue
+import threading
+import time
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox
 
-def add_task():
-    task = entry.get()
-    if task:
-        listbox.insert(tk.END, task)
-        entry.delete(0, tk.END)
-    else:
-        messagebox.showwarning("Warning", "Please enter a task.")
+import task1
+from shared import metrics  # task1 puts shared/ on sys.path
 
-def delete_task():
-    try:
-        selected_task = listbox.curselection()
-        listbox.delete(selected_task)
-    except:
-        messagebox.showwarning("Warning", "Please select a task to delete.")
+# Wait for this many seconds without changes before writing to disk...
+SAVE_DELAY = 0.5
+# ...but never hold back pending changes for longer than this
+MAX_SAVE_DELAY = 2.0
+# Seconds between attempts to save changes after a failed save
+RETRY_DELAY = 5.0
+# Milliseconds between checks for save errors to show
+ERROR_CHECK_MS = 500
+# Milliseconds to wait after the last keystroke before re-filtering
+FILTER_DELAY_MS = 200
+FILTERS = ("All", "Active", "Completed")
 
-# Create the main window
-root = tk.Tk()
-root.title("To-Do List")
+class TaskWriter:
+    """Background thread that batches task operations into the task1 journal.
 
-# Create and place widgets
-entry = tk.Entry(root, width=40)
-entry.pack(pady=10)
+    A batch that fails to save (e.g. the disk is full) is kept and retried
+    every RETRY_DELAY seconds; the error is put on `errors` for the UI to
+    show, once per run of failures.
+    """
 
-add_button = tk.Button(root, text="Add Task", command=add_task)
-add_button.pack(pady=5)
+    def __init__(self, todo_list):
+        # The writer keeps its own copy so snapshots never race with the UI
+        self.todo_list = todo_list.copy()
+        # UI task ID -> the ID it was saved under, when another running copy
+        # took the UI's choice first (see task1.log_operations)
+        self.saved_ids = {}
+        self.pending = queue.Queue()
+        self.errors = queue.Queue()
+        self.unsaved = []  # Operations of a batch that failed to save
+        self.error = None  # Why they failed
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
 
-delete_button = tk.Button(root, text="Delete Task", command=delete_task)
-delete_button.pack(pady=5)
+    def submit(self, **entry):
+        self.pending.put(entry)
 
-listbox = tk.Listbox(root, width=50)
-listbox.pack(pady=10)
+    def run(self):
+        running = True
+        while running:
+            batch = self.unsaved
+            try:
+                # After a failed save, retry in a while even if nothing new comes
+                batch.append(self.pending.get(timeout=RETRY_DELAY if batch else None))
+            except queue.Empty:
+                pass
+            deadline = time.monotonic() + MAX_SAVE_DELAY
+            while batch[-1] is not None:
+                timeout = min(SAVE_DELAY, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                running = False
+            self.unsaved = batch
+            self.save()
 
-# Run the application
-root.mainloop()
\ No newline at end of file
+    def save(self):
+        """Journal the unsaved operations; returns False (and records the error) on failure."""
+        saved_ids = dict(self.saved_ids)
+        try:
+            if self.error is not None:
+                # A failed attempt may have applied part of the batch in
+                # memory, so start again from what is on disk
+                task1.load_tasks(self.todo_list)
+            if self.unsaved:
+                task1.log_operations(self.todo_list, self.unsaved, self.saved_ids)
+        except Exception as error:  # e.g. OSError; the thread must survive it
+            self.saved_ids = saved_ids
+            if self.error is None:
+                self.errors.put(error)
+            self.error = error
+            return False
+        self.unsaved = []
+        self.error = None
+        return True
+
+    def close(self):
+        """Write everything still pending and fold the journal into tasks.json.
+
+        Returns the error if some changes could not be saved; call finish()
+        to try again.
+        """
+        self.pending.put(None)
+        self.thread.join()
+        return self.finish()
+
+    def finish(self):
+        """Retry any unsaved operations, then compact; returns the error, if any."""
+        if self.error is not None and not self.save():
+            return self.error
+        try:
+            task1.compact_tasks(self.todo_list)
+        except Exception:
+            pass  # Not needed for safety: the journal already holds every change
+        return None
+
+class TodoApp:
+    def __init__(self, root):
+        self.root = root
+        self.todo_list = task1.load_tasks()
+        self.writer = TaskWriter(self.todo_list)
+        # Sorted IDs of the tasks that pass the current filter, or None for all tasks
+        self.view = None
+        self.offset = 0  # View position shown in the first row
+        self.rows = 1
+        self.selected = None  # ID of the selected task
+        self.filter_job = None
+
+        root.title("To-Do List")
+        root.protocol("WM_DELETE_WINDOW", self.close)
+        root.after(ERROR_CHECK_MS, self.check_writer)
+
+        self.entry = tk.Entry(root, width=40)
+        self.entry.pack(pady=10)
+        self.entry.bind("<Return>", lambda event: self.add_task())
+        tk.Button(root, text="Add Task", command=self.add_task).pack(pady=5)
+
+        filter_frame = tk.Frame(root)
+        filter_frame.pack(pady=5)
+        tk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT)
+        self.search = tk.StringVar()
+        self.search.trace_add("write", lambda *args: self.schedule_filter())
+        tk.Entry(filter_frame, textvariable=self.search, width=20).pack(side=tk.LEFT)
+        self.status = tk.StringVar(value="All")
+        for name in FILTERS:
+            tk.Radiobutton(filter_frame, text=name, value=name, variable=self.status,
+                           command=self.apply_filter).pack(side=tk.LEFT)
+
+        list_frame = tk.Frame(root)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.scrollbar = tk.Scrollbar(list_frame, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # The listbox only ever holds the rows that fit on screen
+        self.listbox = tk.Listbox(list_frame, width=50, exportselection=False)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.listbox.bind("<Configure>", self.on_resize)
+        self.listbox.bind("<<ListboxSelect>>", self.on_select)
+        self.listbox.bind("<Double-Button-1>", lambda event: self.toggle_task())
+        self.listbox.bind("<Up>", lambda event: self.move_selection(-1))
+        self.listbox.bind("<Down>", lambda event: self.move_selection(1))
+        self.listbox.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1))
+        self.listbox.bind("<Button-4>", lambda event: self.scroll(-1))
+        self.listbox.bind("<Button-5>", lambda event: self.scroll(1))
+        font = tkfont.Font(font=self.listbox.cget("font"))
+        self.row_height = font.metrics("linespace") + 2 * int(self.listbox.cget("selectborderwidth"))
+        self.padding = 2 * (int(self.listbox.cget("borderwidth")) +
+                            int(self.listbox.cget("highlightthickness")))
+
+        button_frame = tk.Frame(root)
+        button_frame.pack(pady=5)
+        tk.Button(button_frame, text="Toggle Completed", command=self.toggle_task).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Delete Task", command=self.delete_task).pack(side=tk.LEFT, padx=5)
+        self.summary = tk.Label(root)
+        self.summary.pack(pady=5)
+
+    def matcher(self):
+        """Predicate for the current filter, reading the widgets only once."""
+        status = self.status.get()
+        search = self.search.get().lower()
+        def matches(task):
+            if status != "All" and task["completed"] != (status == "Completed"):
+                return False
+            return search in task["name"].lower()
+        return matches
+
+    def apply_filter(self):
+        self.filter_job = None
+        if not self.search.get() and self.status.get() == "All":
+            self.view = None
+        else:
+            matches = self.matcher()
+            with metrics.measure("search"):
+                self.view = [task["id"] for task in self.todo_list if matches(task)]
+        self.offset = 0
+        self.selected = None
+        self.render()
+
+    def schedule_filter(self):
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(FILTER_DELAY_MS, self.apply_filter)
+
+    def view_length(self):
+        return len(self.todo_list) if self.view is None else len(self.view)
+
+    def view_ids(self, start, stop):
+        if self.view is None:
+            return self.todo_list.ids(start, stop)
+        return self.view[start:stop]
+
+    def view_position(self, task_id):
+        if self.view is None:
+            return self.todo_list.position(task_id)
+        return bisect.bisect_left(self.view, task_id)
+
+    @metrics.timed("render")
+    def render(self):
+        """Redraw only the rows currently scrolled into view."""
+        total = self.view_length()
+        self.offset = max(0, min(self.offset, total - self.rows))
+        window = self.view_ids(self.offset, self.offset + self.rows)
+        self.listbox.delete(0, tk.END)
+        for row, task_id in enumerate(window):
+            task = self.todo_list.get(task_id)
+            self.listbox.insert(tk.END, f"[{'x' if task['completed'] else ' '}] {task['name']}")
+            if task_id == self.selected:
+                self.listbox.selection_set(row)
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(window)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+        self.summary.config(text=f"Showing {total:,} of {len(self.todo_list):,} tasks")
+
+    def on_resize(self, event):
+        rows = max(1, (event.height - self.padding) // self.row_height)
+        if rows != self.rows:
+            self.rows = rows
+            self.render()
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.offset = int(float(amount) * self.view_length())
+        else:
+            self.offset += int(amount) * (self.rows if unit == "pages" else 1)
+        self.render()
+
+    def scroll(self, lines):
+        self.offset += lines * 3
+        self.render()
+
+    def on_select(self, event):
+        selection = self.listbox.curselection()
+        if selection:
+            self.selected = self.view_ids(self.offset + selection[0], self.offset + selection[0] + 1)[0]
+
+    def move_selection(self, step):
+        total = self.view_length()
+        if not total:
+            return "break"
+        position = 0 if self.selected is None else self.view_position(self.selected) + step
+        position = max(0, min(position, total - 1))
+        self.selected = self.view_ids(position, position + 1)[0]
+        if position < self.offset:
+            self.offset = position
+        elif position >= self.offset + self.rows:
+            self.offset = position - self.rows + 1
+        self.render()
+        return "break"
+
+    def add_task(self):
+        task_name = self.entry.get()
+        if not task_name:
+            messagebox.showwarning("Warning", "Please enter a task.")
+            return
+        task = self.todo_list.add(task_name)
+        self.writer.submit(op="add", **task)
+        self.entry.delete(0, tk.END)
+        if self.view is not None:
+            if not self.matcher()(task):
+                self.render()
+                return
+            self.view.append(task["id"])
+        # Scroll to the new task
+        self.selected = task["id"]
+        self.offset = self.view_length() - self.rows
+        self.render()
+
+    def toggle_task(self):
+        if self.selected is None:
+            messagebox.showwarning("Warning", "Please select a task to toggle.")
+            return
+        task = self.todo_list.get(self.selected)
+        self.todo_list.update(task["id"], completed=not task["completed"])
+        self.writer.submit(op="set", id=task["id"], completed=task["completed"])
+        if self.view is not None and not self.matcher()(task):
+            self.view.pop(self.view_position(task["id"]))
+            self.selected = None
+        self.render()
+
+    def delete_task(self):
+        if self.selected is None:
+            messagebox.showwarning("Warning", "Please select a task to delete.")
+            return
+        if self.view is not None:
+            self.view.pop(self.view_position(self.selected))
+        self.todo_list.delete(self.selected)
+        self.writer.submit(op="delete", id=self.selected)
+        self.selected = None
+        self.render()
+
+    def check_writer(self):
+        try:
+            error = self.writer.errors.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            messagebox.showerror(
+                "Save Failed",
+                f"Your changes could not be saved:\n{error}\n\n"
+                f"They are kept and saving will be retried every {RETRY_DELAY:g} seconds.")
+        self.root.after(ERROR_CHECK_MS, self.check_writer)
+
+    def close(self):
+        error = self.writer.close()
+        while error is not None:
+            if not messagebox.askretrycancel(
+                    "Save Failed",
+                    f"Your latest changes could not be saved:\n{error}\n\n"
+                    f"Retry, or Cancel to close without them?"):
+                break
+            error = self.writer.finish()
+        self.root.destroy()
+
+def main():
+    metrics.setup("task1_GUI")  # PROFILE=1 or --profile to record timings
+    root = tk.Tk()
+    TodoApp(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Task model for the to-do list: stable IDs plus order, tag, priority and due-date indexes."""
+import bisect
+import datetime
+import time
+
+PRIORITIES = ("high", "medium", "low")
+DEFAULT_PRIORITY = "medium"
+
+class OrderIndex:
+    """Live task IDs in ascending order, as a Fenwick tree over ID slots.
+
+    Adding, removing, finding the position of an ID and finding the ID at a
+    position all take O(log n), so deleting a task never shifts the others.
+    """
+
+    def __init__(self):
+        self.present = bytearray(1)  # present[id] is 1 while the task exists
+        self.tree = [0]
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, task_id):
+        capacity = max(task_id, 2 * (len(self.present) - 1), 16)
+        self.present.extend(bytes(capacity + 1 - len(self.present)))
+        # Rebuild the tree in O(n) for the new capacity
+        tree = list(self.present)
+        for i in range(1, capacity + 1):
+            parent = i + (i & -i)
+            if parent <= capacity:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _update(self, task_id, delta):
+        size = len(self.tree) - 1
+        while task_id <= size:
+            self.tree[task_id] += delta
+            task_id += task_id & -task_id
+
+    def add(self, task_id):
+        if task_id >= len(self.present):
+            self._grow(task_id)
+        if not self.present[task_id]:
+            self.present[task_id] = 1
+            self._update(task_id, 1)
+            self.count += 1
+
+    def remove(self, task_id):
+        if task_id < len(self.present) and self.present[task_id]:
+            self.present[task_id] = 0
+            self._update(task_id, -1)
+            self.count -= 1
+
+    def position(self, task_id):
+        """Number of live IDs smaller than task_id."""
+        task_id -= 1
+        total = 0
+        while task_id > 0:
+            total += self.tree[task_id]
+            task_id -= task_id & -task_id
+        return total
+
+    def id_at(self, position):
+        """The ID at a 0-based position."""
+        if not 0 <= position < self.count:
+            raise IndexError("task position out of range")
+        size = len(self.tree) - 1
+        task_id = 0
+        step = 1 << size.bit_length()
+        while step:
+            candidate = task_id + step
+            if candidate <= size and self.tree[candidate] <= position:
+                task_id = candidate
+                position -= self.tree[candidate]
+            step >>= 1
+        return task_id + 1
+
+    def ids(self, start, stop):
+        """IDs at positions start..stop-1."""
+        stop = min(stop, self.count)
+        if start >= stop:
+            return []
+        result = []
+        task_id = self.id_at(start)
+        present = self.present
+        while len(result) < stop - start:
+            if present[task_id]:
+                result.append(task_id)
+            task_id += 1
+        return result
+
+class TaskList:
+    """Tasks keyed by stable integer ID, kept in creation order."""
+
+    def __init__(self, tasks=()):
+        self.reset(tasks)
+
+    def reset(self, tasks=()):
+        """Replace every task, e.g. when reloading from disk."""
+        self.tasks = {}  # id -> task dict, in ID order
+        self.order = OrderIndex()
+        self.by_tag = {}  # tag -> set of ids
+        self.by_priority = {priority: set() for priority in PRIORITIES}
+        self.by_due = []  # sorted (due date, id) pairs
+        self.next_id = 1
+        for task in tasks:
+            self.add(**task)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __iter__(self):
+        return iter(self.tasks.values())
+
+    def __contains__(self, task_id):
+        return task_id in self.tasks
+
+    def get(self, task_id):
+        return self.tasks.get(task_id)
+
+    def copy(self):
+        tasks = TaskList(dict(task, tags=list(task["tags"])) for task in self)
+        tasks.next_id = self.next_id
+        return tasks
+
+    def _index(self, task):
+        task_id = task["id"]
+        for tag in task["tags"]:
+            self.by_tag.setdefault(tag, set()).add(task_id)
+        self.by_priority[task["priority"]].add(task_id)
+        if task["due"]:
+            bisect.insort(self.by_due, (task["due"], task_id))
+
+    def _unindex(self, task):
+        task_id = task["id"]
+        for tag in task["tags"]:
+            members = self.by_tag[tag]
+            members.discard(task_id)
+            if not members:
+                del self.by_tag[tag]
+        self.by_priority[task["priority"]].discard(task_id)
+        if task["due"]:
+            position = bisect.bisect_left(self.by_due, (task["due"], task_id))
+            del self.by_due[position]
+
+    def add(self, name, completed=False, priority=DEFAULT_PRIORITY, due=None,
+            tags=(), created=None, id=None):
+        """Add a task and return it. Tasks loaded from older files get new IDs."""
+        if id is None:
+            id = self.next_id
+        if id in self.tasks:
+            raise ValueError(f"Duplicate task ID {id}")
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        task = {"id": id, "name": name, "completed": completed, "priority": priority,
+                "due": due, "tags": list(tags),
+                "created": int(time.time()) if created is None else created}
+        if self.tasks and id < next(reversed(self.tasks)):
+            # Rare (an explicit ID below the newest); re-sort to keep ID order
+            self.tasks[id] = task
+            self.tasks = dict(sorted(self.tasks.items()))
+        else:
+            self.tasks[id] = task
+        self.order.add(id)
+        self._index(task)
+        self.next_id = max(self.next_id, id + 1)
+        return task
+
+    def update(self, task_id, **fields):
+        """Change fields of a task, keeping the indexes in step."""
+        task = self.tasks[task_id]
+        if fields.get("priority", task["priority"]) not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {fields['priority']}")
+        indexed = {"priority", "due", "tags"}.intersection(fields)
+        if indexed:
+            self._unindex(task)
+        task.update(fields)
+        if "tags" in fields:
+            task["tags"] = list(fields["tags"])
+        if indexed:
+            self._index(task)
+        return task
+
+    def delete(self, task_id):
+        task = self.tasks.pop(task_id)
+        self.order.remove(task_id)
+        self._unindex(task)
+        return task
+
+    def id_at(self, position):
+        return self.order.id_at(position)
+
+    def position(self, task_id):
+        return self.order.position(task_id)
+
+    def ids(self, start=0, stop=None):
+        """IDs of the tasks at positions start..stop-1."""
+        return self.order.ids(start, len(self) if stop is None else stop)
+
+    def with_tag(self, tag):
+        return [self.tasks[task_id] for task_id in sorted(self.by_tag.get(tag, ()))]
+
+    def with_priority(self, priority):
+        return [self.tasks[task_id] for task_id in sorted(self.by_priority[priority])]
+
+    def overdue(self, today=None):
+        """Unfinished tasks due before today, earliest first."""
+        if today is None:
+            today = datetime.date.today().isoformat()
+        end = bisect.bisect_left(self.by_due, (today,))
+        return [self.tasks[task_id] for due, task_id in self.by_due[:end]
+                if not self.tasks[task_id]["completed"]]
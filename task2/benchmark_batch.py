@@ -0,0 +1,41 @@
+"""Compare passwords/second of generate_password and the bulk CSPRNG path."""
+import importlib.util
+import io
+import os
+import time
+
+from password_batch import generate_passwords, write_passwords
+
+LENGTH = 16
+INTERACTIVE_COUNT = 20_000
+BATCH_COUNT = 1_000_000
+
+def load_generator():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "password-generator.py")
+    spec = importlib.util.spec_from_file_location("password_generator", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def rate(count, func):
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+def main():
+    generator = load_generator()
+    results = [
+        ("generate_password", rate(INTERACTIVE_COUNT, lambda: [
+            generator.generate_password(LENGTH, 3) for _ in range(INTERACTIVE_COUNT)])),
+        ("generate_passwords", rate(BATCH_COUNT, lambda: generate_passwords(
+            BATCH_COUNT, LENGTH))),
+    ]
+    for workers in sorted({1, os.cpu_count() or 1}):
+        results.append((f"write_passwords x{workers}", rate(BATCH_COUNT, lambda: write_passwords(
+            io.StringIO(), BATCH_COUNT, LENGTH,
+            ("lower", "upper", "digits", "symbols"), workers))))
+    for name, passwords_per_second in results:
+        print(f"{name:>22}: {passwords_per_second:>12,.0f} passwords/s")
+
+if __name__ == "__main__":
+    main()
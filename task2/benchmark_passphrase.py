@@ -0,0 +1,43 @@
+"""Measure wordlist open time, memory and passphrases/second."""
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+from passphrase import Wordlist, generate_passphrases
+
+WORDS = 1_000_000
+PHRASES = 200_000
+
+def main():
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "wordlist.txt")
+        with open(filename, "w") as f:
+            for i in range(WORDS):
+                word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+                f.write(f"{i:07d}\t{word}\n")
+
+        start = time.perf_counter()
+        Wordlist(filename).close()
+        print(f"first open (builds index): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        wordlist = Wordlist(filename)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"reopen: {elapsed * 1000:.1f} ms, peak {peak / 1024:.0f} KiB traced")
+
+        for options in ({}, {"capitalize": "random", "digit": True}):
+            start = time.perf_counter()
+            generate_passphrases(PHRASES, wordlist=wordlist, **options)
+            elapsed = time.perf_counter() - start
+            print(f"{options or 'defaults'}: {PHRASES / elapsed:,.0f} phrases/s")
+        wordlist.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Measure strength-audit throughput against a large memory-mapped wordlist."""
+import io
+import os
+import random
+import string
+import tempfile
+import time
+
+from password_batch import generate_passwords
+from password_strength import SortedWordlist, audit_file, build_wordlist
+
+WORDS = 1_000_000
+PASSWORDS = 200_000
+
+def main():
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as directory:
+        raw = os.path.join(directory, "raw.txt")
+        with open(raw, "w") as f:
+            for _ in range(WORDS):
+                f.write("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) + "\n")
+        wordlist_file = os.path.join(directory, "wordlist.txt")
+        start = time.perf_counter()
+        build_wordlist(raw, wordlist_file)
+        print(f"build wordlist: {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        wordlist = SortedWordlist(wordlist_file)
+        print(f"open wordlist ({len(wordlist):,} words): "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+        # Half random passwords, half dictionary words with typical decorations
+        sample = generate_passwords(PASSWORDS // 2, 12)
+        with open(raw) as f:
+            for _, line in zip(range(PASSWORDS // 2), f):
+                sample.append(line.strip().capitalize() + str(rng.randint(0, 99)) + "!")
+        passwords_file = os.path.join(directory, "passwords.txt")
+        with open(passwords_file, "w") as f:
+            f.write("\n".join(sample) + "\n")
+
+        output = io.StringIO()
+        count, elapsed = audit_file(passwords_file, output, wordlist)
+        weak = output.getvalue().count("\tWeak\t")
+        print(f"audit: {count:,} passwords in {elapsed:.1f}s "
+              f"({count / elapsed:,.0f}/s, {elapsed / count * 1e6:.1f} us each), {weak:,} weak")
+        wordlist.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Diceware-style passphrases drawn from a large memory-mapped wordlist.
+
+No wordlist is shipped. Save one as wordlist.txt next to this file, or
+point $PASSPHRASE_WORDLIST at it. Any list with one word per line works;
+so do numbered diceware lists such as the EFF large wordlist
+(https://www.eff.org/files/2016/07/18/eff_large_wordlist.txt).
+"""
+import math
+import mmap
+import os
+import secrets
+from array import array
+
+# Wordlist used when none is given: $PASSPHRASE_WORDLIST, else wordlist.txt here
+WORDLIST_ENV = "PASSPHRASE_WORDLIST"
+DEFAULT_WORDLIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wordlist.txt")
+WORDLIST_HELP = (f"save a wordlist as {DEFAULT_WORDLIST} or set ${WORDLIST_ENV} "
+                 f"(see passphrase.py)")
+CAPITALIZATION = ("none", "first", "all", "random")
+
+class Wordlist:
+    """Random access to the words of a text file through a sidecar offset index.
+
+    Each usable line contributes its last whitespace-separated field (so
+    plain lists and numbered diceware lists both work) if it is
+    alphabetic. The (start, end) byte offsets of those words are stored in
+    <filename>.idx, rebuilt only when the wordlist is newer, and both files
+    are memory-mapped so opening is fast and memory stays flat.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        index_filename = filename + ".idx"
+        if (not os.path.exists(index_filename)
+                or os.path.getmtime(index_filename) < os.path.getmtime(filename)):
+            self.build_index(filename, index_filename)
+        self.file = open(filename, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index_file = open(index_filename, "rb")
+        self.index_map = mmap.mmap(self.index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.offsets = memoryview(self.index_map).cast("I")
+        if not len(self.offsets):
+            raise ValueError(f"{filename} contains no usable words")
+
+    @staticmethod
+    def build_index(filename, index_filename):
+        offsets = array("I")
+        position = 0
+        with open(filename, "rb") as f:
+            for line in f:
+                stripped = line.rstrip()
+                start = max(stripped.rfind(b" "), stripped.rfind(b"\t")) + 1
+                word = stripped[start:]
+                if word.isalpha():
+                    offsets.append(position + start)
+                    offsets.append(position + len(stripped))
+                position += len(line)
+        with open(index_filename, "wb") as f:
+            offsets.tofile(f)
+
+    def __len__(self):
+        return len(self.offsets) // 2
+
+    def __getitem__(self, i):
+        return self.map[self.offsets[2 * i]:self.offsets[2 * i + 1]].decode("utf-8")
+
+    def close(self):
+        self.offsets.release()
+        self.index_map.close()
+        self.index_file.close()
+        self.map.close()
+        self.file.close()
+
+_default_wordlist = None
+
+def default_wordlist():
+    global _default_wordlist
+    if _default_wordlist is None:
+        _default_wordlist = Wordlist(os.environ.get(WORDLIST_ENV) or DEFAULT_WORDLIST)
+    return _default_wordlist
+
+def random_indices(count, size):
+    """Return count uniform indices below size, rejection-sampled from os.urandom."""
+    limit = 2 ** 32 - 2 ** 32 % size
+    indices = []
+    while len(indices) < count:
+        values = array("I", os.urandom(4 * (count - len(indices) + 8)))
+        indices.extend(value % size for value in values if value < limit)
+    return indices[:count]
+
+def passphrase_entropy(size, words, capitalize="none", digit=False):
+    """Bits of entropy of a passphrase built with these options."""
+    bits = words * math.log2(size)
+    if capitalize == "random":
+        bits += words
+    if digit:
+        bits += math.log2(10) + math.log2(words + 1)
+    return bits
+
+def _assemble(words, separator, capitalize, digit_choice):
+    if capitalize == "first":
+        words[0] = words[0].capitalize()
+    elif capitalize == "all":
+        words = [word.capitalize() for word in words]
+    elif capitalize == "random":
+        flags = secrets.randbits(len(words))
+        words = [word.capitalize() if flags >> i & 1 else word
+                 for i, word in enumerate(words)]
+    if digit_choice is not None:
+        # Insert a digit as its own token at a random position
+        position, digit = digit_choice
+        words.insert(position, str(digit))
+    return separator.join(words)
+
+def generate_passphrases(count, words=6, separator="-", capitalize="none",
+                         digit=False, wordlist=None):
+    """Return count passphrases; word choices are drawn in one bulk urandom call."""
+    if capitalize not in CAPITALIZATION:
+        raise ValueError(f"capitalize must be one of {', '.join(CAPITALIZATION)}")
+    if words < 1:
+        raise ValueError("a passphrase needs at least one word")
+    if wordlist is None:
+        wordlist = default_wordlist()
+    indices = random_indices(count * words, len(wordlist))
+    phrases = []
+    for n in range(count):
+        chosen = [wordlist[i] for i in indices[n * words:(n + 1) * words]]
+        digit_choice = None
+        if digit:
+            digit_choice = (secrets.randbelow(words + 1), secrets.randbelow(10))
+        phrases.append(_assemble(chosen, separator, capitalize, digit_choice))
+    return phrases
+
+def generate_passphrase(words=6, separator="-", capitalize="none", digit=False,
+                        wordlist=None):
+    """Return (passphrase, entropy_bits)."""
+    if wordlist is None:
+        wordlist = default_wordlist()
+    phrase = generate_passphrases(1, words, separator, capitalize, digit, wordlist)[0]
+    return phrase, passphrase_entropy(len(wordlist), words, capitalize, digit)
@@ -1,7 +1,17 @@
-import random
+import argparse
+import os
 import string
 import sys
 
+from passphrase import (CAPITALIZATION, WORDLIST_HELP, default_wordlist,
+                        generate_passphrase, generate_passphrases)
+from password_batch import CHARACTER_CLASSES, CHUNK_SIZE, write_passwords
+from password_policy import Policy, generate, load_policy
+from password_strength import analyze_password
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared import metrics
+
 def get_password_length():
     while True:
         try:
@@ -46,6 +56,7 @@ def get_custom_characters():
         chars = string.ascii_lowercase
     return chars
 
+@metrics.timed("generate")
 def generate_password(length, complexity):
     if complexity == 1:
         chars = string.ascii_letters
@@ -56,56 +67,138 @@ def generate_password(length, complexity):
     else:
         chars = get_custom_characters()
     
-    # Ensure password has at least one character from each selected type
-    password = []
-    if string.ascii_lowercase in chars:
-        password.append(random.choice(string.ascii_lowercase))
-    if string.ascii_uppercase in chars:
-        password.append(random.choice(string.ascii_uppercase))
-    if string.digits in chars:
-        password.append(random.choice(string.digits))
-    if string.punctuation in chars:
-        password.append(random.choice(string.punctuation))
-    
-    # Fill the rest of the password length with random characters
-    while len(password) < length:
-        password.append(random.choice(chars))
-    
-    # Shuffle the password
-    random.shuffle(password)
-    return ''.join(password)
+    # Require at least one character from each selected type; the policy
+    # generator places them directly instead of relying on substring checks
+    classes = {name: {"min": 1} for name, alphabet in CHARACTER_CLASSES.items()
+               if not set(alphabet).isdisjoint(chars)}
+    return generate(Policy(length, classes))[0]
 
+@metrics.timed("strength")
 def check_password_strength(password):
-    strength = 0
-    if any(c.islower() for c in password): strength += 1
-    if any(c.isupper() for c in password): strength += 1
-    if any(c.isdigit() for c in password): strength += 1
-    if any(c in string.punctuation for c in password): strength += 1
-    
-    if strength == 1: return "Weak"
-    elif strength == 2: return "Moderate"
-    elif strength == 3: return "Strong"
-    else: return "Very Strong"
+    # Entropy-based estimate that penalizes dictionary words and patterns
+    return analyze_password(password)[1]
+
+def get_passphrase_preferences():
+    while True:
+        try:
+            words = int(input("Enter number of words (minimum 4): "))
+            if words >= 4:
+                break
+            print("A passphrase needs at least 4 words!")
+        except ValueError:
+            print("Please enter a valid number!")
+    separator = input("Enter word separator (press Enter for '-'): ") or "-"
+    print("Capitalization options:", ", ".join(CAPITALIZATION))
+    capitalize = input("Choose capitalization (press Enter for 'none'): ").strip().lower()
+    if capitalize not in CAPITALIZATION:
+        capitalize = "none"
+    digit = input("Add a random digit? (Y/N): ").upper() == 'Y'
+    return words, separator, capitalize, digit
+
+def show_passphrase():
+    words, separator, capitalize, digit = get_passphrase_preferences()
+    try:
+        with metrics.measure("generate passphrase"):
+            phrase, entropy = generate_passphrase(words, separator, capitalize, digit)
+    except (OSError, ValueError) as e:
+        print(f"\nCould not load the wordlist: {e}")
+        print(f"To use passphrases, {WORDLIST_HELP}.")
+        return
+    print("\nGenerated Passphrase:", phrase)
+    print(f"Passphrase Entropy: {entropy:.1f} bits")
+    print("Passphrase Length:", len(phrase))
 
 def main():
     while True:
         print("\n=== Password Generator ===")
-        length = get_password_length()
-        complexity = get_complexity_preferences()
-        
-        password = generate_password(length, complexity)
-        strength = check_password_strength(password)
-        
-        print("\nGenerated Password:", password)
-        print("Password Strength:", strength)
-        print("Password Length:", len(password))
+        if input("Generate a passphrase from words instead? (Y/N): ").upper() == 'Y':
+            show_passphrase()
+        else:
+            length = get_password_length()
+            complexity = get_complexity_preferences()
+
+            password = generate_password(length, complexity)
+            strength = check_password_strength(password)
+
+            print("\nGenerated Password:", password)
+            print("Password Strength:", strength)
+            print("Password Length:", len(password))
         
         if input("\nGenerate another password? (Y/N): ").upper() != 'Y':
             print("Thank you for using the Password Generator!")
             break
 
+def batch_main(argv):
+    parser = argparse.ArgumentParser(
+        description="Generate passwords in bulk without prompts.")
+    parser.add_argument("--count", type=int, required=True,
+                        help="number of passwords to generate")
+    parser.add_argument("--length", type=int, default=16,
+                        help="characters per password (minimum 8)")
+    parser.add_argument("--classes", default="lower,upper,digits,symbols",
+                        help="comma-separated: " + ",".join(CHARACTER_CLASSES))
+    parser.add_argument("--output", help="file to write to (default: stdout)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes to spread generation over")
+    parser.add_argument("--policy",
+                        help="JSON or TOML policy file to generate passwords from")
+    parser.add_argument("--passphrase", action="store_true",
+                        help="generate word passphrases instead of passwords")
+    parser.add_argument("--words", type=int, default=6,
+                        help="words per passphrase")
+    parser.add_argument("--separator", default="-",
+                        help="text between passphrase words")
+    parser.add_argument("--capitalize", choices=CAPITALIZATION, default="none",
+                        help="which passphrase words to capitalize")
+    parser.add_argument("--digit", action="store_true",
+                        help="insert a random digit into each passphrase")
+    args = parser.parse_args(argv)
+    if args.count < 0 or args.workers < 1:
+        parser.error("--count must be non-negative and --workers at least 1")
+
+    if args.passphrase:
+        if args.words < 1:
+            parser.error("--words must be positive")
+        # Opened before any output so a missing list is a usage error, not a traceback
+        try:
+            wordlist = default_wordlist()
+        except (OSError, ValueError) as e:
+            parser.error(f"could not load the wordlist: {e}; {WORDLIST_HELP}")
+        make_chunk = lambda count: generate_passphrases(
+            count, args.words, args.separator, args.capitalize, args.digit, wordlist)
+    elif args.policy:
+        try:
+            policy = load_policy(args.policy)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"could not load policy: {e}")
+        make_chunk = lambda count: generate(policy, count)
+    else:
+        class_names = [name.strip() for name in args.classes.split(",") if name.strip()]
+        unknown = [name for name in class_names if name not in CHARACTER_CLASSES]
+        if unknown or not class_names:
+            parser.error(f"unknown character classes: {', '.join(unknown) or '(none)'}")
+        if args.length < 8:
+            parser.error("password length must be at least 8 characters")
+        make_chunk = None
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        with metrics.measure("generate batch"):
+            if make_chunk is None:
+                write_passwords(output, args.count, args.length, class_names, args.workers)
+            else:
+                for start in range(0, args.count, CHUNK_SIZE):
+                    output.write("\n".join(make_chunk(min(CHUNK_SIZE, args.count - start))) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
 if __name__ == "__main__":
+    metrics.setup("password-generator")  # PROFILE=1 or --profile to record timings
     try:
+        if len(sys.argv) > 1:
+            batch_main(sys.argv[1:])
+            sys.exit(0)
         main()
     except KeyboardInterrupt:
         print("\nProgram terminated by user.")
@@ -0,0 +1,95 @@
+"""Generate large numbers of passwords from the operating system's CSPRNG."""
+import os
+import secrets
+import string
+from concurrent.futures import ProcessPoolExecutor
+
+CHARACTER_CLASSES = {
+    "lower": string.ascii_lowercase,
+    "upper": string.ascii_uppercase,
+    "digits": string.digits,
+    "symbols": string.punctuation,
+}
+# Passwords generated per worker task when fanning out over processes
+CHUNK_SIZE = 50_000
+
+def build_alphabet(class_names):
+    return "".join(CHARACTER_CLASSES[name] for name in class_names)
+
+def _byte_table(values):
+    """Translation table and rejected bytes for unbiased byte -> value mapping.
+
+    Bytes at or above the largest multiple of len(values) are dropped,
+    so every value is equally likely (no modulo bias).
+    """
+    size = len(values)
+    limit = 256 - 256 % size
+    table = bytes(values[b % size] for b in range(256))
+    return table, bytes(range(limit, 256))
+
+def random_bytes(values, count):
+    """Return count bytes drawn uniformly from the bytes in values using os.urandom."""
+    table, rejected = _byte_table(values)
+    chunks = []
+    needed = count
+    while needed > 0:
+        # Ask for a little extra to cover the bytes rejection sampling drops
+        raw = os.urandom(needed + needed // 4 + 16)
+        chunk = raw.translate(table, rejected)[:needed]
+        chunks.append(chunk)
+        needed -= len(chunk)
+    return b"".join(chunks)
+
+def random_characters(alphabet, count):
+    """Return count characters drawn uniformly from alphabet using os.urandom."""
+    if not 0 < len(alphabet) <= 256 or not alphabet.isascii():
+        raise ValueError("alphabet must be 1-256 ASCII characters")
+    return random_bytes(alphabet.encode("ascii"), count).decode("ascii")
+
+def random_below(n, count):
+    """Return count integers drawn uniformly from range(n)."""
+    if n <= 256:
+        return random_bytes(bytes(range(n)), count)
+    return [secrets.randbelow(n) for _ in range(count)]
+
+def generate_passwords(count, length, class_names=("lower", "upper", "digits", "symbols")):
+    """Return count passwords, each containing every requested character class.
+
+    Built in a single pass, like password_policy.generate: one character
+    of each class is inserted at a random position among length - classes
+    characters from the whole alphabet, so no password is drawn and then
+    thrown away. All randomness comes from a few bulk os.urandom calls.
+    """
+    alphabet = build_alphabet(class_names)
+    if length < len(class_names):
+        # Too short to hold every class; any characters will do
+        characters = random_characters(alphabet, count * length)
+        return [characters[start:start + length] for start in range(0, count * length, length)]
+    free = length - len(class_names)
+    characters = random_characters(alphabet, count * free)
+    required = [random_characters(CHARACTER_CLASSES[name], count) for name in class_names]
+    # Where each required character goes among the ones placed before it
+    positions = [random_below(free + i + 1, count) for i in range(len(class_names))]
+    passwords = []
+    for n in range(count):
+        password = list(characters[n * free:(n + 1) * free])
+        for chars, places in zip(required, positions):
+            password.insert(places[n], chars[n])
+        passwords.append("".join(password))
+    return passwords
+
+def _generate_chunk(args):
+    count, length, class_names = args
+    return "\n".join(generate_passwords(count, length, class_names)) + "\n"
+
+def write_passwords(output, count, length, class_names, workers=1):
+    """Stream count passwords, one per line, to a text file object."""
+    chunks = [(min(CHUNK_SIZE, count - start), length, tuple(class_names))
+              for start in range(0, count, CHUNK_SIZE)]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for text in pool.map(_generate_chunk, chunks):
+                output.write(text)
+    else:
+        for chunk in chunks:
+            output.write(_generate_chunk(chunk))
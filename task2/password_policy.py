@@ -0,0 +1,198 @@
+"""Declarative password policies: direct generation and bulk validation."""
+import json
+import os
+import sys
+
+from password_batch import CHARACTER_CLASSES
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+# Characters that are easy to confuse when read aloud or written down
+AMBIGUOUS = "Il1|O0`'\""
+
+class PolicyError(ValueError):
+    pass
+
+class Policy:
+    """A password policy.
+
+    A spec looks like::
+
+        {"length": 16,
+         "classes": {"lower": {"min": 2}, "upper": {"min": 2},
+                     "digits": {"min": 2}, "symbols": {"min": 1, "chars": "!@#$%"}},
+         "exclude": "ambiguous",   # or a string of characters to leave out
+         "max_run": 1}             # longest run of one repeated character
+
+    Classes default to their full alphabet and a minimum of zero. A
+    character in several classes' alphabets counts toward all of them.
+    """
+
+    def __init__(self, length, classes, exclude="", max_run=None):
+        if exclude == "ambiguous":
+            exclude = AMBIGUOUS
+        self.length = length
+        self.max_run = max_run
+        self.exclude = set(exclude)
+        self.alphabets = {}
+        self.minimums = {}
+        for name, options in classes.items():
+            options = options or {}
+            if name not in CHARACTER_CLASSES and "chars" not in options:
+                raise PolicyError(f"unknown character class '{name}'")
+            alphabet = options.get("chars", CHARACTER_CLASSES.get(name, ""))
+            alphabet = "".join(dict.fromkeys(c for c in alphabet if c not in self.exclude))
+            if not alphabet:
+                raise PolicyError(f"class '{name}' has no characters left")
+            self.alphabets[name] = alphabet
+            self.minimums[name] = options.get("min", 0)
+        self.alphabet = "".join(dict.fromkeys("".join(self.alphabets.values())))
+        # Classes may share characters; a character counts toward each of them
+        self.classes_of = {}
+        for name, alphabet in self.alphabets.items():
+            for c in alphabet:
+                self.classes_of.setdefault(c, []).append(name)
+        self._check()
+
+    def _check(self):
+        if not self.alphabets:
+            raise PolicyError("a policy needs at least one character class")
+        if self.length < 1:
+            raise PolicyError("length must be positive")
+        if sum(self.minimums.values()) > self.length:
+            raise PolicyError("class minimums add up to more than the length")
+        if self.max_run is not None:
+            if self.max_run < 1:
+                raise PolicyError("max_run must be at least 1")
+            small = [name for name, alphabet in self.alphabets.items() if len(alphabet) < 2]
+            if small:
+                raise PolicyError(f"max_run needs at least two characters in: {', '.join(small)}")
+
+    @classmethod
+    def from_spec(cls, spec):
+        return cls(spec["length"], spec.get("classes", {}),
+                   spec.get("exclude", ""), spec.get("max_run"))
+
+def load_policy(source):
+    """Build a Policy from a dict or a .json / .toml file."""
+    if isinstance(source, dict):
+        return Policy.from_spec(source)
+    if source.endswith(".toml"):
+        if tomllib is None:
+            raise PolicyError("TOML policies need Python 3.11 or newer")
+        with open(source, "rb") as f:
+            return Policy.from_spec(tomllib.load(f))
+    with open(source) as f:
+        return Policy.from_spec(json.load(f))
+
+class RandomSource:
+    """Uniform integers below n from buffered os.urandom words, without modulo bias."""
+
+    BUFFER_WORDS = 4096
+
+    def __init__(self):
+        self.buffer = memoryview(b"").cast("I")
+        self.position = 0
+        self.limits = {}
+
+    def below(self, n):
+        limit = self.limits.get(n)
+        if limit is None:
+            limit = self.limits[n] = 2 ** 32 - 2 ** 32 % n
+        while True:
+            if self.position == len(self.buffer):
+                self.buffer = memoryview(os.urandom(4 * self.BUFFER_WORDS)).cast("I")
+                self.position = 0
+            value = self.buffer[self.position]
+            self.position += 1
+            if value < limit:
+                return value % n
+
+def generate(policy, count=1, source=None):
+    """Return count passwords that satisfy policy, built in a single pass each.
+
+    Each position is first assigned a class (the required minimums plus
+    free positions drawn from the whole alphabet), the order is shuffled,
+    and characters are then picked left to right from each position's
+    alphabet. A character that would make a run longer than max_run is
+    excluded from that one pick rather than redrawing the password.
+    """
+    source = source or RandomSource()
+    required = []
+    for name, minimum in policy.minimums.items():
+        required.extend([policy.alphabets[name]] * minimum)
+    free = policy.length - len(required)
+    passwords = []
+    for _ in range(count):
+        slots = required + [policy.alphabet] * free
+        for i in range(len(slots) - 1, 0, -1):
+            j = source.below(i + 1)
+            slots[i], slots[j] = slots[j], slots[i]
+        password = []
+        run = 0
+        for alphabet in slots:
+            banned = password[-1] if policy.max_run and run >= policy.max_run else None
+            if banned is not None and banned in alphabet:
+                # Pick among the other len - 1 characters
+                index = source.below(len(alphabet) - 1)
+                if index >= alphabet.index(banned):
+                    index += 1
+                c = alphabet[index]
+            else:
+                c = alphabet[source.below(len(alphabet))]
+            run = run + 1 if password and password[-1] == c else 1
+            password.append(c)
+        passwords.append("".join(password))
+    return passwords
+
+def violations(policy, password):
+    """Return the list of rules password breaks (empty if it complies)."""
+    problems = []
+    if len(password) != policy.length:
+        problems.append(f"length {len(password)} != {policy.length}")
+    counts = dict.fromkeys(policy.alphabets, 0)
+    for c in password:
+        names = policy.classes_of.get(c)
+        if names is None:
+            problems.append(f"character {c!r} not allowed")
+            break
+        for name in names:
+            counts[name] += 1
+    for name, minimum in policy.minimums.items():
+        if counts[name] < minimum:
+            problems.append(f"needs {minimum} {name}, has {counts[name]}")
+    if policy.max_run:
+        run = 1
+        for previous, c in zip(password, password[1:]):
+            run = run + 1 if c == previous else 1
+            if run > policy.max_run:
+                problems.append(f"run of {c!r} longer than {policy.max_run}")
+                break
+    return problems
+
+def validate_passwords(policy, passwords):
+    """Yield (password, problems) for every password that breaks policy."""
+    for password in passwords:
+        problems = violations(policy, password)
+        if problems:
+            yield password, problems
+
+def main(argv):
+    if len(argv) != 3 or argv[0] != "check":
+        print("usage: password_policy.py check POLICY_FILE PASSWORDS_FILE", file=sys.stderr)
+        return 1
+    policy = load_policy(argv[1])
+    failed = 0
+    with open(argv[2], encoding="utf-8", errors="replace") as f:
+        passwords = (line.rstrip("\r\n") for line in f)
+        for password, problems in validate_passwords(policy, passwords):
+            failed += 1
+            print(f"{password}\t{'; '.join(problems)}")
+    print(f"{failed} passwords violate the policy", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,266 @@
+"""Estimate password strength from entropy, common patterns and a wordlist."""
+import math
+from bisect import bisect_right
+import mmap
+import os
+import string
+import sys
+import time
+from itertools import groupby
+
+# Sorted, lowercase, one-word-per-line file used when none is given
+WORDLIST_ENV = "PASSWORD_WORDLIST"
+
+# Used when no wordlist file is available; kept sorted for bisect
+COMMON_PASSWORDS = sorted({
+    "123456", "password", "12345678", "qwerty", "123456789", "12345", "1234",
+    "111111", "1234567", "dragon", "123123", "baseball", "abc123", "football",
+    "monkey", "letmein", "696969", "shadow", "master", "666666", "qwertyuiop",
+    "123321", "mustang", "1234567890", "michael", "654321", "superman",
+    "1qaz2wsx", "7777777", "121212", "000000", "qazwsx", "123qwe", "killer",
+    "trustno1", "jordan", "jennifer", "zxcvbnm", "asdfgh", "hunter", "buster",
+    "soccer", "harley", "batman", "andrew", "tigger", "sunshine", "iloveyou",
+    "charlie", "robert", "thomas", "hockey", "ranger", "daniel", "starwars",
+    "klaster", "112233", "george", "computer", "michelle", "jessica", "pepper",
+    "1111", "zxcvbn", "555555", "11111111", "131313", "freedom", "777777",
+    "pass", "maggie", "159753", "aaaaaa", "ginger", "princess", "joshua",
+    "cheese", "amanda", "summer", "love", "ashley", "nicole", "chelsea",
+    "biteme", "matthew", "access", "yankees", "987654321", "dallas", "austin",
+    "thunder", "taylor", "matrix", "admin", "welcome", "login", "secret",
+    "passw0rd", "hello", "whatever", "qwerty123", "changeme",
+})
+
+LEET = str.maketrans({"0": "o", "1": "l", "3": "e", "4": "a", "5": "s",
+                      "7": "t", "8": "b", "9": "g", "@": "a", "$": "s",
+                      "!": "i", "|": "l", "+": "t"})
+
+KEYBOARD_ROWS = ["`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./"]
+# Two-character strings of horizontally adjacent keys, in either direction
+KEYBOARD_PAIRS = set()
+for row in KEYBOARD_ROWS:
+    for a, b in zip(row, row[1:]):
+        KEYBOARD_PAIRS.update((a + b, b + a))
+
+CHARACTER_POOLS = [(frozenset(string.ascii_lowercase), 26),
+                   (frozenset(string.ascii_uppercase), 26),
+                   (frozenset(string.digits), 10),
+                   (frozenset(string.punctuation), 33)]
+
+# Shortest run that counts as a repeat, sequence or keyboard walk
+MIN_PATTERN = 3
+LABELS = [(36, "Weak"), (60, "Moderate"), (80, "Strong")]
+
+class SortedWordlist:
+    """Membership tests against a sorted wordlist file without loading it.
+
+    The file is memory-mapped and only the first word of every
+    BLOCK_SIZE-byte block is kept in memory, so opening is quick, memory
+    stays flat and a lookup is one bisect plus one block search.
+    """
+
+    BLOCK_SIZE = 4096
+
+    def __init__(self, filename):
+        self.file = open(filename, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = 0
+        for chunk in iter(lambda: self.file.read(1 << 20), b""):
+            self.size += chunk.count(b"\n")
+        self.offsets = []
+        self.keys = []
+        offset = 0
+        while offset < len(self.map):
+            end = self.map.find(b"\n", offset)
+            if end == -1:
+                end = len(self.map)
+            self.offsets.append(offset)
+            self.keys.append(self.map[offset:end])
+            # Next block starts at the first line beginning after BLOCK_SIZE bytes
+            next_offset = self.map.find(b"\n", max(end, offset + self.BLOCK_SIZE))
+            if next_offset == -1:
+                break
+            offset = next_offset + 1
+        self.offsets.append(len(self.map))
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, word):
+        target = word.encode("utf-8")
+        block = bisect_right(self.keys, target) - 1
+        if block < 0:
+            return False
+        text = b"\n" + self.map[self.offsets[block]:self.offsets[block + 1]] + b"\n"
+        return b"\n" + target + b"\n" in text
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+class MemoryWordlist:
+    def __init__(self, words):
+        self.words = frozenset(words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.words
+
+_default_wordlist = None
+
+def default_wordlist():
+    """The wordlist named by $PASSWORD_WORDLIST, else the built-in list; loaded once."""
+    global _default_wordlist
+    if _default_wordlist is None:
+        filename = os.environ.get(WORDLIST_ENV)
+        if filename and os.path.exists(filename):
+            _default_wordlist = SortedWordlist(filename)
+        else:
+            _default_wordlist = MemoryWordlist(COMMON_PASSWORDS)
+    return _default_wordlist
+
+def build_wordlist(source, destination):
+    """Write source's words lowercased, de-duplicated and byte-sorted for SortedWordlist."""
+    with open(source, encoding="utf-8", errors="ignore") as f:
+        words = {line.strip().lower() for line in f if line.strip()}
+    with open(destination, "wb") as f:
+        for word in sorted(w.encode("utf-8") for w in words):
+            f.write(word + b"\n")
+    return len(words)
+
+def character_pool(password):
+    characters = set(password)
+    pool = 0
+    for alphabet, size in CHARACTER_POOLS:
+        if not characters.isdisjoint(alphabet):
+            pool += size
+    if not password.isascii():
+        pool += 100
+    return pool or 1
+
+def _runs(flags):
+    """Yield (start, end) character spans covered by runs of True pair flags."""
+    position = 0
+    for flag, group in groupby(flags):
+        pairs = len(list(group))
+        if flag and pairs + 1 >= MIN_PATTERN:
+            yield position, position + pairs + 1
+        position += pairs
+
+def find_patterns(password):
+    """Return (kind, start, end) for repeats, sequences and keyboard walks."""
+    lower = password.lower()
+    pairs = [lower[i:i + 2] for i in range(len(lower) - 1)]
+    steps = [ord(pair[1]) - ord(pair[0]) for pair in pairs]
+    patterns = []
+    for start, end in _runs(step == 0 for step in steps):
+        patterns.append(("repeat", start, end))
+    for direction in (1, -1):
+        for start, end in _runs(step == direction for step in steps):
+            patterns.append(("sequence", start, end))
+    for start, end in _runs(pair in KEYBOARD_PAIRS for pair in pairs):
+        if not lower[start:end].isdigit():  # Digit rows are already sequences
+            patterns.append(("keyboard", start, end))
+    return patterns
+
+def find_word(password, wordlist):
+    """Return (start, end, leet) of a wordlist entry making up the password's core."""
+    lower = password.lower()
+    candidates = [(0, len(lower))]
+    # Strip the digits and symbols people tack onto a word ("Password1!")
+    start, end = 0, len(lower)
+    while start < end and not lower[start].isalpha():
+        start += 1
+    while end > start and not lower[end - 1].isalpha():
+        end -= 1
+    if (start, end) != (0, len(lower)):
+        candidates.append((start, end))
+    for start, end in candidates:
+        core = lower[start:end]
+        if len(core) < MIN_PATTERN:
+            continue
+        if core in wordlist:
+            return start, end, False
+        unleeted = core.translate(LEET)
+        if unleeted != core and unleeted in wordlist:
+            return start, end, True
+    return None
+
+def analyze_password(password, wordlist=None):
+    """Return (entropy_bits, label, findings) for a password."""
+    if wordlist is None:
+        wordlist = default_wordlist()
+    if not password:
+        return 0.0, "Weak", ["empty"]
+
+    per_char = math.log2(character_pool(password))
+    covered = [False] * len(password)
+    bits = 0.0
+    findings = []
+
+    word = find_word(password, wordlist)
+    if word:
+        start, end, leet = word
+        segment = password[start:end]
+        bits += math.log2(max(len(wordlist), 2))
+        if segment != segment.lower():
+            bits += 1  # Capitalization variant
+        if leet:
+            bits += 1
+            findings.append("leetspeak")
+        findings.append("dictionary word")
+        for i in range(start, end):
+            covered[i] = True
+
+    for kind, start, end in find_patterns(password):
+        if any(covered[start:end]):
+            continue
+        # A pattern costs about as much as its first character plus its length
+        bits += per_char + math.log2(end - start)
+        findings.append(kind)
+        for i in range(start, end):
+            covered[i] = True
+
+    bits += per_char * covered.count(False)
+    for threshold, label in LABELS:
+        if bits < threshold:
+            break
+    else:
+        label = "Very Strong"
+    return bits, label, findings
+
+def audit_passwords(passwords, wordlist=None):
+    """Yield (password, entropy_bits, label, findings) for each password."""
+    if wordlist is None:
+        wordlist = default_wordlist()
+    for password in passwords:
+        bits, label, findings = analyze_password(password, wordlist)
+        yield password, bits, label, findings
+
+def audit_file(filename, output, wordlist=None):
+    """Audit one password per line of filename, writing tab-separated results."""
+    count = 0
+    start = time.perf_counter()
+    with open(filename, encoding="utf-8", errors="replace") as f:
+        passwords = (line.rstrip("\r\n") for line in f)
+        for password, bits, label, findings in audit_passwords(passwords, wordlist):
+            output.write(f"{password}\t{bits:.1f}\t{label}\t{','.join(findings)}\n")
+            count += 1
+    return count, time.perf_counter() - start
+
+def main(argv):
+    if len(argv) == 3 and argv[0] == "build-wordlist":
+        print(f"Wrote {build_wordlist(argv[1], argv[2])} words to {argv[2]}.")
+    elif len(argv) == 2 and argv[0] == "audit":
+        count, elapsed = audit_file(argv[1], sys.stdout)
+        print(f"Audited {count} passwords in {elapsed:.1f}s "
+              f"({count / max(elapsed, 1e-9):,.0f}/s)", file=sys.stderr)
+    else:
+        print("usage: password_strength.py build-wordlist SOURCE DESTINATION\n"
+              "       password_strength.py audit PASSWORDS_FILE", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,84 @@
+"""Throughput of scripted contact book operations: menu prompts vs. contact_cli.
+
+"prompts" pipes answers into the interactive menu of contactbook.py,
+"cli per op" starts contact_cli.py once per operation and "cli batch"
+runs every operation from one JSON-lines file in a single process. The
+slower flows run fewer operations; all are projected to OPERATIONS.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OPERATIONS = 100_000
+PROMPT_OPERATIONS = 5_000
+PROCESS_OPERATIONS = 200
+
+def add_fields(i):
+    return {"name": f"Person {i}", "phone": f"+1555{i:07d}",
+            "email": f"person{i}@example.com", "address": f"{i} Main Street",
+            "group": ("General", "Family", "Work", "Friends")[i % 4]}
+
+def mixed_operation(i):
+    """Mostly adds, with updates, searches and deletes of earlier contacts."""
+    kind = i % 10
+    if kind < 6 or i < 10:
+        return {"op": "add", **add_fields(i)}
+    if kind < 8:
+        return {"op": "update", "number": i // 4, "address": f"{i} Edited Avenue"}
+    if kind == 8:
+        return {"op": "search", "term": f"person {i // 3}"}
+    return {"op": "delete", "number": i // 5}
+
+def run(command, stdin=None):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *command], cwd=HERE, input=stdin, text=True,
+                   stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+def prompts(filename, count):
+    answers = []
+    for i in range(count):
+        fields = add_fields(i)
+        answers += ["1", fields["name"], fields["phone"], fields["email"],
+                    fields["address"], fields["group"]]
+    answers.append("12")
+    return run(["contactbook.py", filename], "\n".join(answers) + "\n")
+
+def cli_per_op(filename, count):
+    elapsed = 0
+    for i in range(count):
+        arguments = [f"--{key}={value}" for key, value in add_fields(i).items()]
+        elapsed += run(["contact_cli.py", "--file", filename, "add", *arguments])
+    return elapsed
+
+def cli_batch(filename, count, operation=lambda i: {"op": "add", **add_fields(i)}):
+    lines = "".join(json.dumps(operation(i)) + "\n" for i in range(count))
+    # contact_cli exits with 1 if any line failed, which the mix should never do
+    return run(["contact_cli.py", "--file", filename, "batch", "-"], lines)
+
+def main():
+    flows = [
+        ("prompts", PROMPT_OPERATIONS, prompts),
+        ("cli per op", PROCESS_OPERATIONS, cli_per_op),
+        ("cli batch", OPERATIONS, cli_batch),
+        ("cli batch, mixed", OPERATIONS,
+         lambda filename, count: cli_batch(filename, count, mixed_operation)),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in (".json", ".db"):
+            print(f"\n{extension} backend, adds unless noted")
+            print(f"{'flow':>17} {'ops':>8} {'time (s)':>9} {'ops/s':>9} "
+                  f"{f'{OPERATIONS // 1000}k ops (s)':>13}")
+            for name, count, flow in flows:
+                filename = os.path.join(directory, name.replace(" ", "_") + extension)
+                elapsed = flow(filename, count)
+                rate = count / elapsed
+                print(f"{name:>17} {count:>8,} {elapsed:>9.2f} {rate:>9,.0f} "
+                      f"{OPERATIONS / rate:>13.1f}")
+
+if __name__ == "__main__":
+    main()
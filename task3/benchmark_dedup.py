@@ -0,0 +1,22 @@
+"""Time duplicate detection on a synthetic book and check it finds the planted duplicates."""
+import time
+
+from contact_dedup import candidate_pairs, contact_features, find_duplicates
+from contact_synthetic import generate_contacts
+
+SIZES = [10_000, 100_000, 1_000_000]
+DUPLICATE_RATE = 0.05
+
+def main():
+    print(f"{'contacts':>9} {'pairs':>9} {'groups':>8} {'duplicates':>11} {'seconds':>8}")
+    for size in SIZES:
+        contacts = generate_contacts(size, DUPLICATE_RATE)
+        start = time.perf_counter()
+        groups = find_duplicates(contacts)
+        elapsed = time.perf_counter() - start
+        pairs = sum(1 for _ in candidate_pairs([contact_features(contact) for contact in contacts]))
+        duplicates = sum(len(group) - 1 for group in groups)
+        print(f"{size:>9} {pairs:>9} {len(groups):>8} {duplicates:>11} {elapsed:>8.1f}")
+
+if __name__ == "__main__":
+    main()
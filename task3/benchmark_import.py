@@ -0,0 +1,48 @@
+"""Time a streaming CSV import and export of a large contact file."""
+import csv
+import os
+import resource
+import tempfile
+import time
+
+from contact_io import export_contacts, import_contacts
+from contactbook import ContactBook
+
+ROWS = 1_000_000
+
+def write_csv(filename, rows):
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "phone", "email", "address", "group"])
+        for i in range(rows):
+            # Every 100th row has a bad phone and every 1000th is a repeat
+            phone = "not-a-phone" if i % 100 == 0 else f"+1555{i:07d}"
+            n = i - 1 if i % 1000 == 2 else i
+            writer.writerow([f"Person {n}", f"+1555{n:07d}" if i % 100 else phone,
+                             f"person{n}@example.com", f"{n} Main Street", "Imported"])
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "contacts.csv")
+        write_csv(source, ROWS)
+        book = ContactBook(os.path.join(directory, "contacts.db"))
+
+        start = time.perf_counter()
+        imported, duplicates, rejected = import_contacts(
+            book, source, os.path.join(directory, "rejects.csv"))
+        elapsed = time.perf_counter() - start
+        print(f"import: {ROWS} rows in {elapsed:.1f}s "
+              f"({ROWS / elapsed:,.0f} rows/s); imported={imported} "
+              f"duplicates={duplicates} rejected={rejected}")
+
+        for extension in ("csv", "vcf", "json"):
+            start = time.perf_counter()
+            export_contacts(book.contacts, os.path.join(directory, f"export.{extension}"))
+            print(f"export .{extension}: {time.perf_counter() - start:.1f}s")
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"peak RSS: {peak / 1024:.0f} MiB")
+        book.storage.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Startup time and peak memory of a 1M-contact JSON book, eager vs. lazy.
+
+Each mode runs in a fresh process. "lazy" reads the .idx sidecar written
+on save; "lazy, no index" rebuilds it by scanning the file first. After
+startup every mode shows the first page and adds one contact.
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from contactbook import Contact, ContactBook
+from contact_lazy import index_filename
+
+CONTACTS = 1_000_000
+MODES = ("eager", "lazy", "lazy, no index")
+
+def make_contacts(count):
+    return [Contact(f"Person {i}", f"+1555{i:07d}", f"person{i}@example.com",
+                    f"{i} Main Street", ("General", "Family", "Work", "Friends")[i % 4])
+            for i in range(count)]
+
+def peak_mb():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def build(filename):
+    book = ContactBook(filename, lazy=False)
+    book.contacts = make_contacts(CONTACTS)
+    book.save_contacts()
+
+def measure(mode, filename):
+    if mode == "lazy, no index" and os.path.exists(index_filename(filename)):
+        os.remove(index_filename(filename))
+    baseline = peak_mb()
+    start = time.perf_counter()
+    book = ContactBook(filename, lazy=mode != "eager")
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    page = book.contacts[:10]
+    contact = Contact("New Person", "+15550000000", "new@example.com", "1 New Road")
+    book.contacts.append(contact)
+    book.storage.insert(book.contacts, contact)
+    book.storage.close()
+    first_edit = time.perf_counter() - start
+    assert len(page) == 10 and len(book.contacts) == CONTACTS + 1
+    print(f"{startup} {first_edit} {peak_mb() - baseline}")
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "contacts.json")
+        print(f"{CONTACTS:,} contacts")
+        print(f"{'mode':>15} {'startup (s)':>12} {'page + add (s)':>15} {'peak (MB)':>10}")
+        for mode in MODES:
+            # Every mode starts from the same freshly saved book, built in
+            # another process so this one's peak memory isn't inherited
+            subprocess.run([sys.executable, __file__, "build", filename], check=True)
+            output = subprocess.run([sys.executable, __file__, mode, filename],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            startup, first_edit, peak = map(float, output)
+            print(f"{mode:>15} {startup:>12.3f} {first_edit:>15.3f} {peak:>10.0f}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "build":
+        build(sys.argv[2])
+    elif len(sys.argv) > 1:
+        measure(sys.argv[1], sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,70 @@
+"""Measure memory and load time of 1M contacts with tracemalloc."""
+import gc
+import json
+import time
+import tracemalloc
+from datetime import datetime
+
+from contactbook import Contact
+
+CONTACTS = 1_000_000
+
+class DictContact:
+    """The original Contact: a per-instance __dict__ and string timestamps."""
+
+    def __init__(self, name, phone, email, address, group="General"):
+        self.name = name
+        self.phone = phone
+        self.email = email
+        self.address = address
+        self.group = group
+        self.created_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.last_modified = self.created_date
+
+    @classmethod
+    def from_dict(cls, contact_data):
+        contact = cls(contact_data["name"], contact_data["phone"],
+                      contact_data["email"], contact_data["address"],
+                      contact_data["group"])
+        contact.created_date = contact_data["created_date"]
+        contact.last_modified = contact_data["last_modified"]
+        return contact
+
+def make_payload(count):
+    return json.dumps([
+        {
+            "name": f"Person {i}",
+            "phone": f"+1555{i:07d}",
+            "email": f"person{i}@example.com",
+            "address": f"{i} Main Street",
+            "group": ("General", "Family", "Work", "Friends")[i % 4],
+            "created_date": "2024-01-01 12:00:00",
+            "last_modified": "2024-06-01 08:30:00"
+        }
+        for i in range(count)
+    ])
+
+def measure(contact_type, payload):
+    gc.collect()
+    start = time.perf_counter()
+    contacts = [contact_type.from_dict(data) for data in json.loads(payload)]
+    load_time = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    contacts = [contact_type.from_dict(data) for data in json.loads(payload)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del contacts
+    return load_time, current
+
+def main():
+    payload = make_payload(CONTACTS)
+    print(f"{'contact type':>14} {'load (s)':>9} {'resident (MiB)':>15}")
+    for name, contact_type in (("dict", DictContact), ("slots", Contact)):
+        load_time, current = measure(contact_type, payload)
+        print(f"{name:>14} {load_time:>9.2f} {current / 2 ** 20:>15.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare search_contact query latency for the linear scan and the trigram index."""
+import random
+import time
+
+from contact_index import TrigramIndex
+from contactbook import Contact
+
+SIZES = [10_000, 100_000, 500_000]
+QUERIES = ["son 4", "rson 123", "5550012", "ada", "zz", "lovelace 9"]
+REPEAT = 5
+
+FIRST_NAMES = ["Ada", "Alan", "Grace", "Linus", "Guido", "Barbara", "Edsger"]
+LAST_NAMES = ["Lovelace", "Turing", "Hopper", "Torvalds", "Rossum", "Liskov", "Dijkstra"]
+
+def make_contacts(count):
+    rng = random.Random(42)
+    return [
+        Contact(
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}son {i}",
+            f"+1555{rng.randrange(10_000_000):07d}",
+            f"person{i}@example.com",
+            f"{i} Main Street"
+        )
+        for i in range(count)
+    ]
+
+def scan(contacts, search_term):
+    return [
+        contact for contact in contacts
+        if search_term in contact.name.lower() or search_term in contact.phone
+    ]
+
+def per_query(func, search_term):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func(search_term)
+    return (time.perf_counter() - start) / REPEAT
+
+def main():
+    print(f"{'contacts':>9} {'query':>12} {'matches':>8} {'scan (ms)':>10} {'index (ms)':>11}")
+    for size in SIZES:
+        contacts = make_contacts(size)
+        index = TrigramIndex()
+        index.rebuild(contacts)
+        for search_term in QUERIES:
+            expected = scan(contacts, search_term)
+            assert index.search(search_term) == expected
+            scan_time = per_query(lambda term: scan(contacts, term), search_term)
+            index_time = per_query(index.search, search_term)
+            print(f"{size:>9} {search_term!r:>12} {len(expected):>8} "
+                  f"{scan_time * 1000:>10.2f} {index_time * 1000:>11.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare startup time and per-edit latency of the JSON and SQLite backends."""
+import os
+import tempfile
+import time
+
+from contactbook import Contact, ContactBook, migrate
+
+CONTACTS = 500_000
+EDITS = 5
+
+def make_contacts(count):
+    contacts = []
+    for i in range(count):
+        contacts.append(Contact(
+            f"Person {i}",
+            f"+1555{i:07d}",
+            f"person{i}@example.com",
+            f"{i} Main Street",
+            ("General", "Family", "Work", "Friends")[i % 4]
+        ))
+    return contacts
+
+def benchmark(filename):
+    start = time.perf_counter()
+    book = ContactBook(filename)
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(EDITS):
+        contact = book.contacts[i * 1000]
+        contact.address = f"{i} Edited Avenue"
+        book.storage.update(book.contacts, contact)
+    edit = (time.perf_counter() - start) / EDITS
+
+    book.storage.close()
+    return startup, edit
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        json_file = os.path.join(directory, "contacts.json")
+        db_file = os.path.join(directory, "contacts.db")
+
+        book = ContactBook(json_file)
+        book.contacts = make_contacts(CONTACTS)
+        book.save_contacts()
+        migrate(json_file, db_file)
+
+        print(f"{'backend':>8} {'startup (s)':>12} {'edit (ms)':>12}")
+        for name, filename in (("json", json_file), ("sqlite", db_file)):
+            startup, edit = benchmark(filename)
+            print(f"{name:>8} {startup:>12.3f} {edit * 1000:>12.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare validation throughput of per-call re.match and the batched API."""
+import re
+import time
+
+from contact_validation import normalize_phone, validate_emails, validate_phones
+
+RECORDS = 1_000_000
+
+def legacy_validate_email(email):
+    pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+    return re.match(pattern, email) is not None
+
+def legacy_validate_phone(phone):
+    pattern = r'^\+?1?\d{9,15}$'
+    return re.match(pattern, phone) is not None
+
+def rate(func):
+    start = time.perf_counter()
+    result = func()
+    return RECORDS / (time.perf_counter() - start), result
+
+def main():
+    phones = [f"+1555{i:07d}" if i % 50 else "555-0100" for i in range(RECORDS)]
+    emails = [f"person{i}@example.com" if i % 50 else "nobody@" for i in range(RECORDS)]
+
+    legacy_rate, legacy = rate(lambda: (
+        [legacy_validate_phone(phone) for phone in phones],
+        [legacy_validate_email(email) for email in emails]))
+    batch_rate, batch = rate(lambda: (validate_phones(phones), validate_emails(emails)))
+    assert legacy == batch
+    normalize_rate, _ = rate(lambda: [normalize_phone(phone) for phone in phones])
+
+    print(f"per-call re.match: {legacy_rate:>12,.0f} records/s")
+    print(f"batched:           {batch_rate:>12,.0f} records/s")
+    print(f"normalize_phone:   {normalize_rate:>12,.0f} records/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Non-interactive command line for the contact book, printing JSON lines.
+
+    python contact_cli.py add --name Ann --phone +15550001111 --email ann@example.com
+    python contact_cli.py list --sort name
+    python contact_cli.py batch ops.jsonl
+
+Each batch line is a JSON object naming an "op" (add, update, delete,
+search or list) plus that command's options, e.g.
+{"op": "update", "number": 3, "group": "Work"}. A batch loads the book
+once, saves it once at the end and keeps going past lines that fail.
+Errors are printed as {"error": ...} lines and make the exit status 1.
+"""
+import argparse
+import os
+import sys
+
+from contactbook import SORT_KEYS, ContactBook
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared import json_codec, metrics
+
+FIELDS = ("name", "phone", "email", "address", "group")
+TEXT_OPTIONS = FIELDS + ("term", "sort")
+
+def contact_record(contact, number=None):
+    record = contact.to_dict()
+    if number is not None:
+        record["number"] = number
+    return record
+
+def run_add(book, name, phone, email, address="", group="General"):
+    contact = book.create_contact(name, phone, email, address, group)
+    return [contact_record(contact, len(book.contacts))]
+
+def run_update(book, number, **fields):
+    return [contact_record(book.edit_contact(number, **fields), number)]
+
+def run_delete(book, number):
+    return [contact_record(book.remove_contact(number))]
+
+def run_search(book, term):
+    return [contact_record(contact) for contact in book.find_contacts(term)]
+
+def run_list(book, sort=None, group=None):
+    contacts = book.list_contacts(sort, group)
+    if contacts is book.contacts:
+        return [contact_record(contact, number) for number, contact in enumerate(contacts, 1)]
+    numbers = {id(contact): number for number, contact in enumerate(book.contacts, 1)}
+    return [contact_record(contact, numbers[id(contact)]) for contact in contacts]
+
+OPERATIONS = {
+    "add": run_add,
+    "update": run_update,
+    "delete": run_delete,
+    "search": run_search,
+    "list": run_list,
+}
+
+def run_operation(book, operation):
+    """Run one {"op": ..., **options} operation and return its output records."""
+    if not isinstance(operation, dict):
+        raise ValueError("Each line must be a JSON object")
+    operation = dict(operation)
+    try:
+        function = OPERATIONS[operation.pop("op")]
+    except (KeyError, TypeError):
+        raise ValueError("Unknown or missing op") from None
+    for key, value in operation.items():
+        if key == "number":
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError("number must be an integer")
+        elif key in TEXT_OPTIONS and value is not None and not isinstance(value, str):
+            raise ValueError(f"{key} must be a string")
+    try:
+        return function(book, **operation)
+    except TypeError as error:
+        raise ValueError(f"Bad options: {error}") from None
+
+def run_batch(book, lines, write):
+    """Run every JSON line of operations inside one book batch; returns the error count."""
+    errors = 0
+    with book.batch():
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                for record in run_operation(book, json_codec.loads(line)):
+                    write(record)
+            except ValueError as error:
+                errors += 1
+                write({"error": str(error), "line": line_number})
+    return errors
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Scriptable contact book; prints JSON lines. "
+                    "Add --profile (or set PROFILE=1) to record timings.")
+    parser.add_argument("--file", default="contacts.json",
+                        help="contact book to use, .json or .db (default: contacts.json)")
+    parser.add_argument("--lazy", action="store_true", default=None,
+                        help="parse JSON contacts only as they are used")
+    commands = parser.add_subparsers(dest="op", required=True)
+
+    add = commands.add_parser("add", help="add a contact")
+    add.add_argument("--name", required=True)
+    add.add_argument("--phone", required=True)
+    add.add_argument("--email", required=True)
+    add.add_argument("--address", default="")
+    add.add_argument("--group", default="General")
+
+    update = commands.add_parser("update", help="change fields of contact NUMBER")
+    update.add_argument("number", type=int)
+    for field in FIELDS:
+        update.add_argument(f"--{field}")
+
+    delete = commands.add_parser("delete", help="delete contact NUMBER")
+    delete.add_argument("number", type=int)
+
+    search = commands.add_parser("search", help="find contacts by name or phone")
+    search.add_argument("term")
+
+    listing = commands.add_parser("list", help="list contacts")
+    listing.add_argument("--sort", choices=sorted(SORT_KEYS))
+    listing.add_argument("--group")
+
+    batch = commands.add_parser("batch", help="run JSON-lines operations from FILE ('-' for stdin)")
+    batch.add_argument("operations")
+    return parser
+
+def write_record(record):
+    sys.stdout.write(json_codec.dumps(record, pretty=False).decode() + "\n")
+
+def main(argv=None):
+    metrics.setup("contact_cli", sys.argv if argv is None else argv)
+    args = vars(build_parser().parse_args(argv))
+    book = ContactBook(args.pop("file"), lazy=args.pop("lazy"))
+    try:
+        if args["op"] == "batch":
+            if args["operations"] == "-":
+                errors = run_batch(book, sys.stdin, write_record)
+            else:
+                with open(args["operations"], "r", encoding="utf-8") as f:
+                    errors = run_batch(book, f, write_record)
+        else:
+            errors = run_batch(book, [json_codec.dumps(args, pretty=False)], write_record)
+    finally:
+        book.storage.close()
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
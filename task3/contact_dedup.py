@@ -0,0 +1,158 @@
+from collections import defaultdict
+
+from contact_validation import normalize_phone
+
+# Pairs scoring at least this much are reported as duplicates
+DUPLICATE_THRESHOLD = 0.6
+# Blocks bigger than this (e.g. one person entered many times, or a very
+# common name) are not compared pair by pair, so the number of candidate
+# pairs stays close to linear in the book size
+MAX_BLOCK_SIZE = 50
+# In an oversized name block, each contact is compared with this many
+# contacts after it in name order
+NAME_WINDOW = 5
+
+SOUNDEX_CODES = {}
+for letters, code in (("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"),
+                      ("l", "4"), ("mn", "5"), ("r", "6")):
+    for letter in letters:
+        SOUNDEX_CODES[letter] = code
+
+def soundex(word):
+    """Classic four-character Soundex code of an alphabetic word."""
+    word = "".join(c for c in word.lower() if c.isalpha())
+    if not word:
+        return ""
+    code = word[0].upper()
+    previous = SOUNDEX_CODES.get(word[0], "")
+    for letter in word[1:]:
+        digit = SOUNDEX_CODES.get(letter, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if letter not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+def name_tokens(name):
+    return sorted("".join(c for c in token if c.isalnum())
+                  for token in name.lower().split())
+
+def name_key(name):
+    """Order-insensitive phonetic key, so "Jon Smith" and "Smyth John" block together."""
+    return " ".join(sorted(filter(None, (soundex(token) for token in name.split()))))
+
+def contact_features(contact):
+    """Normalized (phone, email, name tokens, name key, name order) of a contact.
+
+    Computed once per contact so scoring a pair is only comparisons.
+    """
+    tokens = name_tokens(contact.name)
+    return (normalize_phone(contact.phone), contact.email.strip().lower(),
+            frozenset(tokens), name_key(contact.name), " ".join(tokens))
+
+def blocking_keys(features):
+    phone, email, _, name, _ = features
+    keys = []
+    if phone:
+        keys.append(("phone", phone))
+    if email:
+        keys.append(("email", email))
+    if name:
+        keys.append(("name", name))
+    return keys
+
+def candidate_pairs(features):
+    """Yield (i, j, certain) position pairs, i < j, that share a blocking key.
+
+    features holds contact_features() of each contact. Small blocks yield
+    every pair. An oversized phone or email block is taken to be one
+    person, so it only yields a chain of certain pairs linking its
+    members. An oversized name block is sorted by name and each member is
+    paired with its next NAME_WINDOW neighbours.
+    """
+    blocks = defaultdict(list)
+    for position, contact in enumerate(features):
+        for key in blocking_keys(contact):
+            blocks[key].append(position)
+
+    seen = set()
+    for (kind, _), positions in blocks.items():
+        if len(positions) < 2:
+            continue
+        if len(positions) <= MAX_BLOCK_SIZE:
+            pairs = ((positions[a], positions[b])
+                     for a in range(len(positions)) for b in range(a + 1, len(positions)))
+        elif kind != "name":
+            for a in range(len(positions) - 1):
+                yield positions[a], positions[a + 1], True
+            continue
+        else:
+            positions = sorted(positions, key=lambda position: features[position][4])
+            pairs = ((positions[a], positions[b])
+                     for a in range(len(positions))
+                     for b in range(a + 1, min(a + 1 + NAME_WINDOW, len(positions))))
+        for i, j in pairs:
+            pair = (i, j) if i < j else (j, i)
+            if pair not in seen:
+                seen.add(pair)
+                yield pair + (False,)
+
+def score(first, second):
+    """Similarity between 0 and 1 of two contact_features() from phone, email and name agreement."""
+    first_phone, first_email, first_tokens, first_key, _ = first
+    second_phone, second_email, second_tokens, second_key, _ = second
+    total = 0.0
+    if first_phone and first_phone == second_phone:
+        total += 0.4
+    if first_email and first_email == second_email:
+        total += 0.4
+    if first_tokens and second_tokens:
+        total += 0.2 * len(first_tokens & second_tokens) / len(first_tokens | second_tokens)
+    if first_key == second_key:
+        total += 0.1
+    return min(total, 1.0)
+
+def find_duplicates(contacts, threshold=DUPLICATE_THRESHOLD):
+    """Group duplicate contacts, returning lists of positions in book order."""
+    parent = {}
+
+    def find(position):
+        root = position
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while position != root:
+            parent[position], position = root, parent.get(position, position)
+        return root
+
+    features = [contact_features(contact) for contact in contacts]
+    for i, j, certain in candidate_pairs(features):
+        if certain or score(features[i], features[j]) >= threshold:
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    groups = defaultdict(set)
+    for position in list(parent):
+        root = find(position)
+        groups[root].update((root, position))
+    return sorted(sorted(group) for group in groups.values())
+
+def merge_contacts(contacts):
+    """Fold duplicates into the most recently modified one and return it.
+
+    Empty fields are filled from the others, created keeps the earliest
+    value and modified the latest.
+    """
+    contacts = sorted(contacts, key=lambda contact: contact.modified, reverse=True)
+    keeper = contacts[0]
+    for other in contacts[1:]:
+        for field in ("name", "phone", "email", "address"):
+            if not getattr(keeper, field):
+                setattr(keeper, field, getattr(other, field))
+        if keeper.group == "General":
+            keeper.group = other.group
+    keeper.created = min(contact.created for contact in contacts)
+    keeper.modified = max(contact.modified for contact in contacts)
+    return keeper
@@ -0,0 +1,83 @@
+class GroupIndex:
+    """Maps each group name to its contacts so group queries skip the rest of the book.
+
+    Like TrigramIndex it is built from the contact list on first use.
+    Members are returned in book order using a sequence number assigned
+    when each contact is indexed.
+    """
+
+    def __init__(self):
+        self.reset([])
+
+    def reset(self, contacts):
+        self.contacts = contacts
+        self.built = False
+        self.members = {}
+        self.group_of = {}
+        self.order = {}
+        self.next_order = 0
+
+    def build(self):
+        if self.built:
+            return
+        self.built = True
+        for contact in self.contacts:
+            self.add(contact)
+
+    def add(self, contact):
+        if not self.built:
+            return
+        self.members.setdefault(contact.group, set()).add(contact)
+        self.group_of[contact] = contact.group
+        self.order[contact] = self.next_order
+        self.next_order += 1
+
+    def remove(self, contact):
+        if not self.built:
+            return
+        self._discard(contact, self.group_of.pop(contact))
+        del self.order[contact]
+
+    def update(self, contact):
+        """Re-file a contact whose group attribute has been changed."""
+        if not self.built:
+            return
+        old_group = self.group_of[contact]
+        if old_group != contact.group:
+            self._discard(contact, old_group)
+            self.members.setdefault(contact.group, set()).add(contact)
+            self.group_of[contact] = contact.group
+
+    def _discard(self, contact, group):
+        members = self.members[group]
+        members.discard(contact)
+        if not members:
+            del self.members[group]
+
+    def groups(self):
+        self.build()
+        return set(self.members)
+
+    def sizes(self):
+        self.build()
+        return {group: len(members) for group, members in self.members.items()}
+
+    def get_members(self, group):
+        self.build()
+        return sorted(self.members.get(group, ()), key=self.order.__getitem__)
+
+    def move(self, contacts, new_group):
+        """Put contacts in new_group, returning the ones that changed."""
+        self.build()
+        moved = []
+        for contact in contacts:
+            if contact.group != new_group:
+                contact.group = new_group
+                self.update(contact)
+                moved.append(contact)
+        return moved
+
+    def rename(self, old_group, new_group):
+        """Move every member of old_group into new_group (merging if it exists)."""
+        self.build()
+        return self.move(list(self.members.get(old_group, ())), new_group)
@@ -0,0 +1,100 @@
+class TrigramIndex:
+    """Answers search_contact substring queries from trigram posting lists.
+
+    Names are indexed lowercased and phones as-is, mirroring the linear
+    scan, and every candidate is re-checked so results are identical.
+    The postings are built from the contact list on the first search, so
+    loading or bulk-importing a book does not pay for them up front.
+    """
+
+    def __init__(self):
+        self.reset([])
+
+    def reset(self, contacts):
+        self.contacts = contacts
+        self.built = False
+        self.name_postings = {}
+        self.phone_postings = {}
+        self.keys = {}
+        self.order = {}
+        self.next_order = 0
+
+    @staticmethod
+    def trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, contact):
+        if not self.built:
+            return
+        name_grams = self.trigrams(contact.name.lower())
+        phone_grams = self.trigrams(contact.phone)
+        for gram in name_grams:
+            self.name_postings.setdefault(gram, set()).add(contact)
+        for gram in phone_grams:
+            self.phone_postings.setdefault(gram, set()).add(contact)
+        self.keys[contact] = (name_grams, phone_grams)
+        self.order[contact] = self.next_order
+        self.next_order += 1
+
+    def remove(self, contact):
+        if not self.built:
+            return
+        name_grams, phone_grams = self.keys.pop(contact)
+        del self.order[contact]
+        self._discard(self.name_postings, name_grams, contact)
+        self._discard(self.phone_postings, phone_grams, contact)
+
+    def update(self, contact):
+        if not self.built:
+            return
+        name_grams, phone_grams = self.keys[contact]
+        new_name_grams = self.trigrams(contact.name.lower())
+        new_phone_grams = self.trigrams(contact.phone)
+        self._discard(self.name_postings, name_grams - new_name_grams, contact)
+        self._discard(self.phone_postings, phone_grams - new_phone_grams, contact)
+        for gram in new_name_grams - name_grams:
+            self.name_postings.setdefault(gram, set()).add(contact)
+        for gram in new_phone_grams - phone_grams:
+            self.phone_postings.setdefault(gram, set()).add(contact)
+        self.keys[contact] = (new_name_grams, new_phone_grams)
+
+    def rebuild(self, contacts):
+        self.reset(contacts)
+        self.built = True
+        for contact in contacts:
+            self.add(contact)
+
+    def _discard(self, postings, grams, contact):
+        for gram in grams:
+            posting = postings[gram]
+            posting.discard(contact)
+            if not posting:
+                del postings[gram]
+
+    def _candidates(self, postings, grams):
+        lists = []
+        for gram in grams:
+            posting = postings.get(gram)
+            if not posting:
+                return set()
+            lists.append(posting)
+        lists.sort(key=len)
+        return lists[0].intersection(*lists[1:])
+
+    def search(self, search_term):
+        """Return contacts whose name or phone contains the lowercased term."""
+        if not self.built:
+            self.rebuild(self.contacts)
+        if len(search_term) < 3:
+            # Too short for a trigram; every contact is a candidate
+            candidates = self.order.keys()
+        else:
+            grams = self.trigrams(search_term)
+            candidates = (self._candidates(self.name_postings, grams)
+                          | self._candidates(self.phone_postings, grams))
+        results = [
+            contact for contact in candidates
+            if search_term in contact.name.lower() or search_term in contact.phone
+        ]
+        results.sort(key=self.order.__getitem__)
+        return results
@@ -0,0 +1,162 @@
+import csv
+import json
+import re
+from itertools import islice
+
+from contact_validation import validate_emails, validate_phones
+
+FIELDS = ["name", "phone", "email", "address", "group"]
+BATCH_SIZE = 10_000
+
+def read_csv(filename):
+    """Yield one record per CSV row; a header row names the columns."""
+    with open(filename, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield {field: (row.get(field) or "").strip() for field in FIELDS}
+
+def _vcard_unescape(value):
+    return re.sub(r"\\(.)", lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+def _vcard_escape(value):
+    return (value.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+def _vcard_lines(f):
+    # Undo line folding: a line starting with whitespace continues the previous one
+    previous = None
+    for line in f:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and previous is not None:
+            previous += line[1:]
+            continue
+        if previous is not None:
+            yield previous
+        previous = line
+    if previous is not None:
+        yield previous
+
+def read_vcard(filename):
+    """Yield one record per BEGIN:VCARD ... END:VCARD block."""
+    with open(filename, encoding='utf-8') as f:
+        record = None
+        for line in _vcard_lines(f):
+            key, _, value = line.partition(":")
+            prop = key.split(";", 1)[0].upper()
+            if prop == "BEGIN":
+                record = dict.fromkeys(FIELDS, "")
+            elif record is None:
+                continue
+            elif prop == "END":
+                yield record
+                record = None
+            elif prop == "FN":
+                record["name"] = _vcard_unescape(value).strip()
+            elif prop == "TEL" and not record["phone"]:
+                record["phone"] = value.strip()
+            elif prop == "EMAIL" and not record["email"]:
+                record["email"] = value.strip()
+            elif prop == "ADR" and not record["address"]:
+                parts = [_vcard_unescape(part).strip()
+                         for part in re.split(r"(?<!\\);", value)]
+                record["address"] = ", ".join(part for part in parts if part)
+            elif prop == "CATEGORIES":
+                # The first category; escaped commas are part of its name
+                record["group"] = _vcard_unescape(re.split(r"(?<!\\),", value)[0]).strip()
+
+def read_records(filename):
+    if filename.lower().endswith((".vcf", ".vcard")):
+        return read_vcard(filename)
+    return read_csv(filename)
+
+def _batches(records, size):
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+def import_contacts(book, filename, rejects_filename=None, batch_size=BATCH_SIZE):
+    """Stream contacts from a CSV or vCard file into the book.
+
+    Phones and emails are checked a batch at a time with the same rules
+    as the interactive prompts. Invalid rows go to rejects_filename (with a reason column) and rows
+    already in the book are skipped. The book is persisted once at the end.
+    Returns (imported, duplicates, rejected) counts.
+    """
+    contact_type = book.storage.contact_type
+    seen = {(c.name, c.phone, c.email) for c in book.contacts}
+    new_contacts = []
+    duplicates = rejected = 0
+
+    rejects_file = None
+    rejects_writer = None
+    if rejects_filename:
+        rejects_file = open(rejects_filename, 'w', newline='', encoding='utf-8')
+        rejects_writer = csv.writer(rejects_file)
+        rejects_writer.writerow(FIELDS + ["reason"])
+
+    try:
+        for batch in _batches(read_records(filename), batch_size):
+            phones_ok = validate_phones([record["phone"] for record in batch])
+            emails_ok = validate_emails([record["email"] for record in batch])
+            for record, phone_ok, email_ok in zip(batch, phones_ok, emails_ok):
+                if not record["name"]:
+                    reason = "missing name"
+                elif not phone_ok:
+                    reason = "invalid phone"
+                elif not email_ok:
+                    reason = "invalid email"
+                else:
+                    key = (record["name"], record["phone"], record["email"])
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                    new_contacts.append(contact_type(
+                        record["name"], record["phone"], record["email"],
+                        record["address"], record["group"] or "General"))
+                    continue
+                rejected += 1
+                if rejects_writer:
+                    rejects_writer.writerow([record[field] for field in FIELDS] + [reason])
+    finally:
+        if rejects_file:
+            rejects_file.close()
+
+    with book.storage.lock:
+        book.contacts.extend(new_contacts)
+        for contact in new_contacts:
+            book.index.add(contact)
+            book.groups.add(contact)
+        book.sort_indexes.clear()
+        if new_contacts:
+            book.storage.insert_many(book.contacts, new_contacts)
+    return len(new_contacts), duplicates, rejected
+
+def export_contacts(contacts, filename):
+    """Write contacts to CSV, vCard or JSON one record at a time."""
+    lower = filename.lower()
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        if lower.endswith((".vcf", ".vcard")):
+            for contact in contacts:
+                f.write("BEGIN:VCARD\r\nVERSION:3.0\r\n")
+                f.write(f"FN:{_vcard_escape(contact.name)}\r\n")
+                f.write(f"TEL:{contact.phone}\r\n")
+                f.write(f"EMAIL:{contact.email}\r\n")
+                f.write(f"ADR:;;{_vcard_escape(contact.address)};;;;\r\n")
+                f.write(f"CATEGORIES:{_vcard_escape(contact.group)}\r\n")
+                f.write("END:VCARD\r\n")
+        elif lower.endswith(".json"):
+            f.write("[")
+            for i, contact in enumerate(contacts):
+                f.write(",\n" if i else "\n")
+                f.write(json.dumps(contact.to_dict()))
+            f.write("\n]\n")
+        else:
+            writer = csv.writer(f)
+            writer.writerow(FIELDS + ["created_date", "last_modified"])
+            for contact in contacts:
+                writer.writerow([contact.name, contact.phone, contact.email,
+                                 contact.address, contact.group,
+                                 contact.created_date, contact.last_modified])
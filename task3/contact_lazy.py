@@ -0,0 +1,156 @@
+"""Lazy, memory-mapped access to a JSON contact file written one contact per line."""
+import mmap
+import os
+import re
+import sys
+from array import array
+from collections.abc import MutableSequence
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared import json_codec
+from shared.persistence import atomic_write
+
+GROUP_PATTERN = re.compile(rb'"group":("(?:[^"\\]|\\.)*")')
+
+def encode_contacts(contacts, offsets):
+    """Yield contacts as chunks of a JSON array with one contact per line.
+
+    The (start, end) byte offsets of every contact are appended to offsets
+    as the chunks are produced; they are saved beside the file as its index.
+    """
+    raw_records = getattr(contacts, "raw_records", None)
+    if raw_records:
+        records = raw_records()
+    else:
+        records = (json_codec.dumps(contact.to_dict(), pretty=False) for contact in contacts)
+    yield b"[\n"
+    position = 2
+    for record in records:
+        if position > 2:
+            yield b",\n"
+            position += 2
+        offsets.append(position)
+        position += len(record)
+        offsets.append(position)
+        yield record
+    yield b"\n]\n" if position > 2 else b"]\n"
+
+def index_filename(filename):
+    return filename + ".idx"
+
+def write_index(filename, offsets):
+    atomic_write(index_filename(filename), offsets.tofile, mode="wb")
+
+def scan_offsets(data):
+    """Find each contact line in a one-contact-per-line file, or None if it isn't one."""
+    offsets = array("Q")
+    if data[:2] != b"[\n":
+        return None
+    start = 2
+    end = len(data)
+    while start < end:
+        newline = data.find(b"\n", start)
+        if newline < 0:
+            newline = end
+        if data[start] == ord("]"):
+            return offsets
+        if data[start] != ord("{"):
+            return None
+        stop = newline - 1 if data[newline - 1] == ord(",") else newline
+        offsets.append(start)
+        offsets.append(stop)
+        start = newline + 1
+    return None  # No closing bracket
+
+class LazyContacts(MutableSequence):
+    """A list of contacts that parses each one the first time it is used.
+
+    The file is memory-mapped and the (start, end) offsets of its contacts
+    come from <filename>.idx, rebuilt by scanning for line breaks when it is
+    missing or older than the file. Each slot holds either the number of a
+    not-yet-parsed record or its Contact, which is kept so the same object
+    is returned every time (the search and group indexes rely on that).
+    """
+
+    def __init__(self, data, offsets, contact_type):
+        self.data = data
+        self.offsets = offsets
+        self.contact_type = contact_type
+        self.items = list(range(len(offsets) // 2))
+
+    @classmethod
+    def load(cls, filename, contact_type):
+        """Map filename lazily; returns None if it is not one contact per line."""
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        index = index_filename(filename)
+        if (os.path.exists(index)
+                and os.path.getmtime(index) >= os.path.getmtime(filename)):
+            offsets = array("Q")
+            with open(index, "rb") as f:
+                offsets.frombytes(f.read())
+            if not offsets or offsets[-1] <= len(data):
+                return cls(data, offsets, contact_type)
+        offsets = scan_offsets(data)
+        if offsets is None:
+            data.close()
+            return None
+        write_index(filename, offsets)
+        return cls(data, offsets, contact_type)
+
+    def _hydrate(self, position):
+        item = self.items[position]
+        if isinstance(item, int):
+            record = self.data[self.offsets[2 * item]:self.offsets[2 * item + 1]]
+            item = self.contact_type.from_dict(json_codec.loads(record))
+            self.items[position] = item
+        return item
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._hydrate(i) for i in range(*position.indices(len(self.items)))]
+        if position < 0:
+            position += len(self.items)
+        if not 0 <= position < len(self.items):
+            raise IndexError("contact index out of range")
+        return self._hydrate(position)
+
+    def __setitem__(self, position, value):
+        if isinstance(position, slice):
+            value = list(value)
+        self.items[position] = value
+
+    def __delitem__(self, position):
+        del self.items[position]
+
+    def insert(self, position, contact):
+        self.items.insert(position, contact)
+
+    def extend(self, contacts):
+        self.items.extend(contacts)
+
+    def hydrated_count(self):
+        return sum(1 for item in self.items if not isinstance(item, int))
+
+    def raw_records(self):
+        """Encoded form of each contact; untouched ones are copied byte for byte."""
+        for item in self.items:
+            if isinstance(item, int):
+                yield self.data[self.offsets[2 * item]:self.offsets[2 * item + 1]]
+            else:
+                yield json_codec.dumps(item.to_dict(), pretty=False)
+
+    def group_names(self):
+        """Every group in use, found without parsing the untouched contacts.
+
+        Groups of contacts that were parsed and then edited or deleted may
+        still be reported until the next save.
+        """
+        names = {json_codec.loads(raw) for raw in set(GROUP_PATTERN.findall(self.data))}
+        names.update(item.group for item in self.items if not isinstance(item, int))
+        return names
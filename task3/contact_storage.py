@@ -0,0 +1,366 @@
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from collections import Counter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared import json_codec
+from shared.persistence import JSONFile, file_lock
+
+from contact_lazy import LazyContacts, encode_contacts, index_filename, write_index
+
+# Seconds to hold back JSON rewrites so a burst of edits is saved once
+SAVE_INTERVAL = 1.0
+# Files bigger than this are parsed one contact at a time to halve peak memory
+STREAM_THRESHOLD = 50_000_000
+# Files bigger than this are opened lazily (see contact_lazy) unless told otherwise
+LAZY_THRESHOLD = 10_000_000
+
+class ContactFile(JSONFile):
+    """Saves contacts one per line, with the offset index LazyContacts reads.
+
+    If another process replaced the file since this one last read or wrote
+    it, merge(contacts, base) is called before writing, with base the bytes
+    of the file as this process last saw it.
+    """
+
+    def __init__(self, filename, merge, **options):
+        super().__init__(filename, **options)
+        self.merge = merge
+        self.seen = False  # Whether remember() has run
+        self.base = None  # The file as last read or written here
+        self.base_stat = None
+
+    def remember(self):
+        """Keep the current file as the base to merge against; the caller holds the lock."""
+        self.forget()
+        self.seen = True
+        try:
+            self.base = open(self.filename, "rb")
+        except FileNotFoundError:
+            return
+        self.base_stat = os.fstat(self.base.fileno())
+        if os.name != "posix":
+            # Windows can't replace a file that is open, so keep a copy instead
+            with self.base:
+                self.base = self.base.read()
+
+    def forget(self):
+        if self.base is not None and not isinstance(self.base, bytes):
+            self.base.close()
+        self.base = None
+
+    def base_data(self):
+        if self.base is None or isinstance(self.base, bytes):
+            return self.base
+        self.base.seek(0)
+        return self.base.read()
+
+    def replaced(self):
+        """Whether another process wrote the file since remember()."""
+        if not self.seen:
+            return False  # Never loaded, e.g. the destination of a migration
+        try:
+            current = os.stat(self.filename)
+        except FileNotFoundError:
+            return False
+        if self.base is None:
+            return True
+        if isinstance(self.base, bytes):
+            return ((current.st_mtime_ns, current.st_size)
+                    != (self.base_stat.st_mtime_ns, self.base_stat.st_size))
+        # The base is held open, so no other file can take its inode number
+        return ((current.st_dev, current.st_ino)
+                != (self.base_stat.st_dev, self.base_stat.st_ino))
+
+    def encode(self, contacts):
+        if self.pretty or (self.pretty is None and json_codec.PRETTY):
+            self.offsets = None
+            return super().encode([contact.to_dict() for contact in contacts])
+        self.offsets = array("Q")
+        return encode_contacts(contacts, self.offsets)
+
+    def _write(self, contacts):
+        if self.replaced():
+            contacts = self.merge(contacts, self.base_data())
+        super()._write(contacts)
+        if self.offsets is not None:
+            write_index(self.filename, self.offsets)
+        elif os.path.exists(index_filename(self.filename)):
+            os.remove(index_filename(self.filename))
+        self.remember()
+
+    def close(self):
+        super().close()
+        self.forget()
+
+class JSONStorage:
+    """Keeps the whole book in one JSON file, rewritten atomically after changes.
+
+    With lazy=True (or None and a file over LAZY_THRESHOLD) load() returns
+    a LazyContacts that parses contacts only as they are used.
+
+    Changes other processes saved in the meantime are merged in before each
+    write (see merge); on_merge(removed, added), if set, is told which
+    contacts that took out of or put into the list.
+    """
+
+    def __init__(self, filename, contact_type, lazy=None):
+        self.filename = filename
+        self.contact_type = contact_type
+        self.lazy = lazy
+        self.file = ContactFile(filename, self.merge, interval=SAVE_INTERVAL)
+        # Held while changing contacts, since a scheduled save reads them
+        # from the timer thread
+        self.lock = self.file.lock
+        self.on_merge = None
+
+    def load(self):
+        # Locked so the base kept for merging is the file that was read
+        with self.lock, file_lock(self.filename):
+            contacts = self._load()
+            self.file.remember()
+        return contacts
+
+    def _load(self):
+        if not os.path.exists(self.filename):
+            return []
+        size = os.path.getsize(self.filename)
+        if self.lazy or (self.lazy is None and size > LAZY_THRESHOLD):
+            contacts = LazyContacts.load(self.filename, self.contact_type)
+            if contacts is not None:
+                return contacts
+        try:
+            if size > STREAM_THRESHOLD:
+                with open(self.filename, 'r', encoding='utf-8') as f:
+                    return [self.contact_type.from_dict(contact_data)
+                            for contact_data in json_codec.iter_array(f)]
+            with open(self.filename, 'rb') as f:
+                data = json_codec.loads(f.read())
+        except ValueError:
+            print("Error loading contacts file!")
+            return []
+        return [self.contact_type.from_dict(contact_data) for contact_data in data]
+
+    def save(self, contacts):
+        self.file.save(contacts)
+
+    def merge(self, contacts, base):
+        """Fold changes saved by other processes into contacts, in place.
+
+        Whole records are compared between base (the file this process last
+        read or wrote), the file now and contacts. A record that left the
+        file was deleted or edited elsewhere, so an unchanged copy of it is
+        dropped here; a record that arrived was added or edited elsewhere.
+        Edits (same created_date and name, phone or email) take the old
+        version's place and additions are appended. A contact edited in both places keeps both versions.
+        """
+        try:
+            with open(self.filename, "rb") as f:
+                current = json_codec.loads(f.read())
+            base = json_codec.loads(base) if base else []
+        except ValueError:
+            return contacts  # Not a contact file we can read; ours replaces it
+
+        def key(record):
+            return tuple(sorted(record.items()))
+
+        base_keys = Counter(key(record) for record in base)
+        current_keys = Counter(key(record) for record in current)
+        gone = base_keys - current_keys
+        arrived = current_keys - base_keys
+        if not gone and not arrived:
+            return contacts
+        new_records = []
+        for record in current:
+            if arrived[key(record)]:
+                arrived[key(record)] -= 1
+                new_records.append(record)
+        edits = {}  # created_date -> new records that may be edits of an old one
+        for record in new_records:
+            edits.setdefault(record["created_date"], []).append(record)
+        kept, removed, added = [], [], []
+        placed = set()  # ids of the new records already put in an old one's place
+        for contact in contacts:
+            record = contact.to_dict()
+            if not gone[key(record)]:
+                kept.append(contact)
+                continue
+            gone[key(record)] -= 1
+            removed.append(contact)
+            for new_record in edits.get(record["created_date"], ()):
+                if id(new_record) not in placed and any(
+                        new_record[field] == record[field] for field in ("name", "phone", "email")):
+                    placed.add(id(new_record))
+                    added.append(self.contact_type.from_dict(new_record))
+                    kept.append(added[-1])
+                    break
+        for record in new_records:
+            if id(record) not in placed:
+                added.append(self.contact_type.from_dict(record))
+                kept.append(added[-1])
+        contacts[:] = kept
+        if self.on_merge:
+            self.on_merge(removed, added)
+        return contacts
+
+    def _changed(self, contacts):
+        # Rapid successive edits are coalesced into one rewrite
+        self.file.schedule(lambda: contacts)
+
+    def insert(self, contacts, contact):
+        self._changed(contacts)
+
+    def insert_many(self, contacts, new_contacts):
+        self._changed(contacts)
+
+    def update(self, contacts, contact):
+        self._changed(contacts)
+
+    def delete(self, contacts, contact):
+        self._changed(contacts)
+
+    def update_many(self, contacts, changed_contacts):
+        self._changed(contacts)
+
+    def delete_many(self, contacts, removed_contacts):
+        self._changed(contacts)
+
+    def apply_batch(self, contacts, added, updated, deleted):
+        self.save(contacts)
+
+    def close(self):
+        self.file.close()
+
+    def report(self):
+        """One-line summary of save latency."""
+        return self.file.report()
+
+class SQLiteStorage:
+    """Keeps one row per contact so each change touches a single row."""
+
+    COLUMNS = ("name", "phone", "email", "address", "group",
+               "created_date", "last_modified")
+    COLUMN_LIST = ", ".join(f'"{column}"' for column in COLUMNS)
+    INSERT_SQL = f"INSERT INTO contacts ({COLUMN_LIST}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    INSERT_WITH_ID_SQL = (f"INSERT INTO contacts (id, {COLUMN_LIST}) "
+                          f"VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+
+    def __init__(self, filename, contact_type):
+        self.filename = filename
+        self.contact_type = contact_type
+        self.lock = threading.RLock()  # Same interface as JSONStorage; nothing runs in the background
+        self.conn = sqlite3.connect(filename)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS contacts (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    phone TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    address TEXT NOT NULL,
+                    "group" TEXT NOT NULL,
+                    created_date TEXT NOT NULL,
+                    last_modified TEXT NOT NULL
+                )
+            """)
+            for column in ("name", "phone", "email", "group"):
+                self.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_contacts_{column} '
+                    f'ON contacts ("{column}")'
+                )
+
+    def _values(self, contact):
+        data = contact.to_dict()
+        return tuple(data[column] for column in self.COLUMNS)
+
+    def load(self):
+        rows = self.conn.execute(
+            f"SELECT id, {self.COLUMN_LIST} FROM contacts ORDER BY id"
+        )
+        contacts = []
+        for row in rows:
+            contact = self.contact_type.from_dict(dict(zip(self.COLUMNS, row[1:])))
+            contact.id = row[0]
+            contacts.append(contact)
+        return contacts
+
+    def save(self, contacts):
+        with self.conn:
+            self.conn.execute("DELETE FROM contacts")
+            self._insert_batch(contacts, 1)
+
+    def insert(self, contacts, contact):
+        with self.conn:
+            cursor = self.conn.execute(self.INSERT_SQL, self._values(contact))
+        contact.id = cursor.lastrowid
+
+    def insert_many(self, contacts, new_contacts):
+        with self.conn:
+            self._insert_batch(new_contacts, self._next_id())
+
+    def _next_id(self):
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM contacts").fetchone()[0]
+
+    def _insert_batch(self, contacts, first_id):
+        # Assign ids up front so the rows can go through a single executemany
+        for contact_id, contact in enumerate(contacts, first_id):
+            contact.id = contact_id
+        self.conn.executemany(
+            self.INSERT_WITH_ID_SQL,
+            ((contact.id,) + self._values(contact) for contact in contacts)
+        )
+
+    # Like _insert_batch these don't commit; callers wrap them in `with self.conn`
+
+    def _update_rows(self, changed_contacts):
+        assignments = ", ".join(f'"{column}" = ?' for column in self.COLUMNS)
+        self.conn.executemany(
+            f"UPDATE contacts SET {assignments} WHERE id = ?",
+            (self._values(contact) + (contact.id,) for contact in changed_contacts)
+        )
+
+    def _delete_rows(self, removed_contacts):
+        self.conn.executemany(
+            "DELETE FROM contacts WHERE id = ?",
+            ((contact.id,) for contact in removed_contacts)
+        )
+
+    def update(self, contacts, contact):
+        with self.conn:
+            self._update_rows([contact])
+
+    def delete(self, contacts, contact):
+        with self.conn:
+            self._delete_rows([contact])
+
+    def update_many(self, contacts, changed_contacts):
+        with self.conn:
+            self._update_rows(changed_contacts)
+
+    def delete_many(self, contacts, removed_contacts):
+        with self.conn:
+            self._delete_rows(removed_contacts)
+
+    def apply_batch(self, contacts, added, updated, deleted):
+        """Apply a batch of changes in a single transaction."""
+        with self.conn:
+            self._delete_rows(deleted)
+            self._update_rows(updated)
+            self._insert_batch(added, self._next_id())
+
+    def close(self):
+        self.conn.close()
+
+    def report(self):
+        return None  # Each change is a single row write; nothing to summarize
+
+def open_storage(filename, contact_type, lazy=None):
+    """Pick the storage backend from the file extension."""
+    if filename.endswith((".db", ".sqlite", ".sqlite3")):
+        return SQLiteStorage(filename, contact_type)
+    return JSONStorage(filename, contact_type, lazy)
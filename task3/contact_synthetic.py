@@ -0,0 +1,52 @@
+"""Synthetic contact books with known duplicates, for tests and benchmarks."""
+import random
+
+from contactbook import Contact
+
+FIRST_NAMES = ["Ada", "Alan", "Grace", "Linus", "Guido", "Barbara", "Edsger",
+               "Donald", "Margaret", "Ken", "Dennis", "Frances", "John", "Radia"]
+LAST_NAMES = ["Lovelace", "Turing", "Hopper", "Torvalds", "Rossum", "Liskov",
+              "Dijkstra", "Knuth", "Hamilton", "Thompson", "Ritchie", "Allen",
+              "Backus", "Perlman"]
+GROUPS = ["General", "Family", "Work", "Friends"]
+
+def _variant(rng, contact):
+    """A copy of contact as a person might re-enter it."""
+    name = contact.name
+    phone = contact.phone
+    email = contact.email
+    change = rng.randrange(4)
+    if change == 0:
+        first, _, rest = name.partition(" ")
+        name = f"{rest} {first}"
+    elif change == 1:
+        phone = phone.lstrip("+")
+    elif change == 2:
+        email = email.upper()
+    else:
+        name = name.lower()
+    return Contact(name, phone, email, contact.address, contact.group,
+                   contact.created + rng.randrange(1, 10 ** 6),
+                   contact.modified + rng.randrange(1, 10 ** 6))
+
+def generate_contacts(count, duplicate_rate=0.05, seed=0):
+    """Return count contacts where about duplicate_rate of them re-enter an earlier one."""
+    rng = random.Random(seed)
+    contacts = []
+    for i in range(count):
+        if contacts and rng.random() < duplicate_rate:
+            contacts.append(_variant(rng, rng.choice(contacts)))
+            continue
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        created = 1_600_000_000 + rng.randrange(10 ** 8)
+        contacts.append(Contact(
+            f"{first} {last} {i}",
+            f"+1{rng.randrange(2_000_000_000, 9_999_999_999)}",
+            f"{first.lower()}.{last.lower()}{i}@example.com",
+            f"{rng.randrange(1, 9999)} {last} Street",
+            rng.choice(GROUPS),
+            created,
+            created + rng.randrange(10 ** 7)
+        ))
+    return contacts
@@ -0,0 +1,58 @@
+import re
+
+EMAIL_PATTERN = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+PHONE_PATTERN = re.compile(r'^\+?1?\d{9,15}$')
+# Separators people type inside phone numbers
+PHONE_PUNCTUATION = re.compile(r'[\s().-]')
+# Country code assumed for ten-digit numbers written without one
+DEFAULT_COUNTRY_CODE = "1"
+
+def is_valid_email(email):
+    return EMAIL_PATTERN.match(email) is not None
+
+def is_valid_phone(phone):
+    return PHONE_PATTERN.match(phone) is not None
+
+def validate_emails(emails):
+    """Validate a column of emails, returning one bool per value."""
+    match = EMAIL_PATTERN.match
+    return [match(email) is not None for email in emails]
+
+def validate_phones(phones):
+    """Validate a column of phone numbers, returning one bool per value."""
+    match = PHONE_PATTERN.match
+    return [match(phone) is not None for phone in phones]
+
+def normalize_phone(phone):
+    """Return a canonical +<country><number> key, or None if it has no digits.
+
+    Formatting characters are dropped and a leading 00 is read as +, so
+    "+1 (555) 123-4567", "001-555-123-4567" and "5551234567" share a key.
+    """
+    digits = PHONE_PUNCTUATION.sub("", phone)
+    if digits.startswith("+"):
+        digits = digits[1:]
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif len(digits) == 10:
+        digits = DEFAULT_COUNTRY_CODE + digits
+    if not digits.isdigit():
+        return None
+    return "+" + digits
+
+def find_invalid(contacts):
+    """Return (position, contact, problems) for every contact failing validation."""
+    phones_ok = validate_phones([contact.phone for contact in contacts])
+    emails_ok = validate_emails([contact.email for contact in contacts])
+    invalid = []
+    for position, (contact, phone_ok, email_ok) in enumerate(
+            zip(contacts, phones_ok, emails_ok), 1):
+        if phone_ok and email_ok:
+            continue
+        problems = []
+        if not phone_ok:
+            problems.append("invalid phone")
+        if not email_ok:
+            problems.append("invalid email")
+        invalid.append((position, contact, problems))
+    return invalid
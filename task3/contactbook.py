@@ -1,17 +1,57 @@
-import json
-import re
+import contextlib
+import csv
 import os
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
+
+from contact_dedup import find_duplicates, merge_contacts
+from contact_groups import GroupIndex
+from contact_index import TrigramIndex
+from contact_io import export_contacts, import_contacts
+from contact_storage import open_storage
+from contact_validation import find_invalid, is_valid_email, is_valid_phone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared import metrics
+
+# Timestamps are kept as whole seconds of local wall-clock time since this
+# moment, which round-trips the on-disk "%Y-%m-%d %H:%M:%S" strings exactly
+EPOCH = datetime(1970, 1, 1)
+
+def now_timestamp():
+    return int((datetime.now() - EPOCH).total_seconds())
+
+def parse_timestamp(text):
+    return int((datetime.fromisoformat(text) - EPOCH).total_seconds())
+
+def format_timestamp(seconds):
+    return (EPOCH + timedelta(seconds=seconds)).isoformat(" ")
 
 class Contact:
-    def __init__(self, name, phone, email, address, group="General"):
+    __slots__ = ("id", "name", "phone", "email", "address", "group",
+                 "created", "modified")
+
+    def __init__(self, name, phone, email, address, group="General",
+                 created=None, modified=None):
+        self.id = None
         self.name = name
         self.phone = phone
         self.email = email
         self.address = address
-        self.group = group
-        self.created_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.last_modified = self.created_date
+        self.group = sys.intern(group)
+        self.created = now_timestamp() if created is None else created
+        self.modified = self.created if modified is None else modified
+
+    @property
+    def created_date(self):
+        return format_timestamp(self.created)
+
+    @property
+    def last_modified(self):
+        return format_timestamp(self.modified)
+
+    def touch(self):
+        self.modified = now_timestamp()
 
     def to_dict(self):
         return {
@@ -24,19 +64,173 @@ class Contact:
             "last_modified": self.last_modified
         }
 
+    @classmethod
+    def from_dict(cls, contact_data):
+        return cls(
+            contact_data["name"],
+            contact_data["phone"],
+            contact_data["email"],
+            contact_data["address"],
+            contact_data["group"],
+            parse_timestamp(contact_data["created_date"]),
+            parse_timestamp(contact_data["last_modified"])
+        )
+
+# Contacts shown per page when a list is longer than one page
+PAGE_SIZE = 10
+
+SORT_KEYS = {
+    "name": lambda contact: contact.name.lower(),
+    "phone": lambda contact: contact.phone,
+    "email": lambda contact: contact.email.lower(),
+    "group": lambda contact: contact.group,
+    "created": lambda contact: contact.created,
+    "modified": lambda contact: contact.modified,
+}
+
+def format_contact(number, contact):
+    return (f"\n{number}. Name: {contact.name}\n"
+            f"   Phone: {contact.phone}\n"
+            f"   Email: {contact.email}\n"
+            f"   Address: {contact.address}\n"
+            f"   Group: {contact.group}\n"
+            f"   Created: {contact.created_date}\n"
+            f"   Last Modified: {contact.last_modified}\n")
+
+def check_text(**fields):
+    """Raise ValueError unless every given field is a string (or None)."""
+    for field, value in fields.items():
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{field.capitalize()} must be text!")
+
 class ContactBook:
-    def __init__(self):
+    def __init__(self, filename="contacts.json", lazy=None):
         self.contacts = []
-        self.filename = "contacts.json"
+        self.filename = filename
+        # lazy: parse JSON contacts only when used (None = for large files)
+        self.storage = open_storage(filename, Contact, lazy)
+        self.storage.on_merge = self._merged
+        # Bumped when contacts saved by another program are merged in, which
+        # can renumber the list
+        self.merges = 0
+        self.index = TrigramIndex()
+        self.groups = GroupIndex()
+        # Sorted views of self.contacts by SORT_KEYS name, dropped on any change
+        self.sort_indexes = {}
+        # Contacts added/updated/deleted inside batch(), saved when it ends
+        self.batch_changes = None
         self.load_contacts()
 
     def validate_email(self, email):
-        pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        return re.match(pattern, email) is not None
+        return is_valid_email(email)
 
     def validate_phone(self, phone):
-        pattern = r'^\+?1?\d{9,15}$'
-        return re.match(pattern, phone) is not None
+        return is_valid_phone(phone)
+
+    # Scriptable API: these take arguments, return contacts and raise
+    # ValueError instead of prompting and printing (see contact_cli.py)
+
+    def create_contact(self, name, phone, email, address="", group="General"):
+        check_text(name=name, phone=phone, email=email, address=address, group=group)
+        if not self.validate_phone(phone):
+            raise ValueError("Invalid phone number!")
+        if not self.validate_email(email):
+            raise ValueError("Invalid email format!")
+        contact = Contact(name, phone, email, address, group or "General")
+        with self.storage.lock:
+            self.contacts.append(contact)
+            self.index.add(contact)
+            self.groups.add(contact)
+            self.sort_indexes.clear()
+            self._store("insert", contact)
+        return contact
+
+    def get_contact(self, number):
+        """The contact shown as `number` in the entry-order list (1-based)."""
+        if not 1 <= number <= len(self.contacts):
+            raise ValueError("Invalid contact number!")
+        return self.contacts[number - 1]
+
+    def edit_contact(self, number, name=None, phone=None, email=None,
+                     address=None, group=None):
+        """Change the given fields of a contact; empty or None ones are kept."""
+        check_text(name=name, phone=phone, email=email, address=address, group=group)
+        contact = self.get_contact(number)
+        if phone and not self.validate_phone(phone):
+            raise ValueError("Invalid phone number!")
+        if email and not self.validate_email(email):
+            raise ValueError("Invalid email format!")
+        with self.storage.lock:
+            if name:
+                contact.name = name
+            if phone:
+                contact.phone = phone
+            if email:
+                contact.email = email
+            if address:
+                contact.address = address
+            if group:
+                contact.group = sys.intern(group)
+            contact.touch()
+            self.index.update(contact)
+            self.groups.update(contact)
+            self.sort_indexes.clear()
+            self._store("update", contact)
+        return contact
+
+    def remove_contact(self, number):
+        self.get_contact(number)
+        with self.storage.lock:
+            contact = self.contacts.pop(number - 1)
+            self.index.remove(contact)
+            self.groups.remove(contact)
+            self.sort_indexes.clear()
+            self._store("delete", contact)
+        return contact
+
+    @metrics.timed("search")
+    def find_contacts(self, term):
+        """Contacts whose name or phone contains term (case-insensitive)."""
+        check_text(term=term)
+        return self.index.search(term.lower())
+
+    def list_contacts(self, sort_key=None, group=None):
+        if sort_key and sort_key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort_key}")
+        if group:
+            members = self.groups.get_members(group)
+            return sorted(members, key=SORT_KEYS[sort_key]) if sort_key else members
+        return self.sorted_contacts(sort_key)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Run many API calls with a single storage write when the block ends."""
+        self.batch_changes = ({}, {}, {})  # Added, updated, deleted (insertion-ordered)
+        try:
+            yield self
+        finally:
+            added, updated, deleted = self.batch_changes
+            self.batch_changes = None
+            if added or updated or deleted:
+                with metrics.measure("save batch"):
+                    self.storage.apply_batch(self.contacts, list(added), list(updated), list(deleted))
+
+    def _store(self, change, contact):
+        metrics.count(change)
+        if self.batch_changes is None:
+            getattr(self.storage, change)(self.contacts, contact)
+            return
+        added, updated, deleted = self.batch_changes
+        if change == "insert":
+            added[contact] = True
+        elif change == "update":
+            if contact not in added:
+                updated[contact] = True
+        elif contact in added:
+            del added[contact]
+        else:
+            updated.pop(contact, None)
+            deleted[contact] = True
 
     def add_contact(self):
         print("\n=== Add New Contact ===")
@@ -59,28 +253,70 @@ class ContactBook:
         print("\nAvailable groups:", self.get_all_groups())
         group = input("Enter group name (or press Enter for 'General'): ").strip() or "General"
         
-        contact = Contact(name, phone, email, address, group)
-        self.contacts.append(contact)
-        self.save_contacts()
+        self.create_contact(name, phone, email, address, group)
         print("Contact added successfully!")
 
-    def view_contacts(self):
+    def view_contacts(self, sort_key=None):
         if not self.contacts:
             print("\nNo contacts found!")
             return
 
         print("\n=== Contact List ===")
-        self.display_contacts(self.contacts)
+        self.display_contacts(self.sorted_contacts(sort_key))
+
+    def browse_contacts(self):
+        if not self.contacts:
+            print("\nNo contacts found!")
+            return
+
+        print("\nSort by:", ", ".join(SORT_KEYS))
+        sort_key = input("Enter sort key (or press Enter for entry order): ").strip().lower()
+        if sort_key and sort_key not in SORT_KEYS:
+            print("Unknown sort key, showing contacts in entry order.")
+            sort_key = None
+        self.view_contacts(sort_key or None)
+
+    @metrics.timed("sort")
+    def sorted_contacts(self, sort_key):
+        if not sort_key:
+            return self.contacts
+        if sort_key not in self.sort_indexes:
+            self.sort_indexes[sort_key] = sorted(self.contacts, key=SORT_KEYS[sort_key])
+        return self.sort_indexes[sort_key]
 
+    @metrics.timed("render")
     def display_contacts(self, contacts_to_display):
-        for i, contact in enumerate(contacts_to_display, 1):
-            print(f"\n{i}. Name: {contact.name}")
-            print(f"   Phone: {contact.phone}")
-            print(f"   Email: {contact.email}")
-            print(f"   Address: {contact.address}")
-            print(f"   Group: {contact.group}")
-            print(f"   Created: {contact.created_date}")
-            print(f"   Last Modified: {contact.last_modified}")
+        pages = (len(contacts_to_display) + PAGE_SIZE - 1) // PAGE_SIZE
+        page = 0
+        while True:
+            # Only the contacts on this page are formatted, in one write
+            start = page * PAGE_SIZE
+            text = "".join(
+                format_contact(number, contact)
+                for number, contact in enumerate(
+                    contacts_to_display[start:start + PAGE_SIZE], start + 1)
+            )
+            if pages > 1:
+                text += f"\n--- Page {page + 1} of {pages} ---\n"
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            if pages <= 1:
+                return
+
+            command = input("[n]ext, [p]rev, [j]ump <page>, [q]uit: ").strip().lower()
+            if command == "" and page == pages - 1:
+                return
+            if command in ("", "n"):
+                page = min(page + 1, pages - 1)
+            elif command == "p":
+                page = max(page - 1, 0)
+            elif command.startswith("j"):
+                try:
+                    page = min(max(int(command[1:]) - 1, 0), pages - 1)
+                except ValueError:
+                    print("Please enter a page number, e.g. j 3")
+            elif command == "q":
+                return
 
     def search_contact(self):
         if not self.contacts:
@@ -88,12 +324,9 @@ class ContactBook:
             return
 
         print("\n=== Search Contact ===")
-        search_term = input("Enter name or phone number to search: ").lower()
+        search_term = input("Enter name or phone number to search: ")
         
-        results = [
-            contact for contact in self.contacts
-            if search_term in contact.name.lower() or search_term in contact.phone
-        ]
+        results = self.find_contacts(search_term)
         
         if results:
             print(f"\nFound {len(results)} matching contacts:")
@@ -107,6 +340,7 @@ class ContactBook:
             return
 
         print("\n=== Update Contact ===")
+        merges = self.merges
         self.view_contacts()
         try:
             index = int(input("\nEnter the number of the contact to update: ")) - 1
@@ -115,38 +349,27 @@ class ContactBook:
                 print("\nLeave blank to keep current value")
                 
                 name = input(f"Current name: {contact.name}\nNew name: ").strip()
-                if name:
-                    contact.name = name
                 
                 while True:
                     phone = input(f"Current phone: {contact.phone}\nNew phone: ").strip()
-                    if not phone:
-                        break
-                    if self.validate_phone(phone):
-                        contact.phone = phone
+                    if not phone or self.validate_phone(phone):
                         break
                     print("Invalid phone number!")
                 
                 while True:
                     email = input(f"Current email: {contact.email}\nNew email: ").strip()
-                    if not email:
-                        break
-                    if self.validate_email(email):
-                        contact.email = email
+                    if not email or self.validate_email(email):
                         break
                     print("Invalid email format!")
                 
                 address = input(f"Current address: {contact.address}\nNew address: ").strip()
-                if address:
-                    contact.address = address
                 
                 print("\nAvailable groups:", self.get_all_groups())
                 group = input(f"Current group: {contact.group}\nNew group: ").strip()
-                if group:
-                    contact.group = group
                 
-                contact.last_modified = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.save_contacts()
+                if self._renumbered(merges):
+                    return
+                self.edit_contact(index + 1, name, phone, email, address, group)
                 print("Contact updated successfully!")
             else:
                 print("Invalid contact number!")
@@ -159,12 +382,14 @@ class ContactBook:
             return
 
         print("\n=== Delete Contact ===")
+        merges = self.merges
         self.view_contacts()
         try:
             index = int(input("\nEnter the number of the contact to delete: ")) - 1
+            if self._renumbered(merges):
+                return
             if 0 <= index < len(self.contacts):
-                contact = self.contacts.pop(index)
-                self.save_contacts()
+                contact = self.remove_contact(index + 1)
                 print(f"Contact '{contact.name}' deleted successfully!")
             else:
                 print("Invalid contact number!")
@@ -181,42 +406,277 @@ class ContactBook:
         print("Available groups:", groups)
         group = input("Enter group name to view (or press Enter for all): ").strip()
         
-        filtered_contacts = [c for c in self.contacts if not group or c.group == group]
+        if group:
+            filtered_contacts = self.groups.get_members(group)
+        else:
+            filtered_contacts = self.contacts
         if filtered_contacts:
             self.display_contacts(filtered_contacts)
         else:
             print("No contacts found in this group!")
 
+    def import_contacts(self):
+        print("\n=== Import Contacts ===")
+        filename = input("Enter CSV or vCard file to import: ").strip()
+        rejects = input("Enter file for rejected rows (or press Enter to skip): ").strip()
+        try:
+            with metrics.measure("import"):
+                imported, duplicates, rejected = import_contacts(self, filename, rejects or None)
+        except (OSError, ValueError, csv.Error) as e:
+            # ValueError covers files that aren't UTF-8 (UnicodeDecodeError)
+            print(f"Could not import contacts: {e}")
+            return
+        print(f"Imported {imported} contacts "
+              f"({duplicates} duplicates skipped, {rejected} rejected).")
+
+    def export_contacts(self):
+        if not self.contacts:
+            print("\nNo contacts to export!")
+            return
+
+        print("\n=== Export Contacts ===")
+        filename = input("Enter file to export to (.csv, .vcf or .json): ").strip()
+        try:
+            with metrics.measure("export"):
+                export_contacts(self.contacts, filename)
+        except OSError as e:
+            print(f"Could not export contacts: {e}")
+            return
+        print(f"Exported {len(self.contacts)} contacts to {filename}.")
+
+    def validate_contacts(self):
+        if not self.contacts:
+            print("\nNo contacts to validate!")
+            return
+
+        print("\n=== Validate Contacts ===")
+        with metrics.measure("validate"):
+            invalid = find_invalid(self.contacts)
+        for position, contact, problems in invalid:
+            print(f"{position}. {contact.name} ({contact.phone}, {contact.email}): "
+                  f"{', '.join(problems)}")
+        print(f"\n{len(invalid)} of {len(self.contacts)} contacts have invalid fields.")
+
+    def merge_duplicates(self):
+        if not self.contacts:
+            print("\nNo contacts to check!")
+            return
+
+        print("\n=== Merge Duplicate Contacts ===")
+        with metrics.measure("dedup"):
+            groups = find_duplicates(self.contacts)
+        if not groups:
+            print("No duplicate contacts found!")
+            return
+        print(f"Found {len(groups)} sets of likely duplicates.")
+
+        kept, removed = [], []
+        merge_all = False
+        for positions in groups:
+            duplicates = [self.contacts[position] for position in positions]
+            if not merge_all:
+                self.display_contacts(duplicates)
+                answer = input("\nMerge these contacts? (y/n, a = all, q = stop): ").lower()
+                if answer == 'q':
+                    break
+                if answer == 'a':
+                    merge_all = True
+                elif answer != 'y':
+                    continue
+            with self.storage.lock:
+                keeper = merge_contacts(duplicates)
+            kept.append(keeper)
+            removed.extend(contact for contact in duplicates if contact is not keeper)
+
+        if not kept:
+            print("No contacts merged.")
+            return
+        removed_set = set(removed)
+        with self.storage.lock:
+            self.contacts[:] = [c for c in self.contacts if c not in removed_set]
+            for contact in removed:
+                self.index.remove(contact)
+                self.groups.remove(contact)
+            for contact in kept:
+                self.index.update(contact)
+                self.groups.update(contact)
+            self.sort_indexes.clear()
+            self.storage.delete_many(self.contacts, removed)
+            self.storage.update_many(self.contacts, kept)
+        print(f"Merged {len(removed) + len(kept)} contacts into {len(kept)}.")
+
     def get_all_groups(self):
-        return sorted(set(contact.group for contact in self.contacts) | {"General"})
+        if not self.groups.built and hasattr(self.contacts, "group_names"):
+            # Avoid parsing every contact of a lazily loaded book
+            return sorted(self.contacts.group_names() | {"General"})
+        return sorted(self.groups.groups() | {"General"})
+
+    def manage_groups(self):
+        while True:
+            print("\n=== Manage Groups ===")
+            print("1. List Group Sizes")
+            print("2. Rename Group")
+            print("3. Merge Groups")
+            print("4. Move Contacts to Another Group")
+            print("5. Back")
+
+            choice = input("\nEnter your choice (1-5): ").strip()
+            if choice == '1':
+                self.list_group_sizes()
+            elif choice == '2':
+                self.rename_group()
+            elif choice == '3':
+                self.merge_groups()
+            elif choice == '4':
+                self.move_contacts()
+            elif choice == '5':
+                break
+            else:
+                print("\nInvalid choice! Please try again.")
+
+    def list_group_sizes(self):
+        sizes = self.groups.sizes()
+        if not sizes:
+            print("\nNo contacts found!")
+            return
+        print("\n=== Group Sizes ===")
+        for group in sorted(sizes):
+            print(f"{group}: {sizes[group]}")
+
+    def _regroup(self, regroup):
+        """Run regroup() (a GroupIndex move or rename) and save the contacts it changed."""
+        with self.storage.lock:
+            changed = regroup()
+            for contact in changed:
+                contact.touch()
+            if changed:
+                self.storage.update_many(self.contacts, changed)
+                self.sort_indexes.clear()
+        return changed
+
+    def rename_group(self):
+        print("\nAvailable groups:", self.get_all_groups())
+        old_group = input("Enter group to rename: ").strip()
+        if old_group not in self.groups.groups():
+            print("No contacts found in this group!")
+            return
+        new_group = input("Enter new group name: ").strip()
+        if not new_group:
+            print("Group name cannot be empty!")
+            return
+        if new_group in self.groups.groups():
+            print(f"Group '{new_group}' already exists; use Merge Groups instead.")
+            return
+        changed = self._regroup(lambda: self.groups.rename(old_group, sys.intern(new_group)))
+        print(f"Renamed '{old_group}' to '{new_group}' ({len(changed)} contacts).")
+
+    def merge_groups(self):
+        print("\nAvailable groups:", self.get_all_groups())
+        source = input("Enter group to merge from: ").strip()
+        target = input("Enter group to merge into: ").strip()
+        if source not in self.groups.groups():
+            print("No contacts found in this group!")
+            return
+        if not target or target == source:
+            print("Please enter a different group to merge into!")
+            return
+        changed = self._regroup(lambda: self.groups.rename(source, sys.intern(target)))
+        print(f"Merged {len(changed)} contacts from '{source}' into '{target}'.")
 
+    def move_contacts(self):
+        print("\nAvailable groups:", self.get_all_groups())
+        source = input("Enter group to move contacts from: ").strip()
+        members = self.groups.get_members(source)
+        if not members:
+            print("No contacts found in this group!")
+            return
+        self.display_contacts(members)
+        selection = input("\nEnter contact numbers separated by commas (or 'all'): ").strip()
+        if selection.lower() == "all":
+            selected = members
+        else:
+            try:
+                numbers = {int(part) for part in selection.split(",") if part.strip()}
+            except ValueError:
+                print("Invalid input!")
+                return
+            if not numbers or not all(1 <= number <= len(members) for number in numbers):
+                print("Invalid contact number!")
+                return
+            selected = [members[number - 1] for number in sorted(numbers)]
+        target = input("Enter group to move them to: ").strip()
+        if not target:
+            print("Group name cannot be empty!")
+            return
+        changed = self._regroup(lambda: self.groups.move(selected, sys.intern(target)))
+        print(f"Moved {len(changed)} contacts to '{target}'.")
+
+    @metrics.timed("save")
     def save_contacts(self):
-        with open(self.filename, 'w') as f:
-            json_data = [contact.to_dict() for contact in self.contacts]
-            json.dump(json_data, f, indent=2)
+        self.storage.save(self.contacts)
+
+    def _merged(self, removed, added):
+        """Re-index after the storage merged in contacts another program saved."""
+        for contact in removed:
+            self.index.remove(contact)
+            self.groups.remove(contact)
+        for contact in added:
+            self.index.add(contact)
+            self.groups.add(contact)
+        self.sort_indexes.clear()
+        self.merges += 1
 
+    def _renumbered(self, merges):
+        if self.merges == merges:
+            return False
+        print("The contact list was just updated with changes from another program; "
+              "please choose again.")
+        return True
+
+    @metrics.timed("load")
     def load_contacts(self):
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    self.contacts = []
-                    for contact_data in data:
-                        contact = Contact(
-                            contact_data["name"],
-                            contact_data["phone"],
-                            contact_data["email"],
-                            contact_data["address"],
-                            contact_data["group"]
-                        )
-                        contact.created_date = contact_data["created_date"]
-                        contact.last_modified = contact_data["last_modified"]
-                        self.contacts.append(contact)
-            except json.JSONDecodeError:
-                print("Error loading contacts file!")
+        with self.storage.lock:
+            self.contacts = self.storage.load()
+            self.index.reset(self.contacts)
+            self.groups.reset(self.contacts)
+            self.sort_indexes.clear()
+
+def migrate(source, destination, overwrite=False):
+    """Copy every contact from one storage file to another.
+
+    Returns False without changing anything if source doesn't exist or
+    destination already has contacts and overwrite isn't set.
+    """
+    if not os.path.exists(source):
+        print(f"Cannot migrate: {source} does not exist.")
+        return False
+    destination_storage = open_storage(destination, Contact)
+    if not overwrite and len(destination_storage.load()):
+        destination_storage.close()
+        print(f"Cannot migrate: {destination} already has contacts "
+              f"(add --force to replace them).")
+        return False
+    source_storage = open_storage(source, Contact)
+    contacts = source_storage.load()
+    destination_storage.save(contacts)
+    source_storage.close()
+    destination_storage.close()
+    print(f"Migrated {len(contacts)} contacts from {source} to {destination}.")
+    return True
 
 def main():
-    contact_book = ContactBook()
+    metrics.setup("contactbook")  # PROFILE=1 or --profile to record timings
+    if len(sys.argv) in (4, 5) and sys.argv[1] == "migrate":
+        overwrite = sys.argv[4:] == ["--force"]
+        if len(sys.argv) == 5 and not overwrite:
+            sys.exit("Usage: contactbook.py migrate SOURCE DESTINATION [--force]")
+        if not migrate(sys.argv[2], sys.argv[3], overwrite):
+            sys.exit(1)
+        return
+
+    # Pass a .db file to use the SQLite backend instead of JSON
+    filename = sys.argv[1] if len(sys.argv) > 1 else "contacts.json"
+    contact_book = ContactBook(filename)
     
     while True:
         print("\n=== Contact Book Menu ===")
@@ -226,14 +686,19 @@ def main():
         print("4. Update Contact")
         print("5. Delete Contact")
         print("6. View Contacts by Group")
-        print("7. Exit")
+        print("7. Import Contacts")
+        print("8. Export Contacts")
+        print("9. Validate Contacts")
+        print("10. Merge Duplicate Contacts")
+        print("11. Manage Groups")
+        print("12. Exit")
         
-        choice = input("\nEnter your choice (1-7): ")
+        choice = input("\nEnter your choice (1-12): ")
         
         if choice == '1':
             contact_book.add_contact()
         elif choice == '2':
-            contact_book.view_contacts()
+            contact_book.browse_contacts()
         elif choice == '3':
             contact_book.search_contact()
         elif choice == '4':
@@ -243,6 +708,20 @@ def main():
         elif choice == '6':
             contact_book.view_by_group()
         elif choice == '7':
+            contact_book.import_contacts()
+        elif choice == '8':
+            contact_book.export_contacts()
+        elif choice == '9':
+            contact_book.validate_contacts()
+        elif choice == '10':
+            contact_book.merge_duplicates()
+        elif choice == '11':
+            contact_book.manage_groups()
+        elif choice == '12':
+            contact_book.storage.close()
+            report = contact_book.storage.report()
+            if report:
+                print(report)
             print("\nThank you for using Contact Book!")
             break
         else:
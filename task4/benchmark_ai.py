@@ -0,0 +1,35 @@
+"""Measure the adaptive opponent's win rate against bots and its decision latency."""
+import random
+import time
+
+from rps_ai import AdaptiveOpponent, AdaptiveStrategy
+from rps_engine import (BeatLastStrategy, ConstantStrategy, CycleStrategy,
+                        FrequencyStrategy, RandomStrategy, play_match)
+
+MATCH_ROUNDS = 50_000
+LATENCY_ROUNDS = 2_000_000
+
+def main():
+    bots = [RandomStrategy(), RandomStrategy((5, 3, 2)), ConstantStrategy(),
+            CycleStrategy(), CycleStrategy((0, 0, 1, 2, 1)),
+            BeatLastStrategy(), FrequencyStrategy()]
+    print(f"{'opponent':>20} {'win %':>6} {'loss %':>7} {'tie %':>6}")
+    for bot in bots:
+        result = play_match(AdaptiveStrategy(), bot, MATCH_ROUNDS, seed=1)
+        print(f"{bot.name:>20} {result['first'] / MATCH_ROUNDS:>6.1%} "
+              f"{result['second'] / MATCH_ROUNDS:>7.1%} {result['ties'] / MATCH_ROUNDS:>6.1%}")
+
+    # Decision latency after a long history of mostly random play
+    rng = random.Random(1)
+    opponent = AdaptiveOpponent(rng=rng)
+    start = time.perf_counter()
+    for _ in range(LATENCY_ROUNDS):
+        own = opponent.choose()
+        opponent.observe(rng.randrange(3), own)
+    per_round = (time.perf_counter() - start) / LATENCY_ROUNDS
+    contexts = sum(len(p.counts) for p in opponent.predictors)
+    print(f"\n{LATENCY_ROUNDS:,} rounds: {per_round * 1e6:.1f} us per choose+observe, "
+          f"{contexts} contexts stored")
+
+if __name__ == "__main__":
+    main()
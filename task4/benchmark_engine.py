@@ -0,0 +1,39 @@
+"""Measure headless rounds/second for the scalar and vectorized match paths."""
+import os
+import time
+
+from rps_engine import (BeatLastStrategy, ConstantStrategy, FrequencyStrategy,
+                        RandomStrategy, default_strategies, np, play_match, round_robin)
+
+SCALAR_ROUNDS = 1_000_000
+VECTOR_ROUNDS = 20_000_000
+TOURNAMENT_ROUNDS = 200_000
+
+def rate(rounds, func):
+    start = time.perf_counter()
+    result = func()
+    return rounds / (time.perf_counter() - start), result
+
+def main():
+    scalar, _ = rate(SCALAR_ROUNDS, lambda: play_match(
+        BeatLastStrategy(), FrequencyStrategy(), SCALAR_ROUNDS, seed=1))
+    print(f"scalar:     {scalar:>14,.0f} rounds/s")
+
+    if np is None:
+        print("vectorized: NumPy not installed")
+    else:
+        vector, result = rate(VECTOR_ROUNDS, lambda: play_match(
+            RandomStrategy(), ConstantStrategy(), VECTOR_ROUNDS, seed=1))
+        assert result == play_match(RandomStrategy(), ConstantStrategy(), VECTOR_ROUNDS, seed=1)
+        print(f"vectorized: {vector:>14,.0f} rounds/s")
+
+    strategies = default_strategies()
+    pairings = len(strategies) * (len(strategies) - 1) // 2
+    for workers in sorted({1, os.cpu_count() or 1}):
+        tournament, table = rate(pairings * TOURNAMENT_ROUNDS, lambda: round_robin(
+            strategies, TOURNAMENT_ROUNDS, seed=1, workers=workers))
+        print(f"round robin x{workers}: {tournament:>10,.0f} rounds/s, "
+              f"winner {table[0]['name']}")
+
+if __name__ == "__main__":
+    main()
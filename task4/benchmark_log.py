@@ -0,0 +1,48 @@
+"""Load test: write 10M rounds to the game log, then time rollup queries."""
+import os
+import random
+import tempfile
+import time
+
+from rps_log import CHOICES, GameLog
+
+ROUNDS = 10_000_000
+FSYNC_EVERY = 10_000
+START = 1_700_000_000
+SPAN = 365 * 24 * 3600
+
+def main():
+    rng = random.Random(1)
+    results = {(0, 2): 'user', (1, 0): 'user', (2, 1): 'user',
+               (2, 0): 'computer', (0, 1): 'computer', (1, 2): 'computer'}
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "rps_games.log")
+        log = GameLog(filename, fsync_every=FSYNC_EVERY)
+        start = time.perf_counter()
+        for i in range(ROUNDS):
+            user, computer = rng.randrange(3), rng.randrange(3)
+            log.append(CHOICES[user], CHOICES[computer], results.get((user, computer), 'tie'),
+                       START + i * SPAN // ROUNDS)
+        log.close()
+        elapsed = time.perf_counter() - start
+        print(f"append: {ROUNDS:,} rounds in {elapsed:.1f}s ({ROUNDS / elapsed:,.0f}/s), "
+              f"{os.path.getsize(filename) / 2 ** 20:.0f} MiB")
+
+        start = time.perf_counter()
+        log = GameLog(filename)
+        print(f"reopen: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        for name, query in (("win rate by move", log.win_rate_by_move),
+                            ("win rate by day", lambda: log.win_rate_by_period('day')),
+                            ("win rate by week", lambda: log.win_rate_by_period('week'))):
+            start = time.perf_counter()
+            query()
+            print(f"{name}: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        start = time.perf_counter()
+        wins = sum(1 for round_ in log.iter_rounds() if round_[3] == 'user')
+        print(f"full log rescan for comparison: {time.perf_counter() - start:.1f}s ({wins:,} wins)")
+        log.close()
+
+if __name__ == "__main__":
+    main()
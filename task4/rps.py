@@ -1,30 +1,59 @@
 import random
+import sys
 import time
-import json
 import os
 from datetime import datetime
 
+from rps_log import GameLog
+from rps_stats import GameStatistics
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared import metrics
+from shared.persistence import JSONFile
+
+# Each move and the move it beats
+WINNING_COMBINATIONS = {
+    'rock': 'scissors',
+    'paper': 'rock',
+    'scissors': 'paper'
+}
+
 class RockPaperScissors:
-    def __init__(self):
+    def __init__(self, opponent=None):
         self.choices = ['rock', 'paper', 'scissors']
+        # Optional AI with choose_name()/observe_names(); random when None
+        self.opponent = opponent
         self.scores = {'user': 0, 'computer': 0, 'ties': 0}
-        self.history = []
+        self.stats = GameStatistics()
+        # Most recent rounds only; see rps_stats.HISTORY_LIMIT
+        self.history = self.stats.history
         self.scoreboard_file = 'rps_scoreboard.json'
+        # Rounds are saved at most every few seconds and on exit
+        self.scoreboard_store = JSONFile(self.scoreboard_file, interval=5.0)
         self.load_scoreboard()
+        self.game_log = GameLog('rps_games.log')
 
+    @metrics.timed("load")
     def load_scoreboard(self):
-        if os.path.exists(self.scoreboard_file):
-            try:
-                with open(self.scoreboard_file, 'r') as f:
-                    self.high_scores = json.load(f)
-            except:
-                self.high_scores = {'best_streak': 0, 'total_games': 0, 'total_wins': 0}
-        else:
+        self.high_scores = self.scoreboard_store.load()
+        if not isinstance(self.high_scores, dict):
             self.high_scores = {'best_streak': 0, 'total_games': 0, 'total_wins': 0}
+        # What this process last read or wrote, to merge with other players
+        self.saved_scores = dict(self.high_scores)
+
+    def merge_scoreboard(self, saved):
+        """Add this session's new games to whatever is on disk now."""
+        if not isinstance(saved, dict):
+            saved = {'best_streak': 0, 'total_games': 0, 'total_wins': 0}
+        merged = {'best_streak': max(saved['best_streak'], self.high_scores['best_streak'])}
+        for key in ('total_games', 'total_wins'):
+            merged[key] = saved[key] + self.high_scores[key] - self.saved_scores[key]
+        self.high_scores = merged
+        self.saved_scores = dict(merged)
+        return merged
 
     def save_scoreboard(self):
-        with open(self.scoreboard_file, 'w') as f:
-            json.dump(self.high_scores, f)
+        self.scoreboard_store.schedule_update(self.merge_scoreboard)
 
     def get_user_choice(self):
         while True:
@@ -38,20 +67,18 @@ class RockPaperScissors:
                 return self.choices[int(choice) - 1]
             print("Invalid choice! Please enter 1, 2, or 3.")
 
+    @metrics.timed("computer move")
     def get_computer_choice(self):
+        if self.opponent:
+            return self.opponent.choose_name()
         return random.choice(self.choices)
 
-    def determine_winner(self, user_choice, computer_choice):
+    @staticmethod
+    def determine_winner(user_choice, computer_choice):
         if user_choice == computer_choice:
             return 'tie'
         
-        winning_combinations = {
-            'rock': 'scissors',
-            'paper': 'rock',
-            'scissors': 'paper'
-        }
-        
-        if winning_combinations[user_choice] == computer_choice:
+        if WINNING_COMBINATIONS[user_choice] == computer_choice:
             return 'user'
         return 'computer'
 
@@ -77,12 +104,10 @@ class RockPaperScissors:
         else:
             print("\n😔 Computer wins!")
 
-    def update_scores(self, result):
+    def update_scores(self, result, user_choice=None, computer_choice=None):
         self.scores[result if result != 'tie' else 'ties'] += 1
-        self.history.append({
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'result': result
-        })
+        self.stats.record(result, user_choice, computer_choice,
+                          datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
     def display_scores(self):
         print("\n=== Current Scores ===")
@@ -90,27 +115,22 @@ class RockPaperScissors:
         print(f"Computer: {self.scores['computer']} 🤖")
         print(f"Ties: {self.scores['ties']} 🎯")
 
+    @metrics.timed("render")
     def display_statistics(self):
-        total_games = sum(self.scores.values())
+        total_games = self.stats.total_games
         if total_games == 0:
             return
-        
-        win_rate = (self.scores['user'] / total_games) * 100
-        current_streak = 0
-        best_streak = 0
-        
-        for game in reversed(self.history):
-            if game['result'] == 'user':
-                current_streak += 1
-                best_streak = max(best_streak, current_streak)
-            else:
-                break
 
         print("\n=== Game Statistics ===")
         print(f"Total Games: {total_games}")
-        print(f"Win Rate: {win_rate:.1f}%")
-        print(f"Current Streak: {current_streak}")
-        print(f"Best Streak: {max(best_streak, self.high_scores['best_streak'])}")
+        print(f"Win Rate: {self.stats.win_rate():.1f}%")
+        print(f"Last {len(self.stats.window)} Games Win Rate: {self.stats.rolling_win_rate():.1f}%")
+        print(f"Current Streak: {self.stats.current_streak}")
+        print(f"Best Streak: {max(self.stats.best_streak, self.high_scores['best_streak'])}")
+        favorite = self.stats.favorite_move()
+        if favorite:
+            print(f"Favorite Move: {favorite} "
+                  f"(won {self.stats.move_win_rate(favorite):.1f}% of the time)")
 
     def play_game(self):
         while True:
@@ -120,23 +140,27 @@ class RockPaperScissors:
             
             self.display_choices(user_choice, computer_choice)
             result = self.determine_winner(user_choice, computer_choice)
+            if self.opponent:
+                self.opponent.observe_names(user_choice, computer_choice)
+            with metrics.measure("log"):
+                self.game_log.append(user_choice, computer_choice, result)
+            metrics.count("rounds")
             
             self.display_result(result)
-            self.update_scores(result)
+            self.update_scores(result, user_choice, computer_choice)
             self.display_scores()
             
-            # Update high scores
-            self.high_scores['total_games'] += 1
-            if result == 'user':
-                self.high_scores['total_wins'] += 1
-                current_streak = sum(1 for game in reversed(self.history) 
-                                  if game['result'] == 'user')
-                self.high_scores['best_streak'] = max(
-                    self.high_scores['best_streak'], 
-                    current_streak
-                )
-            
-            self.save_scoreboard()
+            # Update high scores; the lock keeps a background save from
+            # merging (and replacing high_scores) halfway through
+            with self.scoreboard_store.lock:
+                self.high_scores['total_games'] += 1
+                if result == 'user':
+                    self.high_scores['total_wins'] += 1
+                    self.high_scores['best_streak'] = max(
+                        self.high_scores['best_streak'], 
+                        self.stats.current_streak
+                    )
+                self.save_scoreboard()
             self.display_statistics()
             
             if not self.play_again():
@@ -149,6 +173,23 @@ class RockPaperScissors:
                 return choice == 'y'
             print("Please enter 'y' for yes or 'n' for no.")
 
+    def show_history(self):
+        with metrics.measure("history"):
+            by_day = self.game_log.win_rate_by_period('day')
+            by_move = self.game_log.win_rate_by_move()
+        if not by_day:
+            print("\nNo games played yet!")
+            return
+
+        print("\n=== Game History ===")
+        print("Win rate by move (all time):")
+        for move, (games, win_rate) in by_move.items():
+            print(f"  {move.capitalize()}: {win_rate:.1f}% of {games} games")
+        print("Win rate by day (last 7 days played):")
+        for day, (games, win_rate) in list(by_day.items())[-7:]:
+            print(f"  {day}: {win_rate:.1f}% of {games} games")
+        input("\nPress Enter to continue...")
+
     def show_rules(self):
         print("\n=== Game Rules ===")
         print("🪨 Rock beats ✂️ Scissors")
@@ -157,26 +198,40 @@ class RockPaperScissors:
         input("\nPress Enter to continue...")
 
 def main():
+    metrics.setup("rps")  # PROFILE=1 or --profile to record timings
     game = RockPaperScissors()
     
     print("Welcome to Rock Paper Scissors!")
     print("\n1. Start Game")
-    print("2. Show Rules")
-    print("3. Exit")
+    print("2. Start Game vs Adaptive AI")
+    print("3. Show Rules")
+    print("4. Show Game History")
+    print("5. Exit")
     
     while True:
-        choice = input("\nEnter your choice (1-3): ").strip()
+        choice = input("\nEnter your choice (1-5): ").strip()
         
         if choice == '1':
             game.play_game()
             break
         elif choice == '2':
-            game.show_rules()
+            # Imported here because rps_ai builds on this module's rules
+            from rps_ai import AdaptiveOpponent
+            game.opponent = AdaptiveOpponent()
+            game.play_game()
+            break
         elif choice == '3':
+            game.show_rules()
+        elif choice == '4':
+            game.show_history()
+        elif choice == '5':
             print("\nThanks for playing!")
             break
         else:
-            print("Invalid choice! Please enter 1, 2, or 3.")
+            print("Invalid choice! Please enter a number from 1 to 5.")
+    game.game_log.close()
+    game.scoreboard_store.close()
+    print(game.scoreboard_store.report())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
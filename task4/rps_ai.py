@@ -0,0 +1,98 @@
+"""Adaptive computer opponent that predicts the user's next move."""
+import random
+
+from rps_engine import COUNTER, MOVES, Strategy
+
+class MarkovPredictor:
+    """Order-k model of the opponent's next move given the last k rounds.
+
+    Counts decay by `decay` per update of the same context, so the model
+    follows a player who changes style, and once more than max_contexts
+    contexts are stored the rarest half is evicted to bound memory.
+    Each update and prediction is O(1) (eviction is amortized).
+    """
+
+    def __init__(self, order, decay=0.95, max_contexts=10_000):
+        self.order = order
+        self.decay = decay
+        self.max_contexts = max_contexts
+        self.counts = {}
+
+    def predict(self, context):
+        counts = self.counts.get(context[-self.order:] if self.order else ())
+        if not counts:
+            return None
+        best = max(counts)
+        return counts.index(best) if best > 0 else None
+
+    def update(self, context, move):
+        key = context[-self.order:] if self.order else ()
+        counts = self.counts.get(key)
+        if counts is None:
+            if len(self.counts) >= self.max_contexts:
+                self._evict()
+            counts = self.counts[key] = [0.0, 0.0, 0.0]
+        for i in range(3):
+            counts[i] *= self.decay
+        counts[move] += 1.0
+
+    def _evict(self):
+        ranked = sorted(self.counts, key=lambda key: sum(self.counts[key]))
+        for key in ranked[:len(ranked) // 2]:
+            del self.counts[key]
+
+class AdaptiveOpponent:
+    """Ensemble of Markov predictors; plays against whichever has been most accurate.
+
+    The context is the recent (opponent move, own move) pairs. Every
+    predictor is scored on each round with an exponential moving accuracy,
+    and the best scorer's prediction is countered.
+    """
+
+    def __init__(self, orders=(0, 1, 2, 3, 4), score_decay=0.9, rng=None):
+        self.predictors = [MarkovPredictor(order) for order in orders]
+        self.scores = [0.0] * len(self.predictors)
+        self.score_decay = score_decay
+        self.history_length = max(orders)
+        self.context = ()
+        self.predictions = [None] * len(self.predictors)
+        self.rng = rng or random.Random()
+
+    def choose(self):
+        """Return the move (0-2) to play this round."""
+        self.predictions = [p.predict(self.context) for p in self.predictors]
+        best = None
+        for i, prediction in enumerate(self.predictions):
+            if prediction is not None and (best is None or self.scores[i] > self.scores[best]):
+                best = i
+        if best is None:
+            return self.rng.randrange(3)
+        return COUNTER[self.predictions[best]]
+
+    def observe(self, opponent_move, own_move):
+        for i, prediction in enumerate(self.predictions):
+            hit = 1.0 if prediction == opponent_move else 0.0
+            self.scores[i] = self.scores[i] * self.score_decay + hit
+        for predictor in self.predictors:
+            predictor.update(self.context, opponent_move)
+        # Context items are (opponent, own) pairs folded into one number
+        self.context = (self.context + (opponent_move * 3 + own_move,))[-self.history_length:]
+
+    def choose_name(self):
+        return MOVES[self.choose()]
+
+    def observe_names(self, opponent_choice, own_choice):
+        self.observe(MOVES.index(opponent_choice), MOVES.index(own_choice))
+
+class AdaptiveStrategy(Strategy):
+    """AdaptiveOpponent wrapped for rps_engine.play_match."""
+
+    def reset(self, rng):
+        super().reset(rng)
+        self.opponent = AdaptiveOpponent(rng=rng)
+
+    def next_move(self):
+        return self.opponent.choose()
+
+    def observe(self, own_move, opponent_move):
+        self.opponent.observe(opponent_move, own_move)
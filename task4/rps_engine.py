@@ -0,0 +1,179 @@
+"""Headless Rock Paper Scissors: strategies, matches and tournaments without prompts."""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from rps import WINNING_COMBINATIONS
+
+try:
+    import numpy as np
+except ImportError:  # The vectorized path is optional
+    np = None
+
+MOVES = ['rock', 'paper', 'scissors']
+ROCK, PAPER, SCISSORS = range(3)
+# Result codes, indexed [first player's move][second player's move], derived
+# from the interactive game's rules so the two can never disagree
+TIE, FIRST, SECOND = range(3)
+OUTCOMES = [[TIE if a == b else FIRST if WINNING_COMBINATIONS[MOVES[a]] == MOVES[b] else SECOND
+             for b in range(3)] for a in range(3)]
+# The move that beats each move
+COUNTER = [next(m for m in range(3) if WINNING_COMBINATIONS[MOVES[m]] == MOVES[a])
+           for a in range(3)]
+
+class Strategy:
+    """Base class: choose a move (0-2) each round and see both moves afterwards.
+
+    Strategies whose moves do not depend on the game set vectorized = True
+    and implement moves(), which lets play_match skip the per-round loop.
+    """
+
+    vectorized = False
+
+    def __init__(self):
+        self.name = type(self).__name__
+
+    def reset(self, rng):
+        self.rng = rng
+
+    def next_move(self):
+        raise NotImplementedError
+
+    def observe(self, own_move, opponent_move):
+        pass
+
+    def moves(self, rounds, generator):
+        raise NotImplementedError
+
+class RandomStrategy(Strategy):
+    vectorized = True
+
+    def __init__(self, weights=(1, 1, 1)):
+        super().__init__()
+        self.weights = list(weights)
+
+    def next_move(self):
+        return self.rng.choices((ROCK, PAPER, SCISSORS), self.weights)[0]
+
+    def moves(self, rounds, generator):
+        total = sum(self.weights)
+        return generator.choice(3, size=rounds, p=[w / total for w in self.weights]).astype(np.int8)
+
+class ConstantStrategy(Strategy):
+    vectorized = True
+
+    def __init__(self, move=ROCK):
+        super().__init__()
+        self.move = move
+        self.name = f"Always{MOVES[move].capitalize()}"
+
+    def next_move(self):
+        return self.move
+
+    def moves(self, rounds, generator):
+        return np.full(rounds, self.move, dtype=np.int8)
+
+class CycleStrategy(Strategy):
+    vectorized = True
+
+    def __init__(self, sequence=(ROCK, PAPER, SCISSORS)):
+        super().__init__()
+        self.sequence = list(sequence)
+
+    def reset(self, rng):
+        super().reset(rng)
+        self.position = 0
+
+    def next_move(self):
+        move = self.sequence[self.position % len(self.sequence)]
+        self.position += 1
+        return move
+
+    def moves(self, rounds, generator):
+        return np.resize(np.array(self.sequence, dtype=np.int8), rounds)
+
+class BeatLastStrategy(Strategy):
+    """Plays whatever beats the opponent's previous move."""
+
+    def reset(self, rng):
+        super().reset(rng)
+        self.last = None
+
+    def next_move(self):
+        if self.last is None:
+            return self.rng.randrange(3)
+        return COUNTER[self.last]
+
+    def observe(self, own_move, opponent_move):
+        self.last = opponent_move
+
+class FrequencyStrategy(Strategy):
+    """Plays whatever beats the opponent's most common move so far."""
+
+    def reset(self, rng):
+        super().reset(rng)
+        self.counts = [0, 0, 0]
+
+    def next_move(self):
+        if not any(self.counts):
+            return self.rng.randrange(3)
+        return COUNTER[self.counts.index(max(self.counts))]
+
+    def observe(self, own_move, opponent_move):
+        self.counts[opponent_move] += 1
+
+def default_strategies():
+    return [RandomStrategy(), ConstantStrategy(ROCK), CycleStrategy(),
+            BeatLastStrategy(), FrequencyStrategy()]
+
+def play_match(first, second, rounds, seed=0):
+    """Play rounds between two strategies; returns {'first', 'second', 'ties'} counts.
+
+    The same seed always gives the same result. Two vectorized strategies
+    are resolved with a NumPy lookup table when NumPy is installed.
+    """
+    if np is not None and first.vectorized and second.vectorized:
+        generator = np.random.default_rng(seed)
+        first_moves = first.moves(rounds, generator)
+        second_moves = second.moves(rounds, generator)
+        outcomes = np.array(OUTCOMES, dtype=np.int8)[first_moves, second_moves]
+        ties, first_wins, second_wins = np.bincount(outcomes, minlength=3).tolist()
+        return {'first': first_wins, 'second': second_wins, 'ties': ties}
+
+    first.reset(random.Random(f"{seed}:first"))
+    second.reset(random.Random(f"{seed}:second"))
+    counts = [0, 0, 0]
+    for _ in range(rounds):
+        a = first.next_move()
+        b = second.next_move()
+        counts[OUTCOMES[a][b]] += 1
+        first.observe(a, b)
+        second.observe(b, a)
+    return {'first': counts[FIRST], 'second': counts[SECOND], 'ties': counts[TIE]}
+
+def _play_pairing(args):
+    i, j, first, second, rounds, seed = args
+    return i, j, play_match(first, second, rounds, seed)
+
+def round_robin(strategies, rounds, seed=0, workers=1):
+    """Play every pair of strategies; returns a standings list sorted by wins.
+
+    Each pairing gets its own seed derived from seed, so results do not
+    depend on the number of workers.
+    """
+    pairings = [(i, j, strategies[i], strategies[j], rounds, seed * 1_000_003 + n)
+                for n, (i, j) in enumerate(combinations(range(len(strategies)), 2))]
+    table = [{'name': s.name, 'wins': 0, 'losses': 0, 'ties': 0} for s in strategies]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_play_pairing, pairings))
+    else:
+        results = [_play_pairing(pairing) for pairing in pairings]
+    for i, j, result in results:
+        table[i]['wins'] += result['first']
+        table[i]['losses'] += result['second']
+        table[j]['wins'] += result['second']
+        table[j]['losses'] += result['first']
+        table[i]['ties'] += result['ties']
+        table[j]['ties'] += result['ties']
+    return sorted(table, key=lambda row: row['wins'], reverse=True)
@@ -0,0 +1,165 @@
+"""Durable per-round game log with precomputed daily and weekly rollups."""
+import json
+import os
+import struct
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared.persistence import atomic_write, file_lock
+
+CHOICES = ['rock', 'paper', 'scissors']
+RESULTS = ['tie', 'user', 'computer']
+# Unix timestamp, user move, computer move, result: 7 bytes per round
+RECORD = struct.Struct("<IBBB")
+# Rounds written between fsyncs
+FSYNC_EVERY = 100
+
+def _empty_rollup():
+    return {'games': 0, 'user': 0, 'computer': 0, 'tie': 0,
+            'moves': {choice: [0, 0] for choice in CHOICES}}
+
+class GameLog:
+    """Append-only binary log of rounds.
+
+    Records are buffered and written, fsynced, every FSYNC_EVERY rounds and
+    on close. Daily and weekly totals are saved beside the log together
+    with the log size they cover, so reopening only replays rounds written
+    after the last save. Writes and rollup saves happen under a file lock,
+    and each one first replays whatever other running games appended, so
+    several games can share one log.
+    """
+
+    def __init__(self, filename="rps_games.log", fsync_every=FSYNC_EVERY):
+        self.filename = filename
+        self.rollup_filename = filename + ".rollups.json"
+        self.fsync_every = fsync_every
+        self.daily = {}
+        self.weekly = {}
+        self.covered = 0
+        self._day_start = self._day_end = 0
+        self._day_key = self._week_key = None
+        with file_lock(filename):
+            self._catch_up()
+        self.file = open(filename, "ab")
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def _catch_up(self):
+        """Reload the saved rollups and replay the rounds after them; needs the lock."""
+        self.daily, self.weekly, self.covered = {}, {}, 0
+        if os.path.exists(self.rollup_filename):
+            try:
+                with open(self.rollup_filename) as f:
+                    saved = json.load(f)
+                self.daily = saved['daily']
+                self.weekly = saved['weekly']
+                self.covered = saved['covered']
+            except (ValueError, KeyError):
+                self.daily, self.weekly, self.covered = {}, {}, 0
+        size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+        if size < self.covered:
+            # Log was replaced or truncated; rebuild everything from it
+            self.daily, self.weekly, self.covered = {}, {}, 0
+        # Drop a torn trailing record left by a crash
+        usable = size - (size - self.covered) % RECORD.size
+        if usable < size:
+            with open(self.filename, "r+b") as f:
+                f.truncate(usable)
+        if usable > self.covered:
+            with open(self.filename, "rb") as f:
+                f.seek(self.covered)
+                data = f.read(usable - self.covered)
+            for record in RECORD.iter_unpack(data):
+                self._roll_up(*record)
+            self.covered = usable
+
+    def _keys(self, timestamp):
+        # Day and ISO week keys change rarely, so cache the current day's range
+        if not self._day_start <= timestamp < self._day_end:
+            day = date.fromtimestamp(timestamp)
+            start = datetime.combine(day, datetime.min.time())
+            self._day_start = int(start.timestamp())
+            self._day_end = int((start + timedelta(days=1)).timestamp())
+            year, week, _ = day.isocalendar()
+            self._day_key = day.isoformat()
+            self._week_key = f"{year}-W{week:02d}"
+        return self._day_key, self._week_key
+
+    def _roll_up(self, timestamp, user_move, computer_move, result_code):
+        day_key, week_key = self._keys(timestamp)
+        result = RESULTS[result_code]
+        user_choice = CHOICES[user_move]
+        for rollups, key in ((self.daily, day_key), (self.weekly, week_key)):
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = _empty_rollup()
+            rollup['games'] += 1
+            rollup[result] += 1
+            move = rollup['moves'][user_choice]
+            move[0] += 1
+            if result == 'user':
+                move[1] += 1
+
+    def append(self, user_choice, computer_choice, result, timestamp=None):
+        record = (int(time.time() if timestamp is None else timestamp),
+                  CHOICES.index(user_choice), CHOICES.index(computer_choice),
+                  RESULTS.index(result))
+        self.buffer += RECORD.pack(*record)
+        # Counted now so queries include it; sync() recounts from the log
+        self._roll_up(*record)
+        self.pending += 1
+        if self.pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        """Write and fsync buffered rounds, then save rollups covering the whole log."""
+        with file_lock(self.filename):
+            # Nobody else appended since the last sync when the log still ends
+            # where our rollups do; then the in-memory totals are already right
+            alone = os.fstat(self.file.fileno()).st_size == self.covered
+            self.file.write(self.buffer)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.covered += len(self.buffer)
+            self.buffer.clear()
+            self.pending = 0
+            if not alone:
+                # Rebuilt from disk so rounds other games appended are counted
+                self._catch_up()
+            saved = {'covered': self.covered, 'daily': self.daily, 'weekly': self.weekly}
+            atomic_write(self.rollup_filename, lambda f: json.dump(saved, f))
+
+    def close(self):
+        if self.pending:
+            self.sync()
+        self.file.close()
+
+    def _rollups(self, period):
+        return self.daily if period == 'day' else self.weekly
+
+    def win_rate_by_period(self, period='day'):
+        """{day or week: (games, win %)} from the rollups."""
+        return {key: (r['games'], r['user'] / r['games'] * 100)
+                for key, r in sorted(self._rollups(period).items())}
+
+    def win_rate_by_move(self, since=None, period='day'):
+        """{move: (games, win %)} over all periods with key >= since."""
+        totals = {choice: [0, 0] for choice in CHOICES}
+        for key, rollup in self._rollups(period).items():
+            if since is None or key >= since:
+                for choice, (games, wins) in rollup['moves'].items():
+                    totals[choice][0] += games
+                    totals[choice][1] += wins
+        return {choice: (games, wins / games * 100 if games else 0.0)
+                for choice, (games, wins) in totals.items()}
+
+    def iter_rounds(self):
+        """Yield (timestamp, user_choice, computer_choice, result) from the log."""
+        if self.pending:
+            self.sync()
+        with open(self.filename, "rb") as f:
+            while chunk := f.read(RECORD.size * 65536):
+                for timestamp, user, computer, result in RECORD.iter_unpack(chunk):
+                    yield timestamp, CHOICES[user], CHOICES[computer], RESULTS[result]
@@ -0,0 +1,243 @@
+"""Networked multiplayer Rock Paper Scissors over asyncio, plus a load generator.
+
+Line protocol (UTF-8, one command per line):
+    client: NAME <name>          server: WAITING, then MATCHED <opponent>
+    client: MOVE <rock|paper|scissors>
+    server: RESULT <your move> <their move> <win|lose|tie> <your wins> <their wins>
+    client: QUIT                 server: OPPONENT_LEFT when the opponent goes,
+                                 after which the player is matched again
+"""
+import argparse
+import asyncio
+import os
+import random
+import signal
+import sys
+import time
+
+from rps import RockPaperScissors
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for shared/
+from shared.persistence import JSONFile
+
+SCOREBOARD_FILE = 'rps_server_scoreboard.json'
+# Seconds between scoreboard saves while the server is running
+SAVE_INTERVAL = 5.0
+OUTCOME_WORDS = {'tie': ('tie', 'tie'), 'user': ('win', 'lose'), 'computer': ('lose', 'win')}
+
+class Player:
+    def __init__(self, name, reader, writer):
+        self.name = name
+        self.reader = reader
+        self.writer = writer
+        self.streak = 0
+        self.left = asyncio.Event()
+
+    async def send(self, line):
+        """Write a line, waiting while a slow client's buffer is full."""
+        self.writer.write(line.encode() + b"\n")
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            pass  # The next read_move() sees the disconnect
+
+    async def read_move(self):
+        """Return the next move, or None once the player quits or disconnects."""
+        while True:
+            try:
+                line = await self.reader.readline()
+            except ConnectionError:
+                line = b""
+            command, _, argument = line.decode(errors="replace").strip().partition(" ")
+            if not line or command == "QUIT":
+                return None
+            if command == "MOVE" and argument in ('rock', 'paper', 'scissors'):
+                return argument
+            await self.send("ERROR expected MOVE rock|paper|scissors or QUIT")
+
+class GameServer:
+    """Pairs players in arrival order and keeps a per-player scoreboard.
+
+    Each player's entry uses the single-player scoreboard fields
+    (best_streak, total_games, total_wins) and is saved every SAVE_INTERVAL
+    seconds and on shutdown rather than after every round.
+    """
+
+    def __init__(self, scoreboard_file=SCOREBOARD_FILE):
+        self.scoreboard_file = scoreboard_file
+        self.scoreboard_store = JSONFile(scoreboard_file)
+        self.scoreboard = self.scoreboard_store.load({})
+        self.waiting = asyncio.Queue()
+        # Running play_match tasks; the event loop only keeps weak references
+        self.matches = set()
+        self.dirty = False
+        self.rounds = 0
+
+    def record(self, player, outcome):
+        entry = self.scoreboard.setdefault(
+            player.name, {'best_streak': 0, 'total_games': 0, 'total_wins': 0})
+        entry['total_games'] += 1
+        if outcome == 'win':
+            entry['total_wins'] += 1
+            player.streak += 1
+            entry['best_streak'] = max(entry['best_streak'], player.streak)
+        else:
+            player.streak = 0
+        self.dirty = True
+
+    def save_scoreboard(self):
+        if not self.dirty:
+            return
+        self.scoreboard_store.save(self.scoreboard)
+        self.dirty = False
+
+    async def handle_client(self, reader, writer):
+        try:
+            line = await reader.readline()
+            command, _, name = line.decode(errors="replace").strip().partition(" ")
+            if command != "NAME" or not name:
+                writer.write(b"ERROR expected NAME <name>\n")
+                writer.close()
+                return
+            player = Player(name, reader, writer)
+            await player.send("WAITING")
+            await self.waiting.put(player)
+            await player.left.wait()
+        except asyncio.CancelledError:
+            # The server is shutting down; drop the connection quietly
+            writer.close()
+            return
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def matchmaker(self):
+        while True:
+            first = await self.waiting.get()
+            second = await self.waiting.get()
+            match = asyncio.create_task(self.play_match(first, second))
+            self.matches.add(match)
+            match.add_done_callback(self.matches.discard)
+
+    async def play_match(self, first, second):
+        await asyncio.gather(first.send(f"MATCHED {second.name}"),
+                             second.send(f"MATCHED {first.name}"))
+        wins = {first: 0, second: 0}
+        while True:
+            first_move, second_move = await asyncio.gather(first.read_move(), second.read_move())
+            if first_move is None or second_move is None:
+                break
+            result = RockPaperScissors.determine_winner(first_move, second_move)
+            first_outcome, second_outcome = OUTCOME_WORDS[result]
+            for player, outcome in ((first, first_outcome), (second, second_outcome)):
+                self.record(player, outcome)
+                if outcome == 'win':
+                    wins[player] += 1
+            self.rounds += 1
+            await asyncio.gather(
+                first.send(f"RESULT {first_move} {second_move} {first_outcome} "
+                           f"{wins[first]} {wins[second]}"),
+                second.send(f"RESULT {second_move} {first_move} {second_outcome} "
+                            f"{wins[second]} {wins[first]}"))
+
+        for player, move in ((first, first_move), (second, second_move)):
+            if move is None:
+                player.left.set()
+            else:
+                # The opponent left; this player's last move is discarded
+                await player.send("OPPONENT_LEFT")
+                await player.send("WAITING")
+                await self.waiting.put(player)
+
+    async def autosave(self):
+        while True:
+            await asyncio.sleep(SAVE_INTERVAL)
+            self.save_scoreboard()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+        tasks = [asyncio.create_task(self.matchmaker()), asyncio.create_task(self.autosave())]
+        # SIGTERM stops the server the same way Ctrl+C does, so the scoreboard is saved
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, server.close)
+        except NotImplementedError:
+            pass
+        print(f"Serving Rock Paper Scissors on {host}:{port}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.save_scoreboard()
+
+async def _load_client(host, port, name, rounds, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"NAME {name}\n".encode())
+    played = 0
+    while played < rounds:
+        line = (await reader.readline()).decode().strip()
+        if not line:
+            break
+        if line.startswith("MATCHED") or line.startswith("RESULT"):
+            if line.startswith("RESULT"):
+                latencies.append(time.perf_counter() - sent)
+                played += 1
+                if played == rounds:
+                    break
+            sent = time.perf_counter()
+            writer.write(f"MOVE {random.choice(('rock', 'paper', 'scissors'))}\n".encode())
+    writer.write(b"QUIT\n")
+    await writer.drain()
+    writer.close()
+    return played
+
+async def run_load(host, port, clients, rounds):
+    """Play rounds with `clients` simulated players; returns (rounds, seconds, latencies)."""
+    latencies = []
+    start = time.perf_counter()
+    played = await asyncio.gather(*(
+        _load_client(host, port, f"bot{i}", rounds, latencies) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    # Each round is seen by both of its players
+    return sum(played) // 2, elapsed, latencies
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    serve = subcommands.add_parser("serve", help="run the game server")
+    load = subcommands.add_parser("load", help="simulate many players against a server")
+    for sub in (serve, load):
+        sub.add_argument("--host", default="127.0.0.1")
+        sub.add_argument("--port", type=int, default=5050)
+    load.add_argument("--clients", type=int, default=1000, help="simulated players (even)")
+    load.add_argument("--rounds", type=int, default=100, help="rounds per player")
+    args = parser.parse_args()
+    if args.command == "load" and (args.clients < 2 or args.clients % 2):
+        # Players are paired, so an odd one out would wait for a match forever
+        parser.error("--clients must be an even number of at least 2")
+
+    if args.command == "serve":
+        try:
+            asyncio.run(GameServer().serve(args.host, args.port))
+        except KeyboardInterrupt:
+            print("\nServer stopped.")
+        return
+
+    rounds, elapsed, latencies = asyncio.run(
+        run_load(args.host, args.port, args.clients, args.rounds))
+    latencies.sort()
+    print(f"{rounds:,} rounds in {elapsed:.1f}s: {rounds / elapsed:,.0f} rounds/s")
+    if latencies:
+        print("latency ms: " + ", ".join(
+            f"p{int(q * 100)} {percentile(latencies, q) * 1000:.1f}" for q in (0.5, 0.95, 0.99)))
+
+if __name__ == "__main__":
+    main()
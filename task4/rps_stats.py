@@ -0,0 +1,72 @@
+from collections import deque
+
+# Rounds of detailed history kept in memory
+HISTORY_LIMIT = 1000
+# Rounds covered by the rolling win rate
+ROLLING_WINDOW = 20
+
+class GameStatistics:
+    """Session statistics updated in constant time per round.
+
+    Only the last HISTORY_LIMIT rounds are kept, in a ring buffer, so a long
+    session neither grows memory nor slows down.
+    """
+
+    def __init__(self, history_limit=HISTORY_LIMIT, window=ROLLING_WINDOW):
+        self.history = deque(maxlen=history_limit)
+        self.window = deque(maxlen=window)
+        self.window_wins = 0
+        self.results = {'user': 0, 'computer': 0, 'tie': 0}
+        self.current_streak = 0
+        self.best_streak = 0
+        self.user_moves = {}
+        self.computer_moves = {}
+        self.wins_by_move = {}
+
+    def record(self, result, user_choice=None, computer_choice=None, timestamp=None):
+        self.results[result] += 1
+        if result == 'user':
+            self.current_streak += 1
+            self.best_streak = max(self.best_streak, self.current_streak)
+        else:
+            self.current_streak = 0
+
+        if len(self.window) == self.window.maxlen and self.window[0] == 'user':
+            self.window_wins -= 1
+        self.window.append(result)
+        if result == 'user':
+            self.window_wins += 1
+
+        if user_choice:
+            self.user_moves[user_choice] = self.user_moves.get(user_choice, 0) + 1
+            if result == 'user':
+                self.wins_by_move[user_choice] = self.wins_by_move.get(user_choice, 0) + 1
+        if computer_choice:
+            self.computer_moves[computer_choice] = self.computer_moves.get(computer_choice, 0) + 1
+
+        self.history.append({
+            'timestamp': timestamp,
+            'user_choice': user_choice,
+            'computer_choice': computer_choice,
+            'result': result
+        })
+
+    @property
+    def total_games(self):
+        return sum(self.results.values())
+
+    def win_rate(self):
+        total = self.total_games
+        return self.results['user'] / total * 100 if total else 0.0
+
+    def rolling_win_rate(self):
+        return self.window_wins / len(self.window) * 100 if self.window else 0.0
+
+    def favorite_move(self):
+        if not self.user_moves:
+            return None
+        return max(self.user_moves, key=self.user_moves.get)
+
+    def move_win_rate(self, move):
+        played = self.user_moves.get(move, 0)
+        return self.wins_by_move.get(move, 0) / played * 100 if played else 0.0